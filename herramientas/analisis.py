@@ -0,0 +1,243 @@
+# ================================================================
+# Herramientas – Análisis de partidas (muchos registros a la vez)
+# ---------------------------------------------------------------
+# Descripción:
+#   Métricas por partida a partir de los telemetria.vxt de la SD, con
+#   los archivos repartidos en un multiprocessing.Pool:
+#     • duracion_s, muestras, plataforma
+#     • vuelta_media_us / vuelta_max_us y atrasos (vueltas pasadas de
+#       su plazo durante la partida)
+#     • cepillo_s: tiempo con el cepillo encendido (bit 1 de estado)
+#     • rampa_auto_s / rampa_manual_s: rampa en AUTO (bit 0) o no (V5)
+#     • <motor>_uso: fracción del tiempo girando a más de UMBRAL_RPM
+#     • <motor>_pico_ma: pico de corriente
+#     • error: si el archivo no se pudo leer (vacío, corrupto); el resto
+#       de las columnas de esa partida quedan vacías y el lote sigue
+#   Con numpy, cada archivo se abre con numpy.memmap y los bloques se
+#   ven como un arreglo estructurado sobre el archivo (sin copiarlo ni
+#   decodificar muestra por muestra); solo se leen las columnas que
+#   usa cada métrica. Si el archivo no es una sucesión limpia de
+#   bloques (captura serial con basura) o no hay numpy, se decodifica
+#   con herramientas/telemetria.py.
+#
+# Uso:
+#   python herramientas/analisis.py partidas/ --csv temporada.csv
+#   python herramientas/analisis.py a.vxt b.vxt --procesos 4
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import argparse
+import multiprocessing
+import os
+import struct
+import sys
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import barrido     # noqa: E402
+import telemetria  # noqa: E402
+
+UMBRAL_RPM = 5          # Un motor "está en uso" si gira a más de esto
+BIT_RAMPA_AUTO = 1      # Banderas de estado (ver estado_telemetria() de cada robot)
+BIT_CEPILLO = 2
+PLATAFORMA_V5 = 0
+
+def _dtype_bloque(n_motores: int, por_bloque: int):
+    """dtype de numpy de un bloque VXT1 entero (cabecera + muestras), sin relleno."""
+    motor = numpy.dtype([("rpm", "<i2"), ("ma", "<u2"), ("c", "u1")])
+    muestra = numpy.dtype([("t_ms", "<u4"), ("vuelta_us", "<u2"), ("bateria_mv", "<u2"),
+                           ("atrasos", "<u2"), ("estado", "u1"), ("motores", motor, (n_motores,))])
+    return numpy.dtype([("marca", "S4"), ("n_motores", "u1"), ("plataforma", "u1"),
+                        ("muestras", "<u2"), ("tam", "<u2"), ("datos", muestra, (por_bloque,))])
+
+def mapear(ruta: str):
+    """
+    (plataforma, motores, muestras) con 'muestras' un arreglo
+    estructurado (bloques × muestras por bloque) sobre el archivo
+    mapeado, o None si el archivo no es una sucesión limpia de bloques.
+    """
+    if numpy is None or os.path.getsize(ruta) == 0:
+        return None
+    datos = numpy.memmap(ruta, dtype=numpy.uint8, mode="r")
+    inicio = bytes(datos[:4096])
+    motores = None
+    pos = 0
+    if inicio.startswith(b"VXTN"):
+        _, largo = struct.unpack_from(telemetria.FORMATO_NOMBRES, inicio)
+        pos = struct.calcsize(telemetria.FORMATO_NOMBRES) + largo
+        motores = inicio[pos - largo:pos].decode().split(",")
+    tam_cabecera = struct.calcsize(telemetria.FORMATO_BLOQUE)
+    if inicio[pos:pos + 4] != b"VXT1" or pos + tam_cabecera > len(inicio):
+        return None
+    _, n_motores, plataforma, por_bloque, tam = struct.unpack_from(telemetria.FORMATO_BLOQUE, inicio, pos)
+    tipo = _dtype_bloque(n_motores, por_bloque)
+    if tipo["datos"].base.itemsize != tam:
+        return None
+    n_bloques = (len(datos) - pos) // tipo.itemsize
+    bloques = numpy.ndarray((n_bloques,), dtype=tipo, buffer=datos, offset=pos)
+    if (n_bloques == 0 or not (bloques["marca"] == b"VXT1").all()
+            or not (bloques["muestras"] == por_bloque).all() or not (bloques["tam"] == tam).all()):
+        return None
+    if motores is None or len(motores) != n_motores:
+        motores = ["m%d" % i for i in range(n_motores)]
+    return plataforma, motores, bloques["datos"]
+
+def _metricas_numpy(plataforma: int, motores: list, muestras) -> dict:
+    """Métricas de una partida; 'muestras' es estructurado con el formato de _dtype_bloque()."""
+    t = muestras["t_ms"].ravel().astype(numpy.int64)
+    dt = numpy.diff(t)                    # Tiempo que representa cada muestra (menos la última)
+    duracion = float(dt.sum()) / 1000
+    estado = muestras["estado"].ravel()[:-1]
+    vuelta = muestras["vuelta_us"]
+    resultado = {
+        "plataforma": "V5" if plataforma == PLATAFORMA_V5 else "IQ",
+        "muestras": int(t.size),
+        "duracion_s": duracion,
+        "vuelta_media_us": float(vuelta.mean()),
+        "vuelta_max_us": int(vuelta.max()),
+        "atrasos": int((numpy.diff(muestras["atrasos"].ravel().astype(numpy.int64)) & 0xFFFF).sum()),
+        "cepillo_s": float(dt[(estado & BIT_CEPILLO) != 0].sum()) / 1000,
+    }
+    if plataforma == PLATAFORMA_V5:
+        auto = float(dt[(estado & BIT_RAMPA_AUTO) != 0].sum()) / 1000
+        resultado["rampa_auto_s"] = auto
+        resultado["rampa_manual_s"] = duracion - auto
+    for indice, nombre in enumerate(motores):
+        motor = muestras["motores"][..., indice]
+        girando = numpy.abs(motor["rpm"].ravel()[:-1]) > UMBRAL_RPM
+        resultado[nombre + "_uso"] = float(dt[girando].sum()) / 1000 / duracion if duracion else 0.0
+        resultado[nombre + "_pico_ma"] = int(motor["ma"].max())
+    return resultado
+
+def _metricas_columnas(registro) -> dict:
+    """Las mismas métricas a partir de un telemetria.Telemetria (columnas decodificadas)."""
+    t = registro["t_ms"]
+    n = len(t)
+    dt = [t[i + 1] - t[i] for i in range(n - 1)]
+    duracion = sum(dt) / 1000
+    estado = registro["estado"]
+    vuelta = registro["vuelta_us"]
+    atrasos = registro["atrasos"]
+
+    def segundos(condicion) -> float:
+        return sum(dt[i] for i in range(n - 1) if condicion(i)) / 1000
+
+    resultado = {
+        "plataforma": "V5" if registro.plataforma == PLATAFORMA_V5 else "IQ",
+        "muestras": n,
+        "duracion_s": duracion,
+        "vuelta_media_us": sum(int(v) for v in vuelta) / n,
+        "vuelta_max_us": int(max(vuelta)),
+        "atrasos": sum((int(atrasos[i + 1]) - int(atrasos[i])) & 0xFFFF for i in range(n - 1)),
+        "cepillo_s": segundos(lambda i: estado[i] & BIT_CEPILLO),
+    }
+    if registro.plataforma == PLATAFORMA_V5:
+        auto = segundos(lambda i: estado[i] & BIT_RAMPA_AUTO)
+        resultado["rampa_auto_s"] = auto
+        resultado["rampa_manual_s"] = duracion - auto
+    for nombre in registro.motores:
+        rpm = registro[nombre + "_rpm"]
+        uso = segundos(lambda i: abs(int(rpm[i])) > UMBRAL_RPM)
+        resultado[nombre + "_uso"] = uso / duracion if duracion else 0.0
+        resultado[nombre + "_pico_ma"] = int(max(registro[nombre + "_ma"]))
+    return resultado
+
+def analizar(ruta: str) -> dict:
+    """
+    Métricas de un archivo. Se llama dentro de los procesos del Pool;
+    un archivo ilegible devuelve solo 'archivo' y 'error' para no
+    cortar el lote.
+    """
+    try:
+        mapeado = mapear(ruta)
+        if mapeado is not None:
+            resultado = _metricas_numpy(*mapeado)
+            resultado["mapeado"] = True
+        else:
+            resultado = _metricas_columnas(telemetria.leer(ruta))
+            resultado["mapeado"] = False
+    except (OSError, ValueError, struct.error) as error:
+        resultado = {"error": str(error)}
+    return dict({"archivo": os.path.basename(ruta)}, **resultado)
+
+def buscar(rutas) -> list:
+    """Archivos a analizar: los dados y los .vxt dentro de cada carpeta."""
+    archivos = []
+    for ruta in rutas:
+        if os.path.isdir(ruta):
+            for carpeta, _, nombres in sorted(os.walk(ruta)):
+                archivos.extend(os.path.join(carpeta, nombre) for nombre in sorted(nombres)
+                                if nombre.endswith(".vxt"))
+        else:
+            archivos.append(ruta)
+    return archivos
+
+def analizar_todos(archivos: list, procesos: int = None) -> dict:
+    """
+    Analiza los archivos en paralelo y devuelve la tabla por columnas
+    {columna: [valor por archivo]} (None donde un archivo no tiene
+    esa columna, p. ej. otros motores).
+    """
+    procesos = procesos or os.cpu_count()
+    with multiprocessing.Pool(procesos) as pool:
+        filas = pool.map(analizar, archivos, chunksize=max(1, len(archivos) // (4 * procesos)))
+    columnas = []
+    for fila in filas:
+        columnas.extend(columna for columna in fila if columna not in columnas)
+    return {columna: [fila.get(columna) for fila in filas] for columna in columnas}
+
+def totales(tabla: dict) -> dict:
+    """Una fila con el total de la temporada: suma de tiempos, máximo de picos, uso ponderado."""
+    duraciones = tabla.get("duracion_s", [None] * len(tabla["archivo"]))
+    fila = {}
+    for columna, valores in tabla.items():
+        presentes = [(v, d) for v, d in zip(valores, duraciones) if v is not None]
+        if columna == "archivo":
+            fila[columna] = "total (%d)" % len(valores)
+        elif columna == "error":
+            fila[columna] = "%d con error" % len(presentes)
+        elif columna.endswith("_s") or columna in ("muestras", "atrasos"):
+            fila[columna] = sum(v for v, _ in presentes)
+        elif columna.endswith("_max_us") or columna.endswith("_pico_ma"):
+            fila[columna] = max((v for v, _ in presentes), default=0)
+        elif columna.endswith("_uso") or columna == "vuelta_media_us":
+            tiempo = sum(d for _, d in presentes)
+            fila[columna] = sum(v * d for v, d in presentes) / tiempo if tiempo else 0.0
+        else:
+            fila[columna] = ""
+    return fila
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Métricas de muchas partidas a partir de la telemetría.")
+    parser.add_argument("rutas", nargs="+", help="archivos .vxt o carpetas con .vxt")
+    parser.add_argument("--procesos", type=int, default=None, help="procesos del pool (todos los núcleos)")
+    parser.add_argument("--csv", help="guardar la tabla por partida en este archivo")
+    parser.add_argument("--columnas", help="columnas a imprimir, separadas por comas")
+    args = parser.parse_args()
+
+    archivos = buscar(args.rutas)
+    if not archivos:
+        parser.error("no hay archivos .vxt")
+    inicio = time.perf_counter()
+    tabla = analizar_todos(archivos, args.procesos)
+    real = time.perf_counter() - inicio
+    total = totales(tabla)
+    impresa = {columna: ["-" if v is None else v for v in valores] + [total[columna]]
+               for columna, valores in tabla.items()}
+    barrido.imprimir_tabla(impresa, args.columnas.split(",") if args.columnas else None)
+    mapeados = sum(1 for mapeado in tabla.get("mapeado", ()) if mapeado)
+    errores = sum(1 for error in tabla.get("error", ()) if error is not None)
+    print("\n%d partidas (%.0f s de registro, %d mapeadas, %d con error) en %.2f s" % (
+        len(archivos), total.get("duracion_s", 0), mapeados, errores, real))
+    if args.csv:
+        barrido.guardar_csv(tabla, args.csv)
+
+if __name__ == "__main__":
+    main()
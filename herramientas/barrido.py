@@ -0,0 +1,124 @@
+# ================================================================
+# Herramientas – Barrido de parámetros sobre el simulador
+# ---------------------------------------------------------------
+# Descripción:
+#   Corre un robot contra una traza de joystick para cada
+#   combinación de una rejilla de claves de su perfil (DEADZONE,
+#   RPM_RAMPA_AUTO, VEL_GARRA, VEL_PINZA...) repartiendo las corridas
+#   en un multiprocessing.Pool con todos los núcleos. Los resultados
+#   se juntan en una tabla por columnas (una lista por métrica).
+#
+# Uso:
+#   python herramientas/barrido.py grandes \
+#       -p DEADZONE=5,10,15 -p RPM_RAMPA_AUTO=370,420,470 \
+#       --traza aleatoria:3 --segundos 60 --csv barrido.csv
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import argparse
+import csv
+import itertools
+import multiprocessing
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(RAIZ, "simulador"))
+
+import simulacion  # noqa: E402
+import trazas      # noqa: E402
+
+# Actuadores cuyo pico de corriente y temperatura se reportan
+ACTUADORES = ("rampa", "cepillo", "garra", "pinza")
+
+def rejilla(parametros: dict) -> list:
+    """Producto cartesiano de {nombre: [valores]} como lista de dicts."""
+    nombres = list(parametros)
+    return [dict(zip(nombres, valores)) for valores in itertools.product(*parametros.values())]
+
+def correr_caso(caso: tuple) -> dict:
+    """
+    Una corrida: arma el robot con las constantes del caso en su
+    perfil y lo ejecuta contra la traza. Se llama dentro de los
+    procesos del Pool.
+    """
+    nombre_robot, constantes, traza, segundos = caso
+    robot = simulacion.cargar_robot(nombre_robot, constantes)
+    resultado = dict(constantes)
+    resultado.update(simulacion.correr(robot, segundos, trazas.cargar_traza(traza)))
+    vueltas = max(tarea.ejecuciones for tarea in robot.planificador.tareas)
+    resultado["comandos_por_vuelta"] = resultado["comandos_enviados"] / vueltas
+    for nombre in ACTUADORES:
+        if hasattr(robot, "motor_" + nombre):
+            motor = simulacion.motor_simulado(getattr(robot, "motor_" + nombre))
+            resultado[nombre + "_corriente_pico_a"] = motor.corriente_pico
+            resultado[nombre + "_temp_c"] = motor.temperatura
+    return resultado
+
+def barrer(robot: str, parametros: dict, traza: str = "demo", segundos: float = 105.0,
+           procesos: int = None) -> dict:
+    """
+    Corre toda la rejilla en paralelo y devuelve la tabla por columnas
+    {columna: [valor por caso]}, en el mismo orden que rejilla().
+    """
+    casos = [(robot, constantes, traza, segundos) for constantes in rejilla(parametros)]
+    with multiprocessing.Pool(procesos or os.cpu_count()) as pool:
+        filas = pool.map(correr_caso, casos, chunksize=max(1, len(casos) // (4 * (procesos or os.cpu_count()))))
+    tabla = {}
+    for fila in filas:
+        for columna, valor in fila.items():
+            tabla.setdefault(columna, []).append(valor)
+    return tabla
+
+def _numero(texto: str):
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+def _parametro(texto: str) -> tuple:
+    nombre, _, valores = texto.partition("=")
+    if not valores:
+        raise argparse.ArgumentTypeError("se esperaba NOMBRE=v1,v2,...: %r" % texto)
+    return nombre.strip(), [_numero(v) for v in valores.split(",")]
+
+def imprimir_tabla(tabla: dict, columnas=None) -> None:
+    """Imprime la tabla alineada por columnas."""
+    columnas = columnas or list(tabla)
+    celdas = [[("%.3f" % v) if isinstance(v, float) else str(v) for v in tabla[c]] for c in columnas]
+    anchos = [max(len(c), *(len(v) for v in col)) for c, col in zip(columnas, celdas)]
+    print("  ".join(c.rjust(a) for c, a in zip(columnas, anchos)))
+    for fila in zip(*celdas):
+        print("  ".join(v.rjust(a) for v, a in zip(fila, anchos)))
+
+def guardar_csv(tabla: dict, ruta: str) -> None:
+    with open(ruta, "w", newline="") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(list(tabla))
+        escritor.writerows(zip(*tabla.values()))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Barrido de constantes del perfil en el simulador.")
+    parser.add_argument("robot", help="grandes, pequenos, iq o ruta a un perfil .py")
+    parser.add_argument("-p", "--param", type=_parametro, action="append", required=True,
+                        help="NOMBRE=v1,v2,... (repetible)")
+    parser.add_argument("--traza", default="demo", help="demo, escalones, aleatoria[:semilla] o archivo .csv")
+    parser.add_argument("--segundos", type=float, default=105.0, help="tiempo simulado por corrida")
+    parser.add_argument("--procesos", type=int, default=None, help="procesos del pool (todos los núcleos)")
+    parser.add_argument("--csv", help="guardar la tabla en este archivo")
+    parser.add_argument("--columnas", help="columnas a imprimir, separadas por comas")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    tabla = barrer(args.robot, dict(args.param), args.traza, args.segundos, args.procesos)
+    real = time.perf_counter() - inicio
+    imprimir_tabla(tabla, args.columnas.split(",") if args.columnas else None)
+    casos = len(next(iter(tabla.values())))
+    print("\n%d corridas (%.0f s simulados) en %.2f s" % (casos, casos * args.segundos, real))
+    if args.csv:
+        guardar_csv(tabla, args.csv)
+
+if __name__ == "__main__":
+    main()
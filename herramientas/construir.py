@@ -0,0 +1,397 @@
+# ================================================================
+# Herramientas – Construcción de los .v5python de cada robot
+# ---------------------------------------------------------------
+# Descripción:
+#   El cerebro corre un solo archivo, así que cada driver_mode.py
+#   (perfil + núcleo) se aplana en un programa único y se guarda como
+#   textContent de su .v5python, conservando el resto del JSON:
+#
+#     1. Junta los módulos de nucleo/, perfiles/ y trayectorias/ que
+#        importa el driver_mode.py, en orden de dependencias, y quita
+#        esos imports.
+#     2. Quita docstrings, comentarios y anotaciones de tipos.
+#     3. Reemplaza las constantes en MAYÚSCULAS (asignadas una sola vez)
+#        por su valor y calcula lo que ya se sabe en la PC:
+#        aritmética entre constantes, struct.calcsize("...") y len().
+#     4. Elimina funciones, clases y constantes que nadie usa.
+#     5. Falla si el programa usa métodos de str que MicroPython no
+#        tiene (METODOS_SOLO_CPYTHON: ljust, zfill...).
+#
+#   Con --comprobar no escribe nada: falla si algún .v5python no
+#   coincide con lo que se generaría (para detectar copias a mano).
+#
+# Uso:
+#   python herramientas/construir.py                 # los tres robots
+#   python herramientas/construir.py grandes --mostrar
+#   python herramientas/construir.py --comprobar
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import argparse
+import ast
+import importlib
+import json
+import os
+import struct
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+# Carpeta de cada robot (driver_mode.py + driver_mode.v5python)
+ROBOTS = {
+    "grandes":  os.path.join(RAIZ, "VEX V5", "Grandes"),
+    "pequenos": os.path.join(RAIZ, "VEX V5", "Pequeños"),
+    "iq":       os.path.join(RAIZ, "VEX IQ"),
+}
+
+# Paquetes propios que se aplanan; lo demás se importa en el cerebro
+PAQUETES = ("nucleo", "perfiles", "trayectorias")
+
+# Campos del .v5python que dependen de la plataforma del perfil
+METADATOS = {
+    "V5": {"platform": "V5", "targetBrainGen": "First"},
+    "IQ": {"platform": "IQ", "targetBrainGen": "Second"},
+}
+
+# Plantilla para un .v5python nuevo (mismos campos que exporta VEXcode)
+PLANTILLA = {
+    "mode": "Text",
+    "hardwareTarget": "brain",
+    "textContent": "",
+    "textLanguage": "python",
+    "robotConfig": [],
+    "slot": 0,
+    "platform": "V5",
+    "sdkVersion": "20240802.15.00.00",
+    "appVersion": "4.0.12",
+    "fileFormat": "2.0.0",
+    "targetBrainGen": "First",
+    "v5Sounds": [],
+    "v5SoundsEnabled": False,
+}
+
+# Métodos de str de CPython que el MicroPython del cerebro no implementa
+METODOS_SOLO_CPYTHON = ("ljust", "rjust", "zfill", "casefold", "capitalize", "swapcase", "expandtabs",
+                        "format_map", "isalnum", "isdecimal", "isnumeric", "isidentifier", "isprintable",
+                        "istitle", "removeprefix", "removesuffix")
+
+class ErrorConstruccion(Exception):
+    """El código no cumple las reglas para aplanarse (ver nucleo/__init__.py)."""
+
+# ------------------------------------------------
+# 1. Juntar módulos
+# ------------------------------------------------
+def _ruta_modulo(nombre: str) -> str:
+    return os.path.join(RAIZ, *nombre.split(".")) + ".py"
+
+def _es_propio(nodo) -> bool:
+    return isinstance(nodo, ast.ImportFrom) and (nodo.module or "").split(".")[0] in PAQUETES
+
+def _leer(ruta: str) -> ast.Module:
+    with open(ruta, encoding="utf-8") as archivo:
+        return ast.parse(archivo.read(), filename=ruta)
+
+def juntar(ruta_entrada: str) -> ast.Module:
+    """
+    Un solo módulo con los imports externos al principio y el cuerpo
+    de cada módulo propio antes de quien lo usa.
+    """
+    orden = []
+    visitados = set()
+
+    def visitar(nombre: str, arbol: ast.Module, pila: tuple) -> None:
+        for nodo in arbol.body:
+            if isinstance(nodo, ast.Import) and any(a.name.split(".")[0] in PAQUETES for a in nodo.names):
+                raise ErrorConstruccion("%s: usa 'from %s import ...'" % (nombre, nodo.names[0].name))
+            if not _es_propio(nodo):
+                continue
+            if nodo.level or any(alias.asname for alias in nodo.names):
+                raise ErrorConstruccion("%s: import relativo o con 'as' de %s" % (nombre, nodo.module))
+            if nodo.module in pila:
+                raise ErrorConstruccion("import circular: %s" % " -> ".join(pila + (nodo.module,)))
+            if nodo.module not in visitados:
+                visitados.add(nodo.module)
+                visitar(nodo.module, _leer(_ruta_modulo(nodo.module)), pila + (nodo.module,))
+        orden.append((nombre, arbol))
+
+    visitar("__main__", _leer(ruta_entrada), ("__main__",))
+
+    importaciones = []
+    vistas = set()
+    cuerpo = []
+    definidos = {}
+    for nombre, arbol in orden:
+        for nodo in arbol.body:
+            if _es_propio(nodo):
+                continue
+            if isinstance(nodo, (ast.Import, ast.ImportFrom)):
+                clave = ast.dump(nodo)
+                if clave not in vistas:
+                    vistas.add(clave)
+                    importaciones.append(nodo)
+                continue
+            for definido in _nombres_definidos(nodo):
+                if definidos.setdefault(definido, nombre) != nombre:
+                    raise ErrorConstruccion("'%s' está definido en %s y en %s" % (
+                        definido, definidos[definido], nombre))
+            cuerpo.append(nodo)
+    # 'from vex import *' primero, como en los programas originales
+    importaciones.sort(key=lambda nodo: not (isinstance(nodo, ast.ImportFrom) and nodo.module == "vex"))
+    return ast.Module(body=importaciones + cuerpo, type_ignores=[])
+
+def _nombres_definidos(nodo) -> list:
+    if isinstance(nodo, (ast.FunctionDef, ast.ClassDef)):
+        return [nodo.name]
+    if isinstance(nodo, ast.Assign):
+        return [n.id for t in nodo.targets for n in ast.walk(t) if isinstance(n, ast.Name)]
+    return []
+
+# ------------------------------------------------
+# 2. Docstrings y anotaciones
+# ------------------------------------------------
+class _Limpiador(ast.NodeTransformer):
+    """Quita docstrings y anotaciones (el cerebro igual las tiene que leer)."""
+
+    def _sin_docstring(self, nodo):
+        cuerpo = nodo.body
+        if cuerpo and isinstance(cuerpo[0], ast.Expr) and isinstance(cuerpo[0].value, ast.Constant) \
+                and isinstance(cuerpo[0].value.value, str):
+            cuerpo = cuerpo[1:]
+        nodo.body = cuerpo or [ast.Pass()]
+        return nodo
+
+    def visit_Module(self, nodo):
+        self.generic_visit(nodo)
+        return self._sin_docstring(nodo)
+
+    def visit_ClassDef(self, nodo):
+        self.generic_visit(nodo)
+        return self._sin_docstring(nodo)
+
+    def visit_FunctionDef(self, nodo):
+        self.generic_visit(nodo)
+        nodo.returns = None
+        return self._sin_docstring(nodo)
+
+    def visit_arg(self, nodo):
+        nodo.annotation = None
+        return nodo
+
+    def visit_AnnAssign(self, nodo):
+        if nodo.value is None:
+            return None
+        return ast.copy_location(ast.Assign(targets=[nodo.target], value=nodo.value), nodo)
+
+# ------------------------------------------------
+# 3. Constantes
+# ------------------------------------------------
+_OPERADORES = {
+    ast.Add: lambda a, b: a + b, ast.Sub: lambda a, b: a - b, ast.Mult: lambda a, b: a * b,
+    ast.Div: lambda a, b: a / b, ast.FloorDiv: lambda a, b: a // b, ast.Mod: lambda a, b: a % b,
+    ast.Pow: lambda a, b: a ** b, ast.LShift: lambda a, b: a << b, ast.RShift: lambda a, b: a >> b,
+    ast.BitOr: lambda a, b: a | b, ast.BitAnd: lambda a, b: a & b, ast.BitXor: lambda a, b: a ^ b,
+}
+_UNARIOS = {ast.USub: lambda a: -a, ast.UAdd: lambda a: +a, ast.Invert: lambda a: ~a, ast.Not: lambda a: not a}
+_ESCALARES = (bool, int, float, str, bytes, type(None))
+
+class _SinValor(Exception):
+    pass
+
+def _valor(nodo, conocidas: dict):
+    """Valor de una expresión que solo depende de literales y constantes conocidas."""
+    if isinstance(nodo, ast.Constant):
+        return nodo.value
+    if isinstance(nodo, ast.Name) and nodo.id in conocidas:
+        return conocidas[nodo.id]
+    if isinstance(nodo, ast.Tuple):
+        return tuple(_valor(e, conocidas) for e in nodo.elts)
+    if isinstance(nodo, ast.BinOp) and type(nodo.op) in _OPERADORES:
+        return _OPERADORES[type(nodo.op)](_valor(nodo.left, conocidas), _valor(nodo.right, conocidas))
+    if isinstance(nodo, ast.UnaryOp) and type(nodo.op) in _UNARIOS:
+        return _UNARIOS[type(nodo.op)](_valor(nodo.operand, conocidas))
+    if isinstance(nodo, ast.Call) and len(nodo.args) == 1 and not nodo.keywords:
+        funcion = ast.unparse(nodo.func)
+        if funcion == "struct.calcsize":
+            return struct.calcsize(_valor(nodo.args[0], conocidas))
+        if funcion == "len":
+            argumento = _valor(nodo.args[0], conocidas)
+            if isinstance(argumento, (tuple, str, bytes)):
+                return len(argumento)
+    raise _SinValor()
+
+def _constantes(arbol: ast.Module) -> dict:
+    """
+    {nombre: valor} de las constantes en MAYÚSCULAS asignadas una sola
+    vez en el nivel superior y nunca reasignadas en otro lugar.
+    """
+    asignaciones = {}
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Name) and isinstance(nodo.ctx, (ast.Store, ast.Del)):
+            asignaciones[nodo.id] = asignaciones.get(nodo.id, 0) + 1
+        elif isinstance(nodo, ast.arg):
+            asignaciones[nodo.arg] = asignaciones.get(nodo.arg, 0) + 1
+        elif isinstance(nodo, (ast.Global, ast.Nonlocal)):
+            for nombre in nodo.names:
+                asignaciones[nombre] = asignaciones.get(nombre, 0) + 2
+    conocidas = {}
+    for nodo in arbol.body:
+        if not (isinstance(nodo, ast.Assign) and len(nodo.targets) == 1
+                and isinstance(nodo.targets[0], ast.Name)):
+            continue
+        nombre = nodo.targets[0].id
+        if nombre.upper() != nombre or asignaciones.get(nombre) != 1:
+            continue
+        try:
+            conocidas[nombre] = _valor(nodo.value, conocidas)
+        except (_SinValor, TypeError, ValueError, ZeroDivisionError, struct.error):
+            pass
+    return conocidas
+
+class _Plegador(ast.NodeTransformer):
+    """Pone el valor de las constantes escalares y pliega lo que ya se puede calcular."""
+
+    def __init__(self, conocidas: dict):
+        self.conocidas = conocidas
+
+    def visit_Name(self, nodo):
+        if isinstance(nodo.ctx, ast.Load) and nodo.id in self.conocidas \
+                and isinstance(self.conocidas[nodo.id], _ESCALARES):
+            return ast.copy_location(ast.Constant(self.conocidas[nodo.id]), nodo)
+        return nodo
+
+    def _plegar(self, nodo):
+        self.generic_visit(nodo)
+        try:
+            valor = _valor(nodo, self.conocidas)
+        except (_SinValor, TypeError, ValueError, ZeroDivisionError, OverflowError, struct.error):
+            return nodo
+        if isinstance(valor, _ESCALARES) and not (isinstance(valor, str) and len(valor) > 64):
+            return ast.copy_location(ast.Constant(valor), nodo)
+        return nodo
+
+    visit_BinOp = _plegar
+    visit_UnaryOp = _plegar
+    visit_Call = _plegar
+
+    def visit_Assign(self, nodo):
+        # La definición de la constante misma se conserva (la quita el paso 4 si queda sin uso)
+        nodo.value = self.visit(nodo.value)
+        return nodo
+
+def plegar_constantes(arbol: ast.Module) -> ast.Module:
+    return _Plegador(_constantes(arbol)).visit(arbol)
+
+# ------------------------------------------------
+# 4. Código sin uso
+# ------------------------------------------------
+def _usados(nodos) -> set:
+    usados = set()
+    for nodo in nodos:
+        for hijo in ast.walk(nodo):
+            if isinstance(hijo, ast.Name) and isinstance(hijo.ctx, ast.Load):
+                usados.add(hijo.id)
+    return usados
+
+def _removible(nodo) -> str:
+    """Nombre de una definición sin efectos al quitarla, o None."""
+    if isinstance(nodo, (ast.FunctionDef, ast.ClassDef)):
+        return nodo.name
+    if isinstance(nodo, ast.Assign) and len(nodo.targets) == 1 and isinstance(nodo.targets[0], ast.Name):
+        try:
+            _valor(nodo.value, {})
+        except Exception:
+            return None
+        return nodo.targets[0].id
+    return None
+
+def quitar_sin_uso(arbol: ast.Module) -> ast.Module:
+    cuerpo = list(arbol.body)
+    while True:
+        quitar = []
+        for indice, nodo in enumerate(cuerpo):
+            nombre = _removible(nodo)
+            if nombre is not None and nombre not in _usados(cuerpo[:indice] + cuerpo[indice + 1:]):
+                quitar.append(indice)
+        if not quitar:
+            break
+        cuerpo = [nodo for indice, nodo in enumerate(cuerpo) if indice not in quitar]
+    arbol.body = cuerpo
+    return arbol
+
+# ------------------------------------------------
+# Programa y .v5python
+# ------------------------------------------------
+def comprobar_micropython(arbol: ast.Module) -> None:
+    """Falla si el programa aplanado llama a un método de METODOS_SOLO_CPYTHON."""
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Attribute) and nodo.attr in METODOS_SOLO_CPYTHON:
+            raise ErrorConstruccion("'.%s()' no existe en MicroPython: %s" % (nodo.attr, ast.unparse(nodo)))
+
+def _perfil(ruta_entrada: str) -> dict:
+    """PERFIL que importa el driver_mode.py (los perfiles son solo datos)."""
+    for nodo in _leer(ruta_entrada).body:
+        if _es_propio(nodo) and nodo.module.startswith("perfiles."):
+            return importlib.import_module(nodo.module).PERFIL
+    raise ErrorConstruccion("%s no importa ningún perfil" % ruta_entrada)
+
+def aplanar(ruta_entrada: str) -> str:
+    """Texto del programa de un solo archivo para el cerebro."""
+    arbol = juntar(ruta_entrada)
+    arbol = _Limpiador().visit(arbol)
+    arbol = plegar_constantes(arbol)
+    arbol = quitar_sin_uso(arbol)
+    comprobar_micropython(arbol)
+    ast.fix_missing_locations(arbol)
+    relativa = os.path.relpath(ruta_entrada, RAIZ).replace(os.sep, "/")
+    return ("# Generado por herramientas/construir.py desde %s, nucleo/ y perfiles/.\n"
+            "# No editar aquí: los cambios se pierden al volver a construir.\n" % relativa
+            + ast.unparse(arbol) + "\n")
+
+def v5python(carpeta: str) -> tuple:
+    """(ruta, contenido) del .v5python de la carpeta de un robot."""
+    entrada = os.path.join(carpeta, "driver_mode.py")
+    ruta = os.path.join(carpeta, "driver_mode.v5python")
+    if os.path.exists(ruta):
+        with open(ruta, encoding="utf-8") as archivo:
+            datos = json.load(archivo)
+    else:
+        datos = dict(PLANTILLA)
+    datos["textContent"] = aplanar(entrada)
+    datos.update(METADATOS[_perfil(entrada)["PLATAFORMA"]])
+    return ruta, json.dumps(datos, ensure_ascii=False, separators=(",", ":"))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Genera el .v5python de cada robot desde nucleo/ y perfiles/.")
+    parser.add_argument("robots", nargs="*", default=list(ROBOTS), help="grandes, pequenos, iq (todos por defecto)")
+    parser.add_argument("--comprobar", action="store_true", help="no escribir; fallar si algún .v5python está desactualizado")
+    parser.add_argument("--mostrar", action="store_true", help="imprimir el programa aplanado")
+    args = parser.parse_args()
+
+    desactualizados = []
+    for robot in args.robots:
+        carpeta = ROBOTS.get(robot, robot)
+        ruta, contenido = v5python(carpeta)
+        texto = json.loads(contenido)["textContent"]
+        if args.mostrar:
+            print(texto)
+        anterior = None
+        if os.path.exists(ruta):
+            with open(ruta, encoding="utf-8") as archivo:
+                anterior = archivo.read()
+        if args.comprobar:
+            if anterior != contenido:
+                desactualizados.append(os.path.relpath(ruta, RAIZ))
+            continue
+        if anterior != contenido:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(contenido)
+        print("%-10s %6d bytes, %4d líneas -> %s" % (
+            robot, len(texto.encode()), texto.count("\n"), os.path.relpath(ruta, RAIZ)))
+    if desactualizados:
+        sys.exit("desactualizados (correr herramientas/construir.py): " + ", ".join(desactualizados))
+
+if __name__ == "__main__":
+    main()
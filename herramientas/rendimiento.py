@@ -0,0 +1,149 @@
+# ================================================================
+# Herramientas – Banco de rendimiento del bucle de control
+# ---------------------------------------------------------------
+# Descripción:
+#   Corre el programa de cada robot contra el `vex` simulado durante
+#   N vueltas del planificador con una traza de joystick fija y mide
+#   solo planificador.paso() (las tareas; la física del simulador
+#   queda fuera):
+#     • vueltas_s         vueltas por segundo de CPU de la PC
+#     • us_vuelta         µs de CPU por vuelta
+#     • comandos_vuelta   comandos que llegan a los motores por vuelta
+#     • suprimidos_vuelta comandos repetidos que MotorCacheado evitó
+#     • asignado_vuelta_b bytes asignados (pico) dentro de cada vuelta,
+#                         con tracemalloc en una segunda pasada
+#     • retenido_vuelta_b crecimiento de memoria por vuelta (debe ser ~0)
+#   Por defecto mide el programa aplanado (el .v5python que corre el
+#   cerebro). Son números de CPython: sirven para comparar cambios
+#   entre sí, no como tiempos del cerebro. Guarda una línea base en
+#   JSON y compara contra ella.
+#
+# Uso:
+#   python herramientas/rendimiento.py                       # los tres robots
+#   python herramientas/rendimiento.py grandes --vueltas 20000
+#   python herramientas/rendimiento.py --guardar base.json
+#   python herramientas/rendimiento.py --comparar base.json
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(RAIZ, "simulador"))
+
+import simulacion  # noqa: E402
+import trazas      # noqa: E402
+import vex         # noqa: E402  (el `vex` simulado)
+
+METRICAS = ("vueltas_s", "us_vuelta", "comandos_vuelta", "suprimidos_vuelta",
+            "asignado_vuelta_b", "retenido_vuelta_b")
+
+def _cargar(robot: str, paquete: bool):
+    return simulacion.cargar_robot(robot) if paquete else simulacion.cargar_construido(robot)
+
+def _tiempo(robot: str, vueltas: int, traza: str, paquete: bool) -> tuple:
+    """Una corrida: (segundos dentro de paso(), enviados, suprimidos)."""
+    programa = _cargar(robot, paquete)
+    entrada = trazas.cargar_traza(traza)
+    planificador = programa.planificador
+    controller = vex.sim.controladores[0]
+    reloj = time.perf_counter
+    enviados, suprimidos = programa.contar_comandos()
+    planificador.iniciar()
+    total = 0.0
+    for _ in range(vueltas):
+        entrada(vex.sim.tiempo_us, controller)
+        inicio = reloj()
+        plazo = planificador.paso()
+        total += reloj() - inicio
+        planificador.esperar(plazo)
+    enviados_fin, suprimidos_fin = programa.contar_comandos()
+    return total, enviados_fin - enviados, suprimidos_fin - suprimidos
+
+def _memoria(robot: str, vueltas: int, traza: str, paquete: bool) -> tuple:
+    """Corrida con tracemalloc: (bytes asignados en paso() en total, bytes retenidos)."""
+    programa = _cargar(robot, paquete)
+    entrada = trazas.cargar_traza(traza)
+    planificador = programa.planificador
+    controller = vex.sim.controladores[0]
+    planificador.iniciar()
+    # Una vuelta de calentamiento para que las cachés iniciales no cuenten
+    planificador.esperar(planificador.paso())
+    tracemalloc.start()
+    inicial = tracemalloc.get_traced_memory()[0]
+    asignado = 0
+    for _ in range(vueltas):
+        entrada(vex.sim.tiempo_us, controller)
+        antes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        plazo = planificador.paso()
+        asignado += tracemalloc.get_traced_memory()[1] - antes
+        planificador.esperar(plazo)
+    retenido = tracemalloc.get_traced_memory()[0] - inicial
+    tracemalloc.stop()
+    return asignado, retenido
+
+def medir(robot: str, vueltas: int = 10000, traza: str = "demo", repeticiones: int = 3,
+          paquete: bool = False) -> dict:
+    """Métricas de METRICAS para un robot (el mejor tiempo de 'repeticiones')."""
+    mejor = None
+    for _ in range(repeticiones):
+        total, enviados, suprimidos = _tiempo(robot, vueltas, traza, paquete)
+        if mejor is None or total < mejor:
+            mejor = total
+    asignado, retenido = _memoria(robot, vueltas, traza, paquete)
+    return {
+        "vueltas_s": vueltas / mejor,
+        "us_vuelta": mejor / vueltas * 1e6,
+        "comandos_vuelta": enviados / vueltas,
+        "suprimidos_vuelta": suprimidos / vueltas,
+        "asignado_vuelta_b": asignado / vueltas,
+        "retenido_vuelta_b": retenido / vueltas,
+    }
+
+def imprimir(resultados: dict, base: dict = None) -> None:
+    """Tabla robot × métrica; con 'base', el cambio relativo de cada valor."""
+    print("%-10s" % "robot" + "".join("%20s" % m for m in METRICAS))
+    for robot, metricas in resultados.items():
+        celdas = []
+        for nombre in METRICAS:
+            valor = metricas[nombre]
+            celda = "%.2f" % valor
+            anterior = (base or {}).get(robot, {}).get(nombre)
+            if anterior:
+                celda += " (%+.0f%%)" % ((valor - anterior) / abs(anterior) * 100)
+            elif anterior is not None:
+                celda += " (era 0)"
+            celdas.append("%20s" % celda)
+        print("%-10s" % robot + "".join(celdas))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rendimiento del bucle de control en el simulador.")
+    parser.add_argument("robots", nargs="*", default=list(simulacion.ROBOTS), help="grandes, pequenos, iq (todos por defecto)")
+    parser.add_argument("--vueltas", type=int, default=10000, help="vueltas del planificador por corrida")
+    parser.add_argument("--repeticiones", type=int, default=3, help="corridas de tiempo (se toma la mejor)")
+    parser.add_argument("--traza", default="demo", help="demo, escalones, aleatoria[:semilla] o archivo .csv")
+    parser.add_argument("--paquete", action="store_true", help="medir nucleo/ en vez del programa aplanado")
+    parser.add_argument("--guardar", help="guardar los resultados como línea base (JSON)")
+    parser.add_argument("--comparar", help="línea base (JSON) contra la cual comparar")
+    args = parser.parse_args()
+
+    base = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as archivo:
+            base = json.load(archivo)
+    resultados = {robot: medir(robot, args.vueltas, args.traza, args.repeticiones, args.paquete)
+                  for robot in args.robots}
+    imprimir(resultados, base)
+    if args.guardar:
+        with open(args.guardar, "w", encoding="utf-8") as archivo:
+            json.dump(resultados, archivo, indent=2)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+# ================================================================
+# Herramientas – Decodificador de telemetría
+# ---------------------------------------------------------------
+# Descripción:
+#   Convierte el flujo de telemetría de los robots (consola
+#   serial o telemetria.vxt de la SD) en una tabla por columnas:
+#   t_ms, vuelta_us, bateria_mv, atrasos, estado y, por motor,
+#   <motor>_rpm, <motor>_ma y <motor>_c. Cada columna es un arreglo
+#   de numpy si está instalado; si no, un array.array.
+#
+#   El flujo se recorre buscando las tramas VXTN (nombres) y VXT1
+#   (bloques); lo que no sea una trama completa se salta, así una
+#   captura serial que empieza a medio bloque también se decodifica.
+#
+# Uso:
+#   python herramientas/telemetria.py telemetria.vxt --csv partida.csv
+#   python herramientas/telemetria.py --puerto /dev/ttyACM1 --segundos 60 --guardar partida.vxt
+#   python herramientas/telemetria.py --simular grandes --traza demo --segundos 30
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import argparse
+import array
+import csv
+import os
+import struct
+import sys
+import time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+FORMATO_NOMBRES = "<4sH"
+FORMATO_BLOQUE = "<4sBBHH"
+FORMATO_MUESTRA = "<IHHHB"
+FORMATO_MOTOR = "<hHB"
+
+# Columnas de cada muestra y de cada motor, con su tipo de array.array
+CAMPOS = (("t_ms", "L"), ("vuelta_us", "H"), ("bateria_mv", "H"), ("atrasos", "H"), ("estado", "B"))
+CAMPOS_MOTOR = (("rpm", "h"), ("ma", "H"), ("c", "B"))
+
+class Telemetria:
+    """Telemetría decodificada: columnas {nombre: arreglo} y metadatos."""
+
+    def __init__(self, plataforma: int, motores: list, columnas: dict, bloques: int, saltados: int):
+        self.plataforma = plataforma
+        self.motores = motores
+        self.columnas = columnas
+        self.bloques = bloques
+        self.saltados = saltados      # Bytes que no eran parte de ninguna trama
+
+    def __len__(self) -> int:
+        return len(self.columnas["t_ms"])
+
+    def __getitem__(self, columna: str):
+        return self.columnas[columna]
+
+def _columnas(motores: list) -> dict:
+    columnas = {nombre: array.array(tipo) for nombre, tipo in CAMPOS}
+    for motor in motores:
+        for campo, tipo in CAMPOS_MOTOR:
+            columnas["%s_%s" % (motor, campo)] = array.array(tipo)
+    return columnas
+
+def decodificar(datos: bytes, motores=None, a_numpy: bool = True) -> Telemetria:
+    """
+    Decodifica un flujo de telemetría. 'motores' nombra las columnas si
+    el flujo no trae su trama VXTN (captura serial tardía).
+    """
+    crudo = bytes(datos)
+    datos = memoryview(crudo)
+    tam_nombres = struct.calcsize(FORMATO_NOMBRES)
+    tam_bloque = struct.calcsize(FORMATO_BLOQUE)
+    tam_base = struct.calcsize(FORMATO_MUESTRA)
+    tam_motor = struct.calcsize(FORMATO_MOTOR)
+    plataforma = None
+    columnas = None
+    formato = None
+    bloques = 0
+    saltados = 0
+    pos = 0
+    while True:
+        siguiente = crudo.find(b"VXT", pos)
+        if siguiente < 0:
+            saltados += len(crudo) - pos
+            break
+        saltados += siguiente - pos
+        pos = siguiente
+        tipo = crudo[pos + 3:pos + 4]
+        if tipo == b"N" and pos + tam_nombres <= len(crudo):
+            _, largo = struct.unpack_from(FORMATO_NOMBRES, crudo, pos)
+            fin = pos + tam_nombres + largo
+            if fin <= len(crudo):
+                if columnas is None:
+                    motores = crudo[pos + tam_nombres:fin].decode().split(",")
+                pos = fin
+                continue
+        elif tipo == b"1" and pos + tam_bloque <= len(crudo):
+            _, n_motores, plat, muestras, tam = struct.unpack_from(FORMATO_BLOQUE, crudo, pos)
+            fin = pos + tam_bloque + muestras * tam
+            if tam == tam_base + n_motores * tam_motor and fin <= len(crudo):
+                if columnas is None:
+                    if motores is None or len(motores) != n_motores:
+                        motores = ["m%d" % i for i in range(n_motores)]
+                    motores = list(motores)
+                    plataforma = plat
+                    columnas = _columnas(motores)
+                    formato = FORMATO_MUESTRA + FORMATO_MOTOR[1:] * n_motores
+                elif n_motores != len(motores):
+                    raise ValueError("el flujo mezcla bloques de %d y %d motores" % (len(motores), n_motores))
+                destinos = list(columnas.values())
+                for muestra in struct.iter_unpack(formato, datos[pos + tam_bloque:fin]):
+                    for destino, valor in zip(destinos, muestra):
+                        destino.append(valor)
+                bloques += 1
+                pos = fin
+                continue
+        # Trama cortada o no reconocida: sigue buscando un byte después
+        saltados += 1
+        pos += 1
+    if columnas is None:
+        raise ValueError("no hay bloques de telemetría en el flujo")
+    if a_numpy and numpy is not None:
+        columnas = {nombre: numpy.array(valores) for nombre, valores in columnas.items()}
+    return Telemetria(plataforma, motores, columnas, bloques, saltados)
+
+def leer(ruta: str, motores=None, a_numpy: bool = True) -> Telemetria:
+    with open(ruta, "rb") as archivo:
+        return decodificar(archivo.read(), motores, a_numpy)
+
+def capturar(puerto: str, segundos: float, baudios: int = 115200) -> bytes:
+    """Lee la consola serial del cerebro durante 'segundos' (requiere pyserial)."""
+    import serial
+    datos = bytearray()
+    fin = time.monotonic() + segundos
+    with serial.Serial(puerto, baudios, timeout=0.1) as conexion:
+        while time.monotonic() < fin:
+            datos += conexion.read(4096)
+    return bytes(datos)
+
+def simular(robot: str, segundos: float, traza: str = "demo") -> bytes:
+    """Corre el robot en el simulador con telemetría a la SD y devuelve el archivo."""
+    sys.path.insert(0, os.path.join(RAIZ, "simulador"))
+    import simulacion
+    import trazas
+    from nucleo.telemetria import ARCHIVO_TELEMETRIA
+    robot = simulacion.cargar_robot(robot)
+    robot.iniciar_telemetria("sd")
+    simulacion.correr(robot, segundos, trazas.cargar_traza(traza))
+    while robot.telemetria.pendientes:
+        robot.telemetria.volcar()
+    return bytes(robot.brain.sdcard.loadfile(ARCHIVO_TELEMETRIA))
+
+def resumen(telemetria: Telemetria) -> list:
+    """Líneas con picos y promedios por motor y el tiempo de vuelta."""
+    n = len(telemetria)
+    t = telemetria["t_ms"]
+    vuelta = telemetria["vuelta_us"]
+    lineas = ["%d muestras en %d bloques (%.1f s), %d bytes saltados" % (
+        n, telemetria.bloques, (t[n - 1] - t[0]) / 1000 if n else 0.0, telemetria.saltados)]
+    if not n:
+        return lineas
+    lineas.append("vuelta: media %.0f µs, máx %d µs; atrasos %d; batería %d..%d mV" % (
+        sum(vuelta) / n, max(vuelta), telemetria["atrasos"][n - 1],
+        min(telemetria["bateria_mv"]), max(telemetria["bateria_mv"])))
+    lineas.append("%-12s %8s %10s %10s %8s" % ("motor", "rpm_máx", "mA_medio", "mA_pico", "°C_máx"))
+    for motor in telemetria.motores:
+        rpm = telemetria[motor + "_rpm"]
+        ma = telemetria[motor + "_ma"]
+        lineas.append("%-12s %8d %10.0f %10d %8d" % (
+            motor, max(abs(int(v)) for v in rpm), sum(int(v) for v in ma) / n, max(ma),
+            max(telemetria[motor + "_c"])))
+    return lineas
+
+def guardar_csv(telemetria: Telemetria, ruta: str) -> None:
+    with open(ruta, "w", newline="") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(list(telemetria.columnas))
+        escritor.writerows(zip(*telemetria.columnas.values()))
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Decodifica la telemetría de los robots.")
+    parser.add_argument("archivo", nargs="?", help="flujo grabado (telemetria.vxt o captura serial)")
+    parser.add_argument("--puerto", help="capturar en vivo de este puerto serial (pyserial)")
+    parser.add_argument("--simular", metavar="ROBOT", help="generar el flujo con el simulador")
+    parser.add_argument("--traza", default="demo", help="traza para --simular (ver simulador/trazas.py)")
+    parser.add_argument("--segundos", type=float, default=30.0, help="duración de --puerto o --simular")
+    parser.add_argument("--motores", help="nombres de motores, separados por comas, si falta VXTN")
+    parser.add_argument("--guardar", help="guardar el flujo crudo en este archivo")
+    parser.add_argument("--csv", help="exportar las columnas a CSV")
+    args = parser.parse_args()
+
+    if args.simular:
+        datos = simular(args.simular, args.segundos, args.traza)
+    elif args.puerto:
+        datos = capturar(args.puerto, args.segundos)
+    elif args.archivo:
+        with open(args.archivo, "rb") as archivo:
+            datos = archivo.read()
+    else:
+        parser.error("falta el archivo, --puerto o --simular")
+    if args.guardar:
+        with open(args.guardar, "wb") as archivo:
+            archivo.write(datos)
+
+    telemetria = decodificar(datos, args.motores.split(",") if args.motores else None)
+    for linea in resumen(telemetria):
+        print(linea)
+    if args.csv:
+        guardar_csv(telemetria, args.csv)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+# ================================================================
+# Herramientas – Trayectorias del autónomo (se calculan en la PC)
+# ---------------------------------------------------------------
+# Descripción:
+#   Toma los puntos de AUTONOMO del perfil de un robot mecanum y
+#   genera la tabla que recorre nucleo/autonomo.py en el cerebro:
+#
+#     1. Spline Catmull-Rom por los puntos (x, y en metros; 0,0 es la
+#        salida y +y hacia adelante). El rumbo (grados, horario) se
+#        interpola aparte entre puntos: el robot es holonómico.
+#     2. Perfil de velocidad sobre el recorrido de las ruedas (la
+#        traslación y el giro · brazo, así también se gira en el
+#        lugar): VEL_MAX, ACEL_CENTRIPETA en las curvas y ACEL_MAX al
+#        arrancar y frenar (pasada hacia adelante y hacia atrás).
+#     3. Muestreo en el tiempo a HZ_AUTONOMO: velocidad en el marco del
+#        robot -> % de rueda (avance, lateral, giro) + banderas, y la
+#        pose de ese instante (x, y en mm, rumbo en décimas de grado)
+#        para que el cerebro corrija con la odometría.
+#
+#   Escribe trayectorias/<robot>.py con TRAYECTORIA (bytes), que el
+#   driver_mode.py pasa al robot y construir.py deja en el programa.
+#
+# Uso:
+#   python herramientas/trayectorias.py               # los robots con AUTONOMO
+#   python herramientas/trayectorias.py grandes --mostrar
+#   python herramientas/trayectorias.py --comprobar
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import argparse
+import importlib
+import math
+import os
+import struct
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+# Perfil de cada robot con autónomo
+ROBOTS = {
+    "grandes":  "perfiles.grandes",
+    "pequenos": "perfiles.pequenos",
+}
+
+# Mismo formato que nucleo/autonomo.py: avance, lateral, giro (%), banderas,
+# pose de referencia x, y (mm) y rumbo (décimas de grado)
+FORMATO_PASO = "<bbbBhhh"
+TAM_PASO = struct.calcsize(FORMATO_PASO)
+
+# Muestras de la spline por tramo entre dos puntos
+MUESTRAS_TRAMO = 200
+
+def _catmull_rom(p0, p1, p2, p3, u: float) -> tuple:
+    """Punto de la spline Catmull-Rom uniforme entre p1 y p2 (u en 0..1)."""
+    u2 = u * u
+    u3 = u2 * u
+    return tuple(0.5 * (2 * b + (-a + c) * u + (2 * a - 5 * b + 4 * c - d) * u2
+                        + (-a + 3 * b - 3 * c + d) * u3)
+                 for a, b, c, d in zip(p0, p1, p2, p3))
+
+def _suave(u: float) -> float:
+    """Interpolación con derivada nula en los extremos (rumbo entre puntos)."""
+    return u * u * (3 - 2 * u)
+
+def muestrear_camino(puntos, brazo: float) -> list:
+    """
+    Camino denso [(s, x, y, rumbo_rad, banderas)] por los puntos
+    (x, y, rumbo_grados, banderas). s es el recorrido de las ruedas
+    (m): √(traslación² + (giro·brazo)²).
+    """
+    if len(puntos) < 2:
+        raise ValueError("AUTONOMO necesita al menos dos puntos")
+    xy = [(p[0], p[1]) for p in puntos]
+    extendidos = [xy[0]] + xy + [xy[-1]]
+    camino = []
+    s = 0.0
+    anterior = None
+    for tramo in range(len(puntos) - 1):
+        p0, p1, p2, p3 = extendidos[tramo:tramo + 4]
+        r0 = math.radians(puntos[tramo][2])
+        r1 = math.radians(puntos[tramo + 1][2])
+        giro = (r1 - r0 + math.pi) % (2 * math.pi) - math.pi   # Por el lado corto
+        banderas = puntos[tramo][3]
+        for k in range(MUESTRAS_TRAMO + (1 if tramo == len(puntos) - 2 else 0)):
+            u = k / MUESTRAS_TRAMO
+            x, y = _catmull_rom(p0, p1, p2, p3, u)
+            rumbo = r0 + giro * _suave(u)
+            if anterior is not None:
+                s += math.hypot(math.hypot(x - anterior[0], y - anterior[1]), (rumbo - anterior[2]) * brazo)
+            camino.append((s, x, y, rumbo, banderas))
+            anterior = (x, y, rumbo)
+    return camino
+
+def perfil_velocidad(camino, vel_max: float, acel_max: float, acel_centripeta: float) -> list:
+    """Velocidad (m/s de recorrido) en cada muestra del camino."""
+    n = len(camino)
+    limite = [vel_max] * n
+    for i in range(1, n - 1):
+        s0, x0, y0, r0, _ = camino[i - 1]
+        s1, x1, y1, r1, _ = camino[i]
+        s2, x2, y2, r2, _ = camino[i + 1]
+        ds = s2 - s0
+        if ds <= 0.0:
+            continue
+        l1 = math.hypot(x1 - x0, y1 - y0)
+        l2 = math.hypot(x2 - x1, y2 - y1)
+        if l1 < 1e-9 or l2 < 1e-9:
+            continue
+        # Curvatura por el ángulo entre los dos segmentos
+        a1 = math.atan2(y1 - y0, x1 - x0)
+        a2 = math.atan2(y2 - y1, x2 - x1)
+        curvatura = abs((a2 - a1 + math.pi) % (2 * math.pi) - math.pi) / (0.5 * (l1 + l2))
+        if curvatura > 1e-6:
+            limite[i] = min(limite[i], math.sqrt(acel_centripeta / curvatura) * ds / (l1 + l2))
+    velocidad = [0.0] * n
+    for i in range(1, n):
+        ds = camino[i][0] - camino[i - 1][0]
+        velocidad[i] = min(limite[i], math.sqrt(velocidad[i - 1] ** 2 + 2 * acel_max * ds))
+    velocidad[-1] = 0.0
+    for i in range(n - 2, -1, -1):
+        ds = camino[i + 1][0] - camino[i][0]
+        velocidad[i] = min(velocidad[i], math.sqrt(velocidad[i + 1] ** 2 + 2 * acel_max * ds))
+    return velocidad
+
+def _tiempos(camino, velocidad) -> list:
+    """Tiempo (s) en que se llega a cada muestra."""
+    t = [0.0]
+    for i in range(1, len(camino)):
+        ds = camino[i][0] - camino[i - 1][0]
+        v = velocidad[i - 1] + velocidad[i]
+        t.append(t[-1] + (2 * ds / v if v > 0.0 else 0.0))
+    return t
+
+def _porcentaje(valor: float, v_rueda: float) -> int:
+    por_ciento = int(round(valor / v_rueda * 100))
+    return max(-100, min(100, por_ciento))
+
+def _pose(x: float, y: float, rumbo: float) -> tuple:
+    """Pose del paso: x, y (mm) y rumbo (décimas de grado)."""
+    return int(round(x * 1000)), int(round(y * 1000)), int(round(math.degrees(rumbo) * 10))
+
+def generar(perfil: dict) -> bytes:
+    """Tabla de pasos FORMATO_PASO para el AUTONOMO del perfil."""
+    autonomo = perfil["AUTONOMO"]
+    radio = perfil["RADIO_RUEDA"]
+    brazo = perfil["SEMIANCHO"] + perfil["SEMILARGO"]
+    v_rueda = perfil["RPM_RUEDA"] * 2 * math.pi / 60 * radio   # m/s de una rueda al 100%
+    camino = muestrear_camino(autonomo["PUNTOS"], brazo)
+    velocidad = perfil_velocidad(camino, min(autonomo["VEL_MAX"], v_rueda), autonomo["ACEL_MAX"],
+                                 autonomo["ACEL_CENTRIPETA"])
+    tiempos = _tiempos(camino, velocidad)
+    periodo = 1.0 / perfil["HZ_AUTONOMO"]
+    pasos = bytearray()
+    i = 0
+    t = 0.0
+    while t < tiempos[-1]:
+        while tiempos[i + 1] < t:
+            i += 1
+        # Interpolar entre las muestras i e i+1
+        dt = tiempos[i + 1] - tiempos[i]
+        f = (t - tiempos[i]) / dt if dt > 0.0 else 0.0
+        s0, x0, y0, r0, banderas = camino[i]
+        s1, x1, y1, r1, _ = camino[i + 1]
+        v = velocidad[i] + (velocidad[i + 1] - velocidad[i]) * f
+        rumbo = r0 + (r1 - r0) * f
+        x = x0 + (x1 - x0) * f
+        y = y0 + (y1 - y0) * f
+        ds = s1 - s0
+        # Velocidad en el campo (x derecha, y adelante) y giro (rad/s, horario)
+        vx = v * (x1 - x0) / ds if ds > 0.0 else 0.0
+        vy = v * (y1 - y0) / ds if ds > 0.0 else 0.0
+        omega = v * (r1 - r0) / ds if ds > 0.0 else 0.0
+        # Al marco del robot
+        seno, coseno = math.sin(rumbo), math.cos(rumbo)
+        avance = vx * seno + vy * coseno
+        lateral = vx * coseno - vy * seno
+        pasos += struct.pack(FORMATO_PASO, _porcentaje(avance, v_rueda), _porcentaje(lateral, v_rueda),
+                             _porcentaje(omega * brazo, v_rueda), banderas, *_pose(x, y, rumbo))
+        t += periodo
+    _, x, y, rumbo, _ = camino[-1]
+    pasos += struct.pack(FORMATO_PASO, 0, 0, 0, autonomo["PUNTOS"][-1][3], *_pose(x, y, rumbo))
+    return bytes(pasos)
+
+def modulo(robot: str) -> tuple:
+    """(ruta, texto) de trayectorias/<robot>.py."""
+    nombre = ROBOTS[robot]
+    perfil = importlib.import_module(nombre).PERFIL
+    tabla = generar(perfil)
+    ruta = os.path.join(RAIZ, "trayectorias", robot + ".py")
+    texto = ("# Generado por herramientas/trayectorias.py desde %s (AUTONOMO).\n"
+             "# No editar aquí: los cambios se pierden al volver a generar.\n"
+             "# %d pasos a %d Hz (%.2f s), %d bytes.\n\n"
+             "TRAYECTORIA = %r\n" % (nombre.replace(".", "/") + ".py", len(tabla) // TAM_PASO,
+                                     perfil["HZ_AUTONOMO"], len(tabla) / TAM_PASO / perfil["HZ_AUTONOMO"],
+                                     len(tabla), tabla))
+    return ruta, texto
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Genera las tablas del autónomo desde AUTONOMO de cada perfil.")
+    parser.add_argument("robots", nargs="*", default=list(ROBOTS), help="grandes, pequenos (todos por defecto)")
+    parser.add_argument("--comprobar", action="store_true", help="no escribir; fallar si alguna tabla está desactualizada")
+    parser.add_argument("--mostrar", action="store_true",
+                        help="imprimir cada paso (avance, lateral, giro, banderas, x, y, rumbo)")
+    args = parser.parse_args()
+
+    desactualizados = []
+    for robot in args.robots:
+        ruta, texto = modulo(robot)
+        if args.mostrar:
+            espacio = {}
+            exec(texto, espacio)
+            for indice, paso in enumerate(struct.iter_unpack(FORMATO_PASO, espacio["TRAYECTORIA"])):
+                print(robot, indice, *paso)
+        anterior = None
+        if os.path.exists(ruta):
+            with open(ruta, encoding="utf-8") as archivo:
+                anterior = archivo.read()
+        if args.comprobar:
+            if anterior != texto:
+                desactualizados.append(os.path.relpath(ruta, RAIZ))
+            continue
+        if anterior != texto:
+            with open(ruta, "w", encoding="utf-8") as archivo:
+                archivo.write(texto)
+        print("%-10s %s" % (robot, texto.splitlines()[2][2:]))
+    if desactualizados:
+        sys.exit("desactualizadas (correr herramientas/trayectorias.py): " + ", ".join(desactualizados))
+
+if __name__ == "__main__":
+    main()
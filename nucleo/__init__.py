@@ -0,0 +1,48 @@
+# ================================================================
+# Núcleo – Código común de los programas del cerebro
+# ---------------------------------------------------------------
+# Descripción:
+#   Los driver_mode.py de cada robot solo eligen un perfil
+#   (perfiles/) y una clase de robot de este paquete. El cerebro no
+#   importa paquetes: herramientas/construir.py junta los módulos que
+#   usa cada driver_mode.py en un solo archivo y lo guarda en su
+#   .v5python.
+#
+#   • motores.py       MotorCacheado y crear_motor()
+#   • control.py       ControlMuestreado, EventosControl y GrabadorControl
+#   • planificador.py  Tarea y Planificador
+#   • telemetria.py    Telemetria
+#   • mecanum.py       TrenMecanum
+#   • diferencial.py   TrenDiferencial
+#   • velocidad.py     LazoVelocidad (lazo cerrado de las ruedas)
+#   • movimiento.py    PerfilMovimiento (rampa, garra y pinza)
+#   • odometria.py     Odometria (pose con encoders + inercial)
+#   • entrada.py       FormaEje (zona muerta, expo y subida del joystick)
+#   • perfilador.py    Perfilador (tiempo por tarea)
+#   • energia.py       GestorEnergia (presupuesto de corriente)
+#   • atascos.py       DetectorAtasco (cepillo y rampa)
+#   • macros.py        EjecutorMacros (secuencias de actuadores)
+#   • tablero.py       Tablero (estado del robot en la pantalla)
+#   • robot.py         Robot (base: cerebro, controlador, motores, tareas)
+#   • robot_v5.py      RobotV5: mecanum + rampa, cepillo, garra y pinza
+#   • robot_iq.py      RobotIQ: diferencial + cepillo
+#   • autonomo.py      SeguidorTrayectoria (tabla de trayectorias/)
+#
+#   Reglas para que construir.py pueda aplanar el paquete:
+#     - Entre módulos solo 'from nucleo.<módulo> import <nombres>'
+#       (sin 'as'); 'from vex import *' y la biblioteca estándar se
+#       importan con normalidad.
+#     - Los nombres de nivel superior no se repiten entre módulos.
+#     - Las constantes en MAYÚSCULAS se asignan una sola vez.
+#     - Este __init__.py no se incluye en el cerebro.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+def crear_robot(perfil: dict, trayectoria: bytes = None):
+    """Instancia la clase de robot que corresponde a la plataforma del perfil."""
+    if perfil["PLATAFORMA"] == "IQ":
+        from nucleo.robot_iq import RobotIQ
+        return RobotIQ(perfil, trayectoria)
+    from nucleo.robot_v5 import RobotV5
+    return RobotV5(perfil, trayectoria)
@@ -0,0 +1,110 @@
+# ================================================================
+# Núcleo – Detección de atascos y recuperación (cepillo y rampa)
+# ---------------------------------------------------------------
+# Descripción:
+#   Mientras un motor está mandado a girar, cada vuelta se anota si
+#   está trabado: casi sin velocidad (< rpm_min) pero tomando
+#   corriente (≥ corriente_min). Las anotaciones van en una ventana
+#   circular preasignada; si casi toda la ventana está trabada hay
+#   un atasco:
+#       1. reversa durante 'vueltas_reversa' (el robot la aplica)
+#       2. gracia: 'vueltas_gracia' sin vigilar mientras vuelve a
+#          tomar velocidad, y se retoma el giro normal
+#   Tras 'max_seguidos' atascos sin una ventana limpia entre ellos el
+#   detector se rinde (el robot apaga ese motor para no calentarlo).
+#   vigilar() devuelve ATASCO_NORMAL, ATASCO_REVERSA o ATASCO_RENDIDO.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+
+FRACCION_ATASCO = 0.8    # Parte de la ventana trabada que cuenta como atasco
+
+# Resultado de vigilar()
+ATASCO_NORMAL = 0        # Girar como siempre
+ATASCO_REVERSA = 1       # Girar al revés (recuperando)
+ATASCO_RENDIDO = 2       # Demasiados atascos seguidos: apagar el motor
+
+class DetectorAtasco:
+    """
+    Vigila un MotorCacheado: vigilar() una vez por vuelta mientras gira.
+    - atascos: total detectados; seguidos: sin ventana limpia entre ellos.
+    - rendiciones: veces que se llegó a 'max_seguidos'.
+    """
+
+    def __init__(self, nombre: str, motor, rpm_min: float, corriente_min: float, ventana: int,
+                 vueltas_reversa: int, vueltas_gracia: int, max_seguidos: int):
+        self.nombre = nombre
+        self.motor = motor
+        self.rpm_min = rpm_min
+        self.corriente_min = corriente_min
+        self.muestras = bytearray(ventana)    # 1 = vuelta trabada
+        self.umbral = max(1, int(ventana * FRACCION_ATASCO))
+        self.vueltas_reversa = vueltas_reversa
+        self.vueltas_gracia = vueltas_gracia
+        self.max_seguidos = max_seguidos
+        self.atascos = 0
+        self.seguidos = 0
+        self.rendiciones = 0
+        self.vigilando = False
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        """Vacía la ventana y da gracia (el motor arranca o se detuvo)."""
+        muestras = self.muestras
+        for i in range(len(muestras)):
+            muestras[i] = 0
+        self.indice = 0
+        self.trabadas = 0
+        self.limpias = 0       # Vueltas sin trabarse desde la última recuperación
+        self.reversa = 0       # Vueltas de reversa que faltan
+        self.gracia = self.vueltas_gracia
+
+    def detener(self) -> None:
+        """El motor dejó de girar: la próxima vez empieza con gracia."""
+        if self.vigilando:
+            self.vigilando = False
+            self.reiniciar()
+
+    def en_reversa(self) -> bool:
+        return self.reversa != 0
+
+    def vigilar(self) -> int:
+        """Anota esta vuelta y dice qué hacer con el motor (ATASCO_*)."""
+        self.vigilando = True
+        if self.reversa:
+            self.reversa -= 1
+            if self.reversa == 0:
+                self.reiniciar()
+                return ATASCO_NORMAL
+            return ATASCO_REVERSA
+        if self.gracia:
+            self.gracia -= 1
+            return ATASCO_NORMAL
+        motor = self.motor
+        trabada = 1 if (abs(motor.velocity(RPM)) < self.rpm_min
+                        and motor.current(AMP) >= self.corriente_min) else 0
+        muestras = self.muestras
+        self.trabadas += trabada - muestras[self.indice]
+        muestras[self.indice] = trabada
+        self.indice += 1
+        if self.indice == len(muestras):
+            self.indice = 0
+        if trabada:
+            self.limpias = 0
+        else:
+            self.limpias += 1
+            if self.limpias == len(muestras):
+                self.seguidos = 0      # Una ventana entera girando bien
+        if self.trabadas < self.umbral:
+            return ATASCO_NORMAL
+        self.atascos += 1
+        self.seguidos += 1
+        if self.seguidos >= self.max_seguidos:
+            self.rendiciones += 1
+            self.seguidos = 0
+            self.reiniciar()
+            return ATASCO_RENDIDO
+        self.reversa = self.vueltas_reversa
+        return ATASCO_REVERSA
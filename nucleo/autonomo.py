@@ -0,0 +1,127 @@
+# ================================================================
+# Núcleo – Seguidor de trayectorias del autónomo
+# ---------------------------------------------------------------
+# Descripción:
+#   La trayectoria se calcula en la PC (herramientas/trayectorias.py:
+#   spline por los puntos del perfil + perfil de velocidad) y llega al
+#   programa como una tabla de bytes, un paso por vuelta de la tarea:
+#
+#       paso "<bbbBhhh": avance, lateral, giro (% con signo, marco del
+#                        robot), banderas de los actuadores y la pose
+#                        donde debería estar el robot en ese paso:
+#                        x, y (mm) y rumbo (décimas de grado, horario)
+#
+#   En el cerebro no hay matemática de trayectorias: cada vuelta lee
+#   el siguiente paso y lo manda a TrenMecanum.mezclar(). Con
+#   odometría se le suma una corrección proporcional al error de la
+#   pose: la de x, y se calcula en el campo y se gira al marco del
+#   robot con TABLA_SENO; la del rumbo va al giro. Cada corrección se
+#   limita a CORRECCION_MAX para que no tape el paso de la tabla.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+import math
+from nucleo.mecanum import BITS_SENO, TABLA_SENO
+
+FORMATO_PASO = "<bbbBhhh"   # avance, lateral, giro (%), banderas, x, y (mm), rumbo (0.1°)
+TAM_PASO = 10
+
+# Banderas de cada paso
+BANDERA_CEPILLO = 1      # Cepillo encendido
+BANDERA_RAMPA = 2        # Rampa en AUTO
+
+DECIGRADOS_POR_RADIAN = 1800.0 / math.pi
+
+class SeguidorTrayectoria:
+    """
+    Recorre una tabla de pasos a la frecuencia con que se generó.
+    - tren: TrenMecanum que recibe cada paso.
+    - acciones(banderas): se llama cuando cambian las banderas.
+    - odometria: Odometria para corregir la pose o None (lazo abierto).
+    - kp_posicion: % por metro de error; kp_rumbo: % por grado de error.
+    - correccion_max: % máximo de cada corrección.
+    """
+
+    def __init__(self, tren, tabla: bytes, acciones=None, odometria=None,
+                 kp_posicion: int = 0, kp_rumbo: int = 0, correccion_max: int = 0):
+        self.tren = tren
+        self.tabla = tabla
+        self.acciones = acciones
+        self.odometria = odometria
+        self.kp_posicion = kp_posicion
+        self.kp_rumbo = kp_rumbo
+        self.correccion_max = correccion_max
+        self.pasos = len(tabla) // TAM_PASO
+        self.indice = 0
+        self.banderas = 0
+        self.terminado = False
+
+    def reiniciar(self) -> None:
+        """Vuelve al primer paso."""
+        self.indice = 0
+        self.banderas = 0
+        self.terminado = False
+
+    def paso(self) -> None:
+        """Manda el siguiente paso al tren; al acabar la tabla lo detiene."""
+        if self.indice >= self.pasos:
+            if not self.terminado:
+                self.terminado = True
+                self.tren.detener()
+            return
+        tabla = self.tabla
+        i = self.indice * TAM_PASO
+        avance = tabla[i]
+        lateral = tabla[i + 1]
+        giro = tabla[i + 2]
+        # Bytes a enteros con signo sin struct (no crea tuplas)
+        if avance > 127:
+            avance -= 256
+        if lateral > 127:
+            lateral -= 256
+        if giro > 127:
+            giro -= 256
+        banderas = tabla[i + 3]
+        if banderas != self.banderas:
+            self.banderas = banderas
+            if self.acciones is not None:
+                self.acciones(banderas)
+        if self.odometria is not None:
+            # Pose de referencia del paso (enteros de 16 bits con signo)
+            x = tabla[i + 4] | tabla[i + 5] << 8
+            y = tabla[i + 6] | tabla[i + 7] << 8
+            rumbo = tabla[i + 8] | tabla[i + 9] << 8
+            if x > 32767:
+                x -= 65536
+            if y > 32767:
+                y -= 65536
+            if rumbo > 32767:
+                rumbo -= 65536
+            avance, lateral, giro = self.corregir(avance, lateral, giro, x, y, rumbo)
+        if avance or lateral or giro:
+            self.tren.mezclar(avance, lateral, giro)
+        else:
+            self.tren.detener()
+        self.indice += 1
+
+    def corregir(self, avance: int, lateral: int, giro: int, x: int, y: int, rumbo: int) -> tuple:
+        """Suma al paso la corrección hacia la pose (x, y mm; rumbo 0.1°) de la tabla."""
+        odometria = self.odometria
+        limite = self.correccion_max
+        medido = int(odometria.rumbo * DECIGRADOS_POR_RADIAN)
+        # Error en el campo (mm) -> % de rueda
+        cx = (x - int(odometria.x * 1000)) * self.kp_posicion // 1000
+        cy = (y - int(odometria.y * 1000)) * self.kp_posicion // 1000
+        cg = (rumbo - medido) * self.kp_rumbo // 10
+        cx = limite if cx > limite else -limite if cx < -limite else cx
+        cy = limite if cy > limite else -limite if cy < -limite else cy
+        cg = limite if cg > limite else -limite if cg < -limite else cg
+        # Del campo al marco del robot con el rumbo medido
+        grado = (medido + 5) // 10 % 360
+        seno = TABLA_SENO[grado]
+        coseno = TABLA_SENO[(grado + 90) % 360]
+        avance += (cx * seno + cy * coseno) >> BITS_SENO
+        lateral += (cx * coseno - cy * seno) >> BITS_SENO
+        return avance, lateral, giro + cg
@@ -0,0 +1,243 @@
+# ================================================================
+# Núcleo – Lectura única del controlador y grabación
+# ---------------------------------------------------------------
+# Descripción:
+#   ControlMuestreado envuelve al Controller: muestrear() lee todos
+#   los ejes y botones una vez por vuelta (ejes en una lista, botones
+#   en una máscara de bits) y el resto del programa consulta esa foto
+#   con la misma interfaz de Controller. Cada foto puede grabarse en la
+#   SD en registros binarios de ancho fijo (FORMATO_MUESTRA).
+#   EventosControl compara cada foto con la anterior y despacha los
+#   eventos de botón (presionado, soltado, largo, doble) a funciones
+#   registradas; si ningún botón cambia no hace nada.
+#
+#   Formato del registro (little-endian):
+#       cabecera  "<4sBBHI": b"VXC1", plataforma (0 V5, 1 IQ),
+#                 nº ejes, bytes por muestra, periodo de muestreo (µs)
+#       muestras  "<IbbbbH": t (ms), 4 ejes, máscara de botones
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+import struct
+
+# Ejes y botones de cada controlador (el orden fija índices y bits)
+EJES_V5 = ("axis1", "axis2", "axis3", "axis4")
+BOTONES_V5 = ("buttonL1", "buttonL2", "buttonR1", "buttonR2",
+              "buttonUp", "buttonDown", "buttonLeft", "buttonRight",
+              "buttonX", "buttonB", "buttonY", "buttonA")
+EJES_IQ = ("axisA", "axisB", "axisC", "axisD")
+BOTONES_IQ = ("buttonLUp", "buttonLDown", "buttonRUp", "buttonRDown",
+              "buttonEUp", "buttonEDown", "buttonFUp", "buttonFDown",
+              "buttonL3", "buttonR3")
+
+ARCHIVO_CONTROL  = "control.vxc"
+MAGIA_CONTROL    = b"VXC1"
+FORMATO_CABECERA = "<4sBBHI"      # "VXC1", plataforma, nº ejes, bytes por muestra, periodo (µs)
+FORMATO_MUESTRA  = "<IbbbbH"      # t (ms), 4 ejes (-100..100), máscara de botones
+
+# Eventos de botón
+EVENTO_PRESIONADO = 0   # Flanco de subida
+EVENTO_SOLTADO = 1      # Flanco de bajada
+EVENTO_LARGO = 2        # Sigue presionado 'largo_us' desde que se presionó
+EVENTO_DOBLE = 3        # Segunda presión antes de 'doble_us' desde la primera
+
+class _EjeMuestreado:
+    """Eje de la foto: position()/value() sin tocar el hardware."""
+
+    def __init__(self, foto, indice: int):
+        self.foto = foto
+        self.indice = indice
+
+    def position(self) -> int:
+        return self.foto.ejes[self.indice]
+
+    def value(self) -> int:
+        return self.foto.ejes[self.indice]
+
+class _BotonMuestreado:
+    """Botón de la foto: pressing() consulta un bit de la máscara."""
+
+    def __init__(self, foto, bit: int):
+        self.foto = foto
+        self.mascara = 1 << bit
+
+    def pressing(self) -> bool:
+        return (self.foto.botones & self.mascara) != 0
+
+class ControlMuestreado:
+    """
+    Foto del controlador tomada una vez por vuelta.
+    - ejes: lista con la posición de cada eje de 'ejes'.
+    - botones: máscara de bits en el orden de 'botones'.
+    - fuente: si no es None, fuente(foto) llena la foto en lugar del
+      hardware (reproducción de un registro).
+    """
+
+    def __init__(self, control, ejes, botones):
+        self.control = control
+        self.fuentes_ejes = tuple(getattr(control, nombre) for nombre in ejes)
+        self.fuentes_botones = tuple(getattr(control, nombre) for nombre in botones)
+        self.ejes = [0] * len(ejes)
+        self.botones = 0
+        self.fuente = None
+        self.grabador = None
+        self.eventos = None
+        for indice, nombre in enumerate(ejes):
+            setattr(self, nombre, _EjeMuestreado(self, indice))
+        for bit, nombre in enumerate(botones):
+            setattr(self, nombre, _BotonMuestreado(self, bit))
+
+    def __getattr__(self, nombre):
+        return getattr(self.control, nombre)
+
+    def muestrear(self) -> None:
+        """Toma la foto de esta vuelta (y la graba si hay grabador)."""
+        if self.fuente is not None:
+            self.fuente(self)
+        else:
+            ejes = self.ejes
+            indice = 0
+            for eje in self.fuentes_ejes:
+                ejes[indice] = eje.position()
+                indice += 1
+            botones = 0
+            bit = 1
+            for boton in self.fuentes_botones:
+                if boton.pressing():
+                    botones |= bit
+                bit <<= 1
+            self.botones = botones
+        if self.grabador is not None:
+            self.grabador.grabar(self)
+        if self.eventos is not None:
+            self.eventos.despachar()
+
+class EventosControl:
+    """
+    Eventos de botón a partir de las fotos de un ControlMuestreado.
+    - registrar(boton, evento, funcion): funcion() se llama en el evento.
+    - despachar(): lo llama muestrear() tras cada foto.
+    Un manejador por botón y evento; el estado está preasignado por bit.
+    """
+
+    def __init__(self, foto, botones, reloj_us, largo_us: int = 500000, doble_us: int = 300000):
+        self.foto = foto
+        self.bits = {nombre: bit for bit, nombre in enumerate(botones)}
+        self.reloj_us = reloj_us
+        self.largo_us = largo_us
+        self.doble_us = doble_us
+        n = len(botones)
+        self.manejadores = [[None] * n for _ in range(4)]   # [evento][bit]
+        self.presionado_us = [0] * n     # Momento de la última presión
+        self.anterior_us = [0] * n       # Presión que puede formar un doble (0 = ninguna)
+        self.previos = 0                 # Máscara de la foto anterior
+        self.con_largo = 0               # Bits con manejador de EVENTO_LARGO
+        self.esperando_largo = 0         # Bits presionados cuyo LARGO aún no llegó
+
+    def registrar(self, boton: str, evento: int, funcion) -> None:
+        """Llama a funcion() cuando 'boton' (p. ej. "buttonA") produce 'evento'."""
+        bit = self.bits[boton]
+        self.manejadores[evento][bit] = funcion
+        if evento == EVENTO_LARGO:
+            self.con_largo |= 1 << bit
+
+    def despachar(self) -> None:
+        """Compara la foto con la anterior y llama a los manejadores."""
+        botones = self.foto.botones
+        cambios = botones ^ self.previos
+        if not cambios and not self.esperando_largo:
+            return
+        self.previos = botones
+        ahora = self.reloj_us()
+        manejadores = self.manejadores
+        bit = 0
+        mascara = 1
+        while cambios:
+            if cambios & mascara:
+                cambios ^= mascara
+                if botones & mascara:
+                    anterior = self.anterior_us[bit]
+                    self.anterior_us[bit] = ahora
+                    self.presionado_us[bit] = ahora
+                    if self.con_largo & mascara:
+                        self.esperando_largo |= mascara
+                    funcion = manejadores[EVENTO_PRESIONADO][bit]
+                    if funcion is not None:
+                        funcion()
+                    funcion = manejadores[EVENTO_DOBLE][bit]
+                    if funcion is not None and anterior and ahora - anterior <= self.doble_us:
+                        self.anterior_us[bit] = 0   # Una tercera presión no es otro doble
+                        funcion()
+                else:
+                    self.esperando_largo &= ~mascara
+                    funcion = manejadores[EVENTO_SOLTADO][bit]
+                    if funcion is not None:
+                        funcion()
+            bit += 1
+            mascara <<= 1
+        esperando = self.esperando_largo
+        bit = 0
+        mascara = 1
+        while esperando:
+            if esperando & mascara:
+                esperando ^= mascara
+                if ahora - self.presionado_us[bit] >= self.largo_us:
+                    self.esperando_largo &= ~mascara
+                    manejadores[EVENTO_LARGO][bit]()
+            bit += 1
+            mascara <<= 1
+
+class GrabadorControl:
+    """
+    Graba las fotos del controlador en un anillo de bloques preasignados.
+    - grabar(): empaqueta la muestra en el bloque actual (sin asignar memoria).
+    - volcar(): pasa los bloques llenos a 'escribir' (tarea de baja frecuencia).
+    - cerrar(): al dejar de grabar, vuelca también el bloque a medio llenar
+      (solo sus registros escritos).
+    - Si el anillo se llena antes de volcar, la muestra se cuenta en 'perdidos'.
+    """
+
+    def __init__(self, escribir, reloj_us, registros_por_bloque: int = 50, bloques: int = 4):
+        self.escribir = escribir
+        self.reloj_us = reloj_us
+        self.tam = struct.calcsize(FORMATO_MUESTRA)
+        self.por_bloque = registros_por_bloque
+        self.bloques = [bytearray(self.tam * registros_por_bloque) for _ in range(bloques)]
+        self.actual = 0        # Bloque que se está llenando
+        self.indice = 0        # Registros ya escritos en el bloque actual
+        self.pendientes = 0    # Bloques llenos sin volcar
+        self.grabados = 0
+        self.perdidos = 0
+
+    def grabar(self, foto) -> None:
+        if self.pendientes == len(self.bloques):
+            self.perdidos += 1
+            return
+        ejes = foto.ejes
+        struct.pack_into(FORMATO_MUESTRA, self.bloques[self.actual], self.indice * self.tam,
+                         self.reloj_us() // 1000, ejes[0], ejes[1], ejes[2], ejes[3], foto.botones)
+        self.grabados += 1
+        self.indice += 1
+        if self.indice == self.por_bloque:
+            self.indice = 0
+            self.pendientes += 1
+            self.actual = (self.actual + 1) % len(self.bloques)
+
+    def volcar(self) -> None:
+        while self.pendientes:
+            primero = (self.actual - self.pendientes) % len(self.bloques)
+            self.escribir(self.bloques[primero])
+            self.pendientes -= 1
+
+    def cerrar(self) -> None:
+        self.volcar()
+        if self.indice:
+            self.escribir(self.bloques[self.actual][:self.indice * self.tam])
+            self.indice = 0
+
+def cabecera_control(plataforma: int, n_ejes: int, periodo_us: int) -> bytes:
+    """Cabecera del archivo de registro del controlador."""
+    return struct.pack(FORMATO_CABECERA, MAGIA_CONTROL, plataforma, n_ejes,
+                       struct.calcsize(FORMATO_MUESTRA), periodo_us)
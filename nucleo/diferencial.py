@@ -0,0 +1,98 @@
+# ================================================================
+# Núcleo – Tren diferencial (arcade y curvatura)
+# ---------------------------------------------------------------
+# Descripción:
+#   Dos lados de ruedas que reciben la misma velocidad: el lado
+#   izquierdo avance + giro y el derecho avance - giro.
+#   Conducción por curvatura ("cheesy drive"): el stick de giro
+#   manda la curvatura y no la velocidad de giro, así que el giro
+#   escala con |avance| y el radio no cambia al acelerar. En giro
+#   rápido (botón o avance casi nulo) el giro va directo, para girar
+#   en el lugar. Si un lado pasa de 100% los dos se escalan por igual
+#   y se conserva la proporción (el giro no se pierde a fondo); arcade()
+#   es el giro rápido de la curvatura y se escala igual.
+#   Cada lado es un solo comando: lados() no reenvía si ningún valor
+#   cambió (y un lado que no cambió tampoco se toca).
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+
+def mezclar_curvatura(avance: int, giro: int, giro_rapido: bool) -> tuple:
+    """
+    (izquierda, derecha) en % para avance (+ adelante) y giro (+
+    derecha); sin giro rápido, giro es la curvatura (% de |avance|).
+    """
+    if not giro_rapido:
+        giro = int((avance if avance >= 0 else -avance) * giro / 100)
+    izquierda = avance + giro
+    derecha = avance - giro
+    mayor = izquierda if izquierda >= 0 else -izquierda
+    if derecha > mayor:
+        mayor = derecha
+    elif -derecha > mayor:
+        mayor = -derecha
+    if mayor > 100:
+        izquierda = int(izquierda * 100 / mayor)
+        derecha = int(derecha * 100 / mayor)
+    return izquierda, derecha
+
+class TrenDiferencial:
+    """
+    Tren motriz de dos lados.
+    - izquierda / derecha: tuplas de MotorCacheado de cada lado.
+    """
+
+    def __init__(self, izquierda, derecha):
+        self.izquierda = tuple(izquierda)
+        self.derecha = tuple(derecha)
+        self.vel_izquierda = None   # Último % mandado a cada lado (None = detenido)
+        self.vel_derecha = None
+
+    def lados(self, izquierda: int, derecha: int) -> None:
+        """Velocidad (%) de cada lado; una velocidad negativa va en reversa."""
+        if izquierda != self.vel_izquierda:
+            self.vel_izquierda = izquierda
+            for motor in self.izquierda:
+                motor.spin(FORWARD, izquierda, PERCENT)
+        if derecha != self.vel_derecha:
+            self.vel_derecha = derecha
+            for motor in self.derecha:
+                motor.spin(FORWARD, derecha, PERCENT)
+
+    def arcade(self, avance: int, giro: int) -> None:
+        """
+        Mezcla diferencial: avance (+ adelante) y giro (+ derecha) en %,
+        escalada como la curvatura si un lado pasa de 100%.
+        """
+        izquierda, derecha = mezclar_curvatura(avance, giro, True)
+        self.lados(izquierda, derecha)
+
+    def curvatura(self, avance: int, giro: int, giro_rapido: bool) -> None:
+        """Conducción por curvatura (ver mezclar_curvatura())."""
+        izquierda, derecha = mezclar_curvatura(avance, giro, giro_rapido)
+        self.lados(izquierda, derecha)
+
+    def mover_adelante(self, velocidad: int) -> None:
+        """Avanza hacia adelante a velocidad (%)."""
+        self.lados(velocidad, velocidad)
+
+    def mover_atras(self, velocidad: int) -> None:
+        """Retrocede a velocidad (%)."""
+        self.lados(-velocidad, -velocidad)
+
+    def girar_izquierda(self, velocidad: int) -> None:
+        """Giro en su lugar hacia la izquierda."""
+        self.lados(-velocidad, velocidad)
+
+    def girar_derecha(self, velocidad: int) -> None:
+        """Giro en su lugar hacia la derecha."""
+        self.lados(velocidad, -velocidad)
+
+    def detener(self) -> None:
+        """Detiene todos los motores del tren motriz."""
+        self.vel_izquierda = None
+        self.vel_derecha = None
+        for motor in self.izquierda + self.derecha:
+            motor.stop()
@@ -0,0 +1,117 @@
+# ================================================================
+# Núcleo – Gestor de energía (presupuesto de corriente)
+# ---------------------------------------------------------------
+# Descripción:
+#   Cada vuelta (HZ_ENERGIA) lee el voltaje de la batería y la
+#   corriente y temperatura de cada motor, las suaviza (promedio
+#   exponencial) y reparte PRESUPUESTO_A limitando el par de cada
+#   motor con set_max_torque() (par ∝ corriente):
+#     1. Batería baja: el presupuesto baja linealmente de V_BATERIA_BAJA
+#        a V_BATERIA_CRITICA (ahí queda a la mitad).
+#     2. Prioritarios (el drive): su parte del presupuesto primero.
+#     3. El resto: lo que dejan los prioritarios, menos lo que usan los
+#        motores que no llegan a su límite, repartido entre los que sí
+#        llegan (los que piden más).
+#     4. Temperatura: de TEMP_INICIO a TEMP_MAX el límite de ese motor
+#        baja hasta LIMITE_MINIMO, antes del recorte del propio motor.
+#   Los límites van en pasos de 5% y solo se mandan si cambian; el
+#   costo por vuelta es fijo (dos pasadas por los motores).
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+
+LIMITE_MINIMO = 20       # % de par que nunca se quita a un motor
+PASO_LIMITE = 5          # Los límites se redondean a múltiplos de este %
+UMBRAL_LIMITADO = 0.9    # Un motor "pide más" si usa este tanto de su límite
+
+class GestorEnergia:
+    """
+    Limita el par de los motores para no pasar de un presupuesto de corriente.
+    - motores: MotorCacheado de todo el robot; prioritarios: los del drive.
+    - bateria: brain.battery.
+    - corriente_motor: A de un motor al 100% de par.
+    - alfa: peso de la lectura nueva en los promedios (0..1).
+    """
+
+    def __init__(self, motores, prioritarios, bateria, presupuesto: float, corriente_motor: float,
+                 v_baja: float, v_critica: float, temp_inicio: float, temp_max: float, alfa: float = 0.3):
+        self.motores = tuple(motores)
+        self.bateria = bateria
+        self.presupuesto = presupuesto
+        self.corriente_motor = corriente_motor
+        self.v_baja = v_baja
+        self.v_critica = v_critica
+        self.temp_inicio = temp_inicio
+        self.temp_max = temp_max
+        self.alfa = alfa
+        n = len(self.motores)
+        self.prioritario = [motor in prioritarios for motor in self.motores]
+        self.n_prioritarios = sum(1 for p in self.prioritario if p)
+        self.corriente = [0.0] * n     # A, promedio por motor
+        self.limite = [100] * n        # % de par mandado a cada motor
+        self.voltaje = 0.0             # V, promedio (0 = sin leer)
+        self.consumo = 0.0             # A, promedio de la batería
+        self.recortes = 0              # Vueltas con algún motor por debajo de 100%
+
+    def actualizar(self) -> None:
+        """Lee batería y motores y ajusta el límite de par de cada motor."""
+        alfa = self.alfa
+        bateria = self.bateria
+        voltaje = bateria.voltage(MV) / 1000.0
+        self.voltaje = voltaje if self.voltaje == 0.0 else self.voltaje + alfa * (voltaje - self.voltaje)
+        self.consumo += alfa * (bateria.current(AMP) - self.consumo)
+
+        presupuesto = self.presupuesto
+        if self.voltaje < self.v_baja:
+            caida = (self.v_baja - self.voltaje) / (self.v_baja - self.v_critica)
+            presupuesto *= 0.5 if caida > 1.0 else 1.0 - 0.5 * caida
+
+        # Pasada 1: promedios y uso de cada grupo
+        motores = self.motores
+        corriente = self.corriente
+        limite = self.limite
+        prioritario = self.prioritario
+        corriente_motor = self.corriente_motor
+        uso_prioritarios = 0.0
+        uso_satisfechos = 0.0          # Otros motores que no llegan a su límite
+        piden = 0                      # Otros motores en su límite
+        for i in range(len(motores)):
+            c = corriente[i] + alfa * (motores[i].current(AMP) - corriente[i])
+            corriente[i] = c
+            if prioritario[i]:
+                uso_prioritarios += c
+            elif c >= UMBRAL_LIMITADO * limite[i] * corriente_motor / 100:
+                piden += 1
+            else:
+                uso_satisfechos += c
+
+        por_prioritario = presupuesto / self.n_prioritarios if self.n_prioritarios else 0.0
+        if uso_prioritarios > presupuesto:
+            uso_prioritarios = presupuesto
+        reparto = (presupuesto - uso_prioritarios - uso_satisfechos) / (piden if piden else 1)
+        limite_prioritarios = int(100 * por_prioritario / corriente_motor)
+        limite_otros = int(100 * reparto / corriente_motor)
+
+        # Pasada 2: límite de cada motor (con el recorte por temperatura)
+        recorte = False
+        for i in range(len(motores)):
+            pct = limite_prioritarios if prioritario[i] else limite_otros
+            temperatura = motores[i].temperature(CELSIUS)
+            if temperatura > self.temp_inicio:
+                termico = 100 - (100 - LIMITE_MINIMO) * (temperatura - self.temp_inicio) / (self.temp_max - self.temp_inicio)
+                if termico < pct:
+                    pct = int(termico)
+            if pct > 100:
+                pct = 100
+            elif pct < LIMITE_MINIMO:
+                pct = LIMITE_MINIMO
+            pct -= pct % PASO_LIMITE
+            if pct < 100:
+                recorte = True
+            if pct != limite[i]:
+                limite[i] = pct
+                motores[i].set_max_torque(pct, PERCENT)
+        if recorte:
+            self.recortes += 1
@@ -0,0 +1,102 @@
+# ================================================================
+# Núcleo – Forma de la entrada del joystick (tablas precalculadas)
+# ---------------------------------------------------------------
+# Descripción:
+#   Cada eje pasa por una tabla de 201 valores (−100..100) armada al
+#   arrancar, así por vuelta solo hay un índice y enteros:
+#     • zona muerta escalada: dentro de la zona vale 0 y fuera se
+#       reparte de 0 a 100 (sin salto al salir de la zona)
+#     • curva expo: (1 − k)·x + k·x³, con k = EXPO (0 = lineal);
+#       más resolución a baja velocidad y 100% igual al final
+#     • límite de subida: la magnitud crece como máximo ACEL_JOYSTICK
+#       %/s (arranques suaves); bajar o soltar es inmediato
+#   En un stick de dos ejes (avance + strafe) la zona muerta es
+#   radial (ZonaRadial): x² + y² < DEADZONE² vale 0 y fuera el radio
+#   se reescala de DEADZONE..100 a 0..100 conservando la dirección,
+#   con una tabla de ganancias por radio entero; las tablas de cada
+#   eje van entonces sin zona muerta. El radio sale de x² + y² sin
+#   flotantes: una tabla de raíces por r² >> BITS_RAIZ y un paso
+#   entero para ajustarla.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+import math
+
+RADIO_MAX = 142          # Radios de la tabla de ZonaRadial (esquina: √(100² + 100²))
+BITS_ZONA = 10       # Ganancias de ZonaRadial en punto fijo (× 1024)
+BITS_RAIZ = 4        # Tabla de raíces de ZonaRadial: una entrada cada 16 de r²
+
+def tabla_forma(expo: float, deadzone: int = 0) -> tuple:
+    """Tabla de 201 valores: índice = posición del eje + 100."""
+    tabla = []
+    for valor in range(-100, 101):
+        magnitud = abs(valor)
+        if magnitud < deadzone or magnitud == 0:
+            tabla.append(0)
+            continue
+        x = (magnitud - deadzone) / (100 - deadzone)
+        x = (1.0 - expo) * x + expo * x * x * x
+        salida = int(x * 100 + 0.5)
+        if salida < 1:
+            salida = 1          # Fuera de la zona muerta nunca queda quieto
+        tabla.append(salida if valor > 0 else -salida)
+    return tuple(tabla)
+
+class FormaEje:
+    """
+    Forma de un eje: tabla + límite de subida por vuelta.
+    - expo: curva (0 = lineal, 1 = cúbica).
+    - deadzone: zona muerta propia (0 si la aplica un stick radial).
+    - acel: %/s de subida máxima (0 = sin límite); hz: vueltas por segundo.
+    """
+
+    def __init__(self, expo: float, deadzone: int, acel: int, hz: int):
+        self.tabla = tabla_forma(expo, deadzone)
+        self.subida = max(1, acel // hz) if acel else 200   # % por vuelta (200 = sin límite)
+        self.salida = 0
+
+    def aplicar(self, valor: int) -> int:
+        """Posición del eje (−100..100) -> valor con forma (%)."""
+        objetivo = self.tabla[valor + 100]
+        salida = self.salida
+        if objetivo > 0:
+            if salida < 0:
+                salida = 0      # Cambio de sentido: primero suelta
+            if objetivo > salida + self.subida:
+                objetivo = salida + self.subida
+        elif objetivo < 0:
+            if salida > 0:
+                salida = 0
+            if objetivo < salida - self.subida:
+                objetivo = salida - self.subida
+        self.salida = objetivo
+        return objetivo
+
+class ZonaRadial:
+    """
+    Zona muerta radial de un stick de dos ejes: aplicar(x, y) da (0, 0)
+    dentro y, fuera, (x, y) escalado por (r − DZ)/(100 − DZ)·100/r.
+    """
+
+    def __init__(self, deadzone: int):
+        self.deadzone2 = deadzone * deadzone
+        self.ganancias = tuple(((r - deadzone) * 100 << BITS_ZONA) // ((100 - deadzone) * r)
+                               if r > deadzone else 0 for r in range(RADIO_MAX))
+        # ⌊√r²⌋ del inicio de cada tramo de r² (radios < 256: entran en bytes)
+        self.raices = bytes(int(math.sqrt(i << BITS_RAIZ))
+                            for i in range((RADIO_MAX * RADIO_MAX >> BITS_RAIZ) + 1))
+
+    def aplicar(self, x: int, y: int) -> tuple:
+        """Ejes (−100..100) -> ejes reescalados (−100..100)."""
+        r2 = x * x + y * y
+        if r2 < self.deadzone2:
+            return 0, 0
+        r = self.raices[r2 >> BITS_RAIZ]
+        while (r + 1) * (r + 1) <= r2:
+            r += 1                   # Un paso como mucho (más solo si r² < 16)
+        ganancia = self.ganancias[r]
+        x = (x * ganancia >> BITS_ZONA) if x >= 0 else -(-x * ganancia >> BITS_ZONA)
+        y = (y * ganancia >> BITS_ZONA) if y >= 0 else -(-y * ganancia >> BITS_ZONA)
+        return (100 if x > 100 else -100 if x < -100 else x), (100 if y > 100 else -100 if y < -100 else y)
@@ -0,0 +1,85 @@
+# ================================================================
+# Núcleo – Macros de actuadores (secuencias con un botón)
+# ---------------------------------------------------------------
+# Descripción:
+#   Una macro es una tupla de pasos (actuador, valor, ms) del perfil,
+#   p. ej. cerrar pinza, subir la rampa y encender el cepillo. Corre
+#   como máquina de estados: paso() va en su propia tarea y nunca
+#   espera; en cada vuelta revisa si el paso actual terminó y, si sí,
+#   aplica el siguiente en la misma vuelta (los pasos con ms = 0
+#   encadenan sin esperar).
+#     • Un paso termina cuando su actuador dice que llegó (garra y
+#       pinza: el perfil de movimiento terminó) o al pasar 'ms'.
+#     • Si el piloto toca un control de actuador (intervencion()), la
+#       macro se cancela y los actuadores quedan como estaban.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+
+class EjecutorMacros:
+    """
+    Corre una macro a la vez.
+    - macros: {nombre: ((actuador, valor, ms), ...)}.
+    - acciones: {actuador: (aplicar(valor), listo() o None)}; sin
+      listo() el paso dura exactamente 'ms'.
+    - intervencion(): True si el piloto tomó el control.
+    - completadas / canceladas: cuentan las macros terminadas de cada forma.
+    """
+
+    def __init__(self, macros: dict, acciones: dict, reloj_us, intervencion):
+        self.acciones = acciones
+        self.reloj_us = reloj_us
+        self.intervencion = intervencion
+        # Pasos ya resueltos: (aplicar, listo, valor, us)
+        self.macros = {}
+        for nombre, pasos in macros.items():
+            self.macros[nombre] = tuple((acciones[actuador][0], acciones[actuador][1], valor, ms * 1000)
+                                        for actuador, valor, ms in pasos)
+        self.pasos = None       # Macro en curso (None = ninguna)
+        self.nombre = None
+        self.indice = 0
+        self.inicio_us = 0      # Cuándo se aplicó el paso actual
+        self.completadas = 0
+        self.canceladas = 0
+
+    def iniciar(self, nombre: str) -> None:
+        """Empieza la macro 'nombre' (reemplaza la que esté corriendo)."""
+        self.pasos = self.macros[nombre]
+        self.nombre = nombre
+        self.indice = -1
+        self.paso()
+
+    def cancelar(self) -> None:
+        """Deja la macro donde esté; los actuadores conservan su último valor."""
+        if self.pasos is not None:
+            self.pasos = None
+            self.canceladas += 1
+
+    def ejecutando(self) -> bool:
+        return self.pasos is not None
+
+    def paso(self) -> None:
+        """Tarea 'macro': avanza todos los pasos que ya terminaron."""
+        pasos = self.pasos
+        if pasos is None:
+            return
+        if self.indice >= 0 and self.intervencion():
+            self.cancelar()
+            return
+        ahora = self.reloj_us()
+        indice = self.indice
+        while True:
+            if indice >= 0:
+                aplicar, listo, valor, us = pasos[indice]
+                if ahora - self.inicio_us < us and (listo is None or not listo()):
+                    break
+            indice += 1
+            if indice == len(pasos):
+                self.pasos = None
+                self.completadas += 1
+                break
+            pasos[indice][0](pasos[indice][2])
+            self.inicio_us = ahora
+        self.indice = indice
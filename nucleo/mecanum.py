@@ -0,0 +1,122 @@
+# ================================================================
+# Núcleo – Cinemática mecanum (mezcla de ruedas)
+# ---------------------------------------------------------------
+# Descripción:
+#   Orden de ruedas: delantera izq, delantera der, trasera izq, trasera der.
+#   Cada rueda = fila de la matriz · (avance, lateral, giro):
+#       FL = avance + lateral + giro      FR = avance - lateral - giro
+#       BL = avance - lateral + giro      BR = avance + lateral - giro
+#   SIGNO_RUEDAS (perfil) indica qué dirección hay que mandar a cada
+#   motor para que su rueda avance.
+#   Con un LazoVelocidad en 'lazo' (LAZO_CERRADO en el perfil) los %
+#   de cada rueda pasan a ser RPM objetivo y se manda voltaje.
+#   mezclar_campo() recibe avance y lateral en el marco del campo y
+#   los gira por el rumbo con una tabla de senos (sin trigonometría
+#   en cada vuelta).
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+import math
+
+# Filas de la mezcla para FL, FR, BL, BR (sin el signo de cada rueda)
+FILAS_MECANUM = ((1, 1, 1), (1, -1, -1), (1, -1, 1), (1, 1, -1))
+
+# Seno de cada grado entero en punto fijo Q14 (cos(g) = TABLA_SENO[(g + 90) % 360])
+BITS_SENO = 14
+TABLA_SENO = tuple(int(round(math.sin(math.radians(grado)) * (1 << BITS_SENO))) for grado in range(360))
+
+class TrenMecanum:
+    """
+    Tren de cuatro ruedas mecanum mezclado con una sola matriz.
+    - ruedas: (FL, FR, BL, BR) como MotorCacheado.
+    - signos: SIGNO_RUEDAS del perfil, en el mismo orden.
+    - lazo: LazoVelocidad de las cuatro ruedas o None (lazo abierto).
+    """
+
+    def __init__(self, ruedas, signos):
+        self.ruedas = tuple(ruedas)
+        self.signos = tuple(signos)
+        # Matriz 4x3 (aplanada por filas) con el signo de cada rueda ya aplicado
+        self.matriz = tuple(signo * coef
+                            for signo, fila in zip(self.signos, FILAS_MECANUM)
+                            for coef in fila)
+        self.lazo = None
+
+    def mezclar(self, avance: int, lateral: int, giro: int) -> None:
+        """
+        Mueve el robot combinando avance (+ adelante), lateral (+ derecha)
+        y giro (+ horario) en %. Si alguna rueda pasa de 100% se escalan
+        las cuatro por igual para conservar la dirección del movimiento.
+        """
+        m = self.matriz
+        fl = m[0] * avance + m[1] * lateral + m[2] * giro
+        fr = m[3] * avance + m[4] * lateral + m[5] * giro
+        bl = m[6] * avance + m[7] * lateral + m[8] * giro
+        br = m[9] * avance + m[10] * lateral + m[11] * giro
+
+        # Normalizar para que ninguna rueda se sature
+        mayor = max(abs(fl), abs(fr), abs(bl), abs(br))
+        if mayor > 100:
+            fl = int(fl * 100 / mayor)
+            fr = int(fr * 100 / mayor)
+            bl = int(bl * 100 / mayor)
+            br = int(br * 100 / mayor)
+
+        lazo = self.lazo
+        if lazo is not None:
+            lazo.fijar(0, fl)
+            lazo.fijar(1, fr)
+            lazo.fijar(2, bl)
+            lazo.fijar(3, br)
+            lazo.actualizar()
+            return
+        ruedas = self.ruedas
+        ruedas[0].spin(FORWARD, fl, PERCENT)
+        ruedas[1].spin(FORWARD, fr, PERCENT)
+        ruedas[2].spin(FORWARD, bl, PERCENT)
+        ruedas[3].spin(FORWARD, br, PERCENT)
+
+    def mezclar_campo(self, avance: int, lateral: int, giro: int, rumbo: float) -> None:
+        """
+        Como mezclar(), pero avance (+ lejos del piloto) y lateral
+        (+ derecha) son del campo: se giran por 'rumbo' (grados horario
+        desde el frente fijado) al marco del robot.
+        """
+        grado = int(rumbo + 0.5) % 360
+        seno = TABLA_SENO[grado]
+        coseno = TABLA_SENO[(grado + 90) % 360]
+        self.mezclar((lateral * seno + avance * coseno) >> BITS_SENO,
+                     (lateral * coseno - avance * seno) >> BITS_SENO, giro)
+
+    def mover_adelante(self, velocidad: int) -> None:
+        """Mueve el robot hacia adelante a 'velocidad' (%)."""
+        self.mezclar(velocidad, 0, 0)
+
+    def mover_atras(self, velocidad: int) -> None:
+        """Mueve el robot hacia atrás a 'velocidad' (%)."""
+        self.mezclar(-velocidad, 0, 0)
+
+    def girar_izquierda(self, velocidad: int) -> None:
+        """Giro en su lugar hacia la izquierda."""
+        self.mezclar(0, 0, -velocidad)
+
+    def girar_derecha(self, velocidad: int) -> None:
+        """Giro en su lugar hacia la derecha."""
+        self.mezclar(0, 0, velocidad)
+
+    def girarc_izquierda(self, velocidad: int) -> None:
+        """Movimiento lateral (strafe) hacia la izquierda con llantas mecanum."""
+        self.mezclar(0, -velocidad, 0)
+
+    def girarc_derecha(self, velocidad: int) -> None:
+        """Movimiento lateral (strafe) hacia la derecha con llantas mecanum."""
+        self.mezclar(0, velocidad, 0)
+
+    def detener(self) -> None:
+        """Detiene los cuatro motores del tren motriz."""
+        for motor in self.ruedas:
+            motor.stop()
+        if self.lazo is not None:
+            self.lazo.reiniciar()
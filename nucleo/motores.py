@@ -0,0 +1,104 @@
+# ================================================================
+# Núcleo – Motores con comandos por cambio
+# ---------------------------------------------------------------
+# Descripción:
+#   Cada motor se envuelve en MotorCacheado: recuerda el último
+#   comando (dirección, velocidad, unidades, freno) y solo lo manda
+#   al puerto inteligente cuando cambia. crear_motor() arma el Motor
+#   de VEX a partir de una entrada de MOTORES del perfil.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+
+# RPM libres de cada cartucho del perfil (None = motor IQ)
+RPM_CARTUCHO = {"36_1": 100, "18_1": 200, "6_1": 600, None: 120}
+
+class MotorCacheado:
+    """
+    Envoltura de Motor que suprime comandos repetidos.
+    - spin()/stop()/set_velocity() solo llegan al motor si cambian.
+    - 'enviados' y 'suprimidos' cuentan los comandos de cada motor.
+    - Cualquier otro método (velocity(), temperature()...) pasa directo.
+    """
+
+    def __init__(self, motor):
+        self.motor = motor
+        self.ultimo = None      # Último comando enviado: (tipo, dirección, velocidad, unidades)
+        self.vel_fijada = None  # Última velocidad enviada con set_velocity()
+        self.enviados = 0
+        self.suprimidos = 0
+
+    def __getattr__(self, nombre):
+        return getattr(self.motor, nombre)
+
+    def _cambio(self, comando) -> bool:
+        """Registra 'comando' y devuelve True si debe enviarse."""
+        if comando == self.ultimo:
+            self.suprimidos += 1
+            return False
+        self.ultimo = comando
+        self.enviados += 1
+        return True
+
+    def spin(self, direccion, velocidad=None, unidades=None) -> None:
+        """Igual que Motor.spin(); una velocidad negativa invierte la dirección."""
+        if velocidad is None:
+            # Usa la velocidad fijada con set_velocity()
+            if self._cambio(("spin", direccion, self.vel_fijada)):
+                self.motor.spin(direccion)
+            return
+        if velocidad < 0:
+            velocidad = -velocidad
+            direccion = REVERSE if direccion == FORWARD else FORWARD
+        if self._cambio(("spin", direccion, velocidad, unidades)):
+            if unidades is None:
+                self.motor.spin(direccion, velocidad)
+            else:
+                self.motor.spin(direccion, velocidad, unidades)
+
+    def stop(self, modo=None) -> None:
+        """Igual que Motor.stop(); 'modo' es COAST/BRAKE/HOLD o el configurado."""
+        if self._cambio(("stop", modo)):
+            if modo is None:
+                self.motor.stop()
+            else:
+                self.motor.stop(modo)
+
+    def set_velocity(self, velocidad, unidades=None) -> None:
+        """Igual que Motor.set_velocity(), sin reenviar el mismo valor."""
+        fijada = (velocidad, unidades)
+        if fijada == self.vel_fijada:
+            self.suprimidos += 1
+            return
+        self.vel_fijada = fijada
+        self.enviados += 1
+        if unidades is None:
+            self.motor.set_velocity(velocidad)
+        else:
+            self.motor.set_velocity(velocidad, unidades)
+
+    def invalidar(self) -> None:
+        """Olvida el último comando para forzar el siguiente envío."""
+        self.ultimo = None
+        self.vel_fijada = None
+
+def crear_motor(puerto: int, cartucho, invertido: bool) -> MotorCacheado:
+    """
+    Motor de una entrada del perfil: 'cartucho' es "36_1", "18_1" o
+    "6_1" en V5 y None en IQ (sin cartucho).
+    """
+    if cartucho is None:
+        return MotorCacheado(Motor(getattr(Ports, "PORT%d" % puerto), invertido))
+    return MotorCacheado(Motor(getattr(Ports, "PORT%d" % puerto),
+                               getattr(GearSetting, "RATIO_" + cartucho), invertido))
+
+def contar_comandos(motores) -> tuple:
+    """Devuelve (enviados, suprimidos) sumando todos los 'motores'."""
+    enviados = 0
+    suprimidos = 0
+    for motor in motores:
+        enviados += motor.enviados
+        suprimidos += motor.suprimidos
+    return enviados, suprimidos
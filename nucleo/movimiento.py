@@ -0,0 +1,182 @@
+# ================================================================
+# Núcleo – Perfiles de movimiento de los actuadores
+# ---------------------------------------------------------------
+# Descripción:
+#   PerfilMovimiento lleva a un motor a una velocidad (RPM) o a una
+#   posición (grados del eje) calculando el perfil paso a paso, una
+#   vuelta de la tarea a la vez:
+#     • trapecio: la velocidad cambia como máximo 'acel' RPM/s
+#     • curva S (jerk > 0, solo en velocidad): además la aceleración
+#       cambia como máximo 'jerk' RPM/s² y se recorta a tiempo para no
+#       pasarse. En posición el perfil es siempre un trapecio.
+#   En posición el perfil integra su propia referencia: la velocidad
+#   deseada es la que aún permite frenar en la distancia que le falta
+#   (v ≈ √(acel·d/3), 1 RPM = 6 °/s), y al motor se le suma una
+#   corrección por lo que vaya atrasado. Al llegar se manda
+#   stop(freno), p. ej. HOLD para la garra y la pinza. Si el motor no
+#   puede llegar (la pinza cerrando sobre una pieza) y queda trabado
+#   (casi sin velocidad y tomando corriente) durante TIEMPO_TRABADO_S,
+#   el movimiento termina igual ahí, con 'trabado' en True.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+import math
+
+# Modos del perfil
+MODO_QUIETO = 0      # Detenido con 'freno'; no manda nada
+MODO_VELOCIDAD = 1   # Sigue una velocidad objetivo (RPM)
+MODO_POSICION = 2    # Va a una posición objetivo (grados)
+
+KP_REFERENCIA = 0.5  # RPM por grado de atraso del motor respecto a la referencia
+
+# Trabado en posición: el motor no llega al objetivo
+RPM_TRABADO = 2.0          # Menos que esto cuenta como quieto
+CORRIENTE_TRABADO_A = 0.3  # Con al menos esta corriente
+TIEMPO_TRABADO_S = 0.25    # Tanto tiempo seguido termina el movimiento
+
+class PerfilMovimiento:
+    """
+    Perfil incremental de un MotorCacheado.
+    - vel_max: RPM máximas en modo posición.
+    - acel / jerk: límites en RPM/s y RPM/s² (jerk 0 = trapecio; en
+      posición siempre trapecio).
+    - hz: frecuencia de la tarea que llama a paso().
+    - posiciones: {nombre: grados} para ir_a_posicion().
+    - freno: modo de stop() al terminar (None = el configurado).
+    - trabado: True si el último movimiento a posición terminó trabado.
+    """
+
+    def __init__(self, motor, vel_max: float, acel: float, jerk: float, hz: int,
+                 posiciones=None, freno=None, tolerancia: float = 2.0):
+        self.motor = motor
+        self.vel_max = vel_max
+        self.acel = acel
+        self.jerk = jerk
+        self.dt = 1.0 / hz
+        self.hz = hz
+        self.posiciones = posiciones or {}
+        self.freno = freno
+        self.tolerancia = tolerancia      # Grados para dar por alcanzada una posición
+        self.modo = MODO_VELOCIDAD        # La primera vuelta aplica el freno
+        self.objetivo = 0.0               # RPM (velocidad) o grados (posición)
+        self.v = 0.0                      # Velocidad del perfil (RPM)
+        self.a = 0.0                      # Aceleración del perfil (RPM/s)
+        self.referencia = 0.0             # Posición del perfil en modo posición (grados)
+        self.vueltas_trabado = max(1, int(TIEMPO_TRABADO_S * hz))
+        self.quieto = 0                   # Vueltas seguidas trabado junto al objetivo
+        self.trabado = False
+
+    def velocidad(self, rpm: float) -> None:
+        """Sigue 'rpm' (negativa = REVERSE); con 0 frena y queda en 'freno'."""
+        self.modo = MODO_VELOCIDAD
+        self.objetivo = rpm
+
+    def reanudar(self, rpm: float = 0.0) -> None:
+        """El perfil sigue desde 'rpm' (el motor se movió por fuera del perfil)."""
+        self.v = rpm
+        self.a = 0.0
+
+    def ir_a(self, grados: float) -> None:
+        """Va a la posición absoluta 'grados' del eje del motor."""
+        if self.modo != MODO_POSICION:
+            self.referencia = self.motor.position(DEGREES)
+        self.modo = MODO_POSICION
+        self.objetivo = grados
+        self.quieto = 0
+        self.trabado = False
+
+    def ir_a_posicion(self, nombre: str) -> None:
+        """Va a la posición con nombre de 'posiciones' (abierta, cerrada...)."""
+        self.ir_a(self.posiciones[nombre])
+
+    def en_movimiento(self) -> bool:
+        """True mientras el perfil no haya terminado."""
+        return self.modo != MODO_QUIETO
+
+    def paso(self) -> None:
+        """Avanza el perfil un periodo y manda la velocidad al motor."""
+        modo = self.modo
+        if modo == MODO_QUIETO:
+            return
+        v = self.v
+        acel = self.acel
+        if modo == MODO_POSICION:
+            # El perfil avanza sobre su propia referencia, no sobre la medida
+            restante = self.objetivo - self.referencia
+            if -self.tolerancia <= restante <= self.tolerancia and -acel * self.dt <= v <= acel * self.dt:
+                # Referencia en el objetivo: acercar el motor y retener
+                self.referencia = self.objetivo
+                self.v = 0.0
+                self.a = 0.0
+                motor = self.motor
+                error = self.objetivo - motor.position(DEGREES)
+                if -self.tolerancia <= error <= self.tolerancia:
+                    self._terminar()
+                    return
+                if -RPM_TRABADO < motor.velocity(RPM) < RPM_TRABADO and motor.current(AMP) >= CORRIENTE_TRABADO_A:
+                    self.quieto += 1
+                    if self.quieto >= self.vueltas_trabado:
+                        # No llega (p. ej. la pinza apretando una pieza): queda en 'freno' donde está
+                        self.trabado = True
+                        self._terminar()
+                        return
+                else:
+                    self.quieto = 0
+                motor.spin(FORWARD, 1 + round(KP_REFERENCIA * error) if error > 0.0
+                           else -1 + round(KP_REFERENCIA * error), RPM)
+                return
+            # Frenado en tiempo discreto, desde donde quedará tras esta vuelta
+            distancia = abs(restante) - abs(v) * 6.0 * self.dt
+            freno = 3.0 * acel * self.dt
+            deseada = (math.sqrt(freno * freno + 12.0 * acel * distancia) - freno) / 6.0 if distancia > 0.0 else 0.0
+            if deseada > self.vel_max:
+                deseada = self.vel_max
+            if restante < 0.0:
+                deseada = -deseada
+        else:
+            deseada = self.objetivo
+            if deseada == 0.0 and v == 0.0:
+                self._terminar()
+                return
+
+        # Aceleración para alcanzar 'deseada' sin pasar de acel (ni de jerk)
+        falta = deseada - v
+        limite = abs(falta) * self.hz
+        if limite > acel:
+            limite = acel
+        jerk = self.jerk if modo == MODO_VELOCIDAD else 0
+        if jerk:
+            # Aceleración que todavía se puede bajar a 0 antes de llegar
+            suave = math.sqrt(2.0 * jerk * abs(falta))
+            if limite > suave:
+                limite = suave
+        a = limite if falta > 0.0 else -limite
+        if jerk:
+            cambio = jerk * self.dt
+            if a > self.a + cambio:
+                a = self.a + cambio
+            elif a < self.a - cambio:
+                a = self.a - cambio
+        v += a * self.dt
+        if modo == MODO_VELOCIDAD and (v - deseada) * falta > 0.0:
+            v = deseada
+            a = 0.0
+        if modo == MODO_POSICION:
+            self.referencia += 0.5 * (self.v + v) * 6.0 * self.dt
+        self.a = a
+        self.v = v
+        if modo == MODO_POSICION:
+            # Corrige lo que el motor se haya quedado atrás de la referencia
+            v += KP_REFERENCIA * (self.referencia - self.motor.position(DEGREES))
+        self.motor.spin(FORWARD, round(v), RPM)
+
+    def _terminar(self) -> None:
+        self.modo = MODO_QUIETO
+        self.v = 0.0
+        self.a = 0.0
+        if self.freno is None:
+            self.motor.stop()
+        else:
+            self.motor.stop(self.freno)
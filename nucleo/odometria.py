@@ -0,0 +1,97 @@
+# ================================================================
+# Núcleo – Odometría del tren mecanum (encoders + inercial)
+# ---------------------------------------------------------------
+# Descripción:
+#   Estima la pose del robot (x derecha, y adelante en metros; rumbo
+#   horario, 0 = hacia +y desde la salida) vuelta a vuelta:
+#     1. Cinemática directa con el avance de cada rueda desde la
+#        vuelta anterior (grados del encoder · metros por grado):
+#            avance  = (FL + FR + BL + BR) / 4
+#            lateral = (FL − FR − BL + BR) / 4
+#            giro    = (FL − FR + BL − BR) / (4 · (semiancho + semilargo))
+#     2. Con sensor inercial, filtro complementario del rumbo: se
+#        predice con el giro de las ruedas y se corrige una fracción
+#        PESO_INERCIAL hacia el del sensor (las mecanum patinan al
+#        girar; el giroscopio no, pero deriva despacio).
+#     3. La traslación se pasa al campo con el rumbo a mitad de vuelta.
+#   Memoria constante: solo la lectura anterior de cada rueda.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+import math
+
+class Odometria:
+    """
+    Pose incremental del robot a partir de sus cuatro ruedas mecanum.
+    - ruedas / signos: (FL, FR, BL, BR) y SIGNO_RUEDAS del perfil.
+    - inercial: Inertial o None (solo encoders).
+    - peso_inercial: fracción del error de rumbo que se corrige por vuelta.
+    """
+
+    def __init__(self, ruedas, signos, radio: float, semiancho: float, semilargo: float,
+                 inercial=None, peso_inercial: float = 0.1):
+        self.ruedas = tuple(ruedas)
+        metros_por_grado = 2.0 * math.pi * radio / 360.0
+        self.escala = tuple(signo * metros_por_grado for signo in signos)
+        self.factor_giro = 1.0 / (4.0 * (semiancho + semilargo))
+        self.inercial = inercial
+        self.peso_inercial = peso_inercial
+        self.anterior = [0.0] * len(self.ruedas)   # Última lectura de cada encoder (grados)
+        self.reiniciar()
+
+    def reiniciar(self, x: float = 0.0, y: float = 0.0, rumbo: float = 0.0) -> None:
+        """Fija la pose (m, m, grados) y toma las lecturas actuales como referencia."""
+        self.x = x
+        self.y = y
+        self.rumbo = math.radians(rumbo)   # radianes, horario, sin envolver
+        for i in range(len(self.ruedas)):
+            self.anterior[i] = self.ruedas[i].position(DEGREES)
+        self.origen_inercial = None        # Se toma en la primera lectura del sensor
+
+    def actualizar(self) -> None:
+        """Integra el movimiento desde la vuelta anterior."""
+        ruedas = self.ruedas
+        anterior = self.anterior
+        escala = self.escala
+        posicion = ruedas[0].position(DEGREES)
+        fl = (posicion - anterior[0]) * escala[0]
+        anterior[0] = posicion
+        posicion = ruedas[1].position(DEGREES)
+        fr = (posicion - anterior[1]) * escala[1]
+        anterior[1] = posicion
+        posicion = ruedas[2].position(DEGREES)
+        bl = (posicion - anterior[2]) * escala[2]
+        anterior[2] = posicion
+        posicion = ruedas[3].position(DEGREES)
+        br = (posicion - anterior[3]) * escala[3]
+        anterior[3] = posicion
+
+        avance = (fl + fr + bl + br) * 0.25
+        lateral = (fl - fr - bl + br) * 0.25
+        rumbo_previo = self.rumbo
+        rumbo = rumbo_previo + (fl - fr + bl - br) * self.factor_giro
+
+        inercial = self.inercial
+        if inercial is not None and not inercial.is_calibrating():
+            medido = math.radians(inercial.rotation(DEGREES))
+            if self.origen_inercial is None:
+                # El sensor arranca alineado con la pose actual
+                self.origen_inercial = medido - rumbo
+            rumbo += self.peso_inercial * (medido - self.origen_inercial - rumbo)
+
+        medio = 0.5 * (rumbo_previo + rumbo)
+        seno = math.sin(medio)
+        coseno = math.cos(medio)
+        self.x += avance * seno + lateral * coseno
+        self.y += avance * coseno - lateral * seno
+        self.rumbo = rumbo
+
+    def rumbo_grados(self) -> float:
+        """Rumbo estimado en grados 0..360 (horario)."""
+        return math.degrees(self.rumbo) % 360.0
+
+    def pose(self) -> tuple:
+        """(x m, y m, rumbo en grados 0..360)."""
+        return self.x, self.y, self.rumbo_grados()
@@ -0,0 +1,105 @@
+# ================================================================
+# Núcleo – Perfilador de tiempo por subsistema (opcional)
+# ---------------------------------------------------------------
+# Descripción:
+#   Histograma de la duración de cada tarea del planificador, que ya
+#   lee el reloj antes y después de cada una: con PERFILAR el
+#   planificador pasa esa duración a registrar() y sin él no hace
+#   nada más que comparar con None.
+#   Cubetas preasignadas (sin memoria por vuelta):
+#       0..99     10 µs cada una   (0 – 1 ms)
+#       100..118  1 ms cada una    (1 – 20 ms)
+#       119       20 ms o más
+#   El p99 sale del histograma (límite superior de su cubeta).
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+
+CUBETAS_FINAS = 100      # Cubetas de 10 µs
+CUBETAS = 120            # Finas + 19 de 1 ms + la de desborde
+
+class Perfilador:
+    """
+    Duraciones por tarea (en el orden de registro del planificador).
+    - registrar(indice, us): suma una ejecución de la tarea 'indice'.
+    - reporte(): una línea n/min/prom/p99/max por tarea.
+    """
+
+    def __init__(self, nombres):
+        self.nombres = tuple(nombres)
+        n = len(self.nombres)
+        self.histogramas = [[0] * CUBETAS for _ in range(n)]
+        self.cuentas = [0] * n
+        self.sumas = [0] * n
+        self.minimos = [0] * n
+        self.maximos = [0] * n
+
+    def registrar(self, indice: int, duracion_us: int) -> None:
+        if duracion_us < 1000:
+            cubeta = duracion_us // 10
+        else:
+            cubeta = CUBETAS_FINAS - 1 + duracion_us // 1000
+            if cubeta >= CUBETAS:
+                cubeta = CUBETAS - 1
+        self.histogramas[indice][cubeta] += 1
+        n = self.cuentas[indice]
+        if n == 0 or duracion_us < self.minimos[indice]:
+            self.minimos[indice] = duracion_us
+        if duracion_us > self.maximos[indice]:
+            self.maximos[indice] = duracion_us
+        self.cuentas[indice] = n + 1
+        self.sumas[indice] += duracion_us
+
+    def reiniciar(self) -> None:
+        """Borra todas las mediciones."""
+        for indice in range(len(self.nombres)):
+            histograma = self.histogramas[indice]
+            for cubeta in range(CUBETAS):
+                histograma[cubeta] = 0
+            self.cuentas[indice] = 0
+            self.sumas[indice] = 0
+            self.minimos[indice] = 0
+            self.maximos[indice] = 0
+
+    def percentil(self, indice: int, fraccion: float) -> int:
+        """Límite superior (µs) de la cubeta donde cae 'fraccion' de las ejecuciones."""
+        n = self.cuentas[indice]
+        if n == 0:
+            return 0
+        objetivo = n * fraccion
+        acumulado = 0
+        histograma = self.histogramas[indice]
+        for cubeta in range(CUBETAS):
+            acumulado += histograma[cubeta]
+            if acumulado >= objetivo:
+                break
+        limite = (cubeta + 1) * 10 if cubeta < CUBETAS_FINAS else (cubeta - CUBETAS_FINAS + 2) * 1000
+        return limite if limite < self.maximos[indice] else self.maximos[indice]
+
+    def estadisticas(self, indice: int) -> tuple:
+        """(n, min, prom, p99, max) de la tarea 'indice', en µs."""
+        n = self.cuentas[indice]
+        return (n, self.minimos[indice], self.sumas[indice] // n if n else 0,
+                self.percentil(indice, 0.99), self.maximos[indice])
+
+    def reporte(self) -> list:
+        """Una línea por tarea: n y min/prom/p99/max en µs."""
+        lineas = []
+        for indice, nombre in enumerate(self.nombres):
+            lineas.append("%s: n=%d min/prom/p99/max=%d/%d/%d/%d us" % ((nombre,) + self.estadisticas(indice)))
+        return lineas
+
+    def mostrar(self, pantalla, filas: int) -> None:
+        """Escribe prom/p99/max de cada tarea en la pantalla del cerebro (una fila por tarea)."""
+        pantalla.clear_screen()
+        for indice in range(min(len(self.nombres), filas)):
+            n, minimo, promedio, p99, maximo = self.estadisticas(indice)
+            pantalla.set_cursor(indice + 1, 1)
+            pantalla.print("%-10s %d/%d/%d us" % (self.nombres[indice][:10], promedio, p99, maximo))
+
+    def imprimir(self) -> None:
+        """Imprime el reporte en la consola (serial)."""
+        for linea in self.reporte():
+            print(linea)
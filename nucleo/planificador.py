@@ -0,0 +1,153 @@
+# ================================================================
+# Núcleo – Planificador de frecuencia fija (plazos absolutos)
+# ---------------------------------------------------------------
+# Descripción:
+#   Cada subsistema es una Tarea con su propia frecuencia. El
+#   planificador ejecuta las que ya vencieron y duerme hasta el plazo
+#   más cercano, llevando estadísticas de jitter y atrasos por tarea.
+#   Con un Perfilador en 'perfilador' además guarda el histograma de
+#   la duración de cada tarea (ver nucleo/perfilador.py).
+#   dividir() reparte las tareas en varios planificadores para correr
+#   cada grupo en su propio Thread.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+from nucleo.perfilador import Perfilador
+
+class Tarea:
+    """Subsistema periódico registrado en el Planificador."""
+
+    def __init__(self, nombre: str, funcion, periodo_us: int, indice: int = 0):
+        self.nombre = nombre
+        self.indice = indice       # Posición en el planificador (fila del perfilador)
+        self.funcion = funcion
+        self.periodo_us = periodo_us
+        self.proximo_us = 0        # Plazo absoluto de la siguiente ejecución
+        self.ejecuciones = 0
+        self.atrasos = 0           # Veces que terminó ya pasado su siguiente plazo
+        self.saltados = 0          # Ticks descartados por sobrecarga
+        self.jitter_max_us = 0     # Mayor retraso de arranque respecto al plazo
+        self.jitter_suma_us = 0
+        self.duracion_max_us = 0
+
+class Planificador:
+    """
+    Ejecuta cada tarea a su propia frecuencia contra plazos absolutos:
+    el siguiente plazo es 'plazo + periodo', no 'ahora + periodo', así
+    el periodo real no se alarga con el trabajo de cada vuelta.
+    - Si una tarea se atrasa hasta 'max_recuperar' periodos, se pone al
+      día ejecutándose en las vueltas siguientes sin esperar.
+    - Si se atrasa más, descarta esos ticks y conserva la fase.
+    """
+
+    def __init__(self, reloj_us, max_recuperar: int = 1):
+        self.reloj_us = reloj_us
+        self.max_recuperar = max_recuperar
+        self.tareas = []
+        self.atrasos = 0              # Atrasos de todas las tareas
+        self.duracion_vuelta_us = 0   # Duración de la última vuelta con trabajo
+        self.perfilador = None        # Perfilador de duraciones o None (sin costo)
+
+    def agregar(self, nombre: str, funcion, hz: int) -> Tarea:
+        """Registra 'funcion' para ejecutarse 'hz' veces por segundo."""
+        tarea = Tarea(nombre, funcion, 1000000 // hz, len(self.tareas))
+        self.tareas.append(tarea)
+        return tarea
+
+    def iniciar(self) -> None:
+        """Fija el primer plazo de todas las tareas en el instante actual."""
+        ahora = self.reloj_us()
+        for tarea in self.tareas:
+            tarea.proximo_us = ahora
+
+    def paso(self) -> int:
+        """
+        Ejecuta una vez, en orden de registro, las tareas cuyo plazo
+        ya venció. Devuelve el plazo más cercano (µs) de todas ellas.
+        """
+        reloj = self.reloj_us
+        ahora = reloj()
+        inicio = ahora
+        plazo = None
+        perfilador = self.perfilador
+        for tarea in self.tareas:
+            retraso = ahora - tarea.proximo_us
+            if retraso >= 0:
+                tarea.funcion()
+                fin = reloj()
+                tarea.ejecuciones += 1
+                tarea.jitter_suma_us += retraso
+                if retraso > tarea.jitter_max_us:
+                    tarea.jitter_max_us = retraso
+                if fin - ahora > tarea.duracion_max_us:
+                    tarea.duracion_max_us = fin - ahora
+                if perfilador is not None:
+                    perfilador.registrar(tarea.indice, fin - ahora)
+                tarea.proximo_us += tarea.periodo_us
+                if fin >= tarea.proximo_us:
+                    # Sobrecarga: ya venció también el siguiente plazo
+                    tarea.atrasos += 1
+                    self.atrasos += 1
+                    perdidos = (fin - tarea.proximo_us) // tarea.periodo_us + 1
+                    if perdidos > self.max_recuperar:
+                        tarea.saltados += perdidos
+                        tarea.proximo_us += perdidos * tarea.periodo_us
+                ahora = fin
+            if plazo is None or tarea.proximo_us < plazo:
+                plazo = tarea.proximo_us
+        if ahora != inicio:
+            self.duracion_vuelta_us = ahora - inicio
+        return plazo
+
+    def perfilar(self) -> Perfilador:
+        """Empieza a medir la duración de cada tarea ya registrada."""
+        self.perfilador = Perfilador([tarea.nombre for tarea in self.tareas])
+        return self.perfilador
+
+    def dividir(self, grupos) -> list:
+        """
+        Deja aquí las tareas del primer grupo de 'grupos' (y las que no
+        estén en ninguno) y devuelve un Planificador por cada otro grupo
+        que tenga tareas, con el mismo reloj y perfilador.
+        """
+        otros = []
+        for nombres in grupos[1:]:
+            tareas = [tarea for tarea in self.tareas if tarea.nombre in nombres]
+            if not tareas:
+                continue
+            planificador = Planificador(self.reloj_us, self.max_recuperar)
+            planificador.tareas = tareas
+            planificador.perfilador = self.perfilador
+            self.tareas = [tarea for tarea in self.tareas if tarea.nombre not in nombres]
+            otros.append(planificador)
+        return otros
+
+    def esperar(self, plazo_us: int) -> None:
+        """Duerme hasta el plazo absoluto 'plazo_us' (si aún no pasó)."""
+        restante = plazo_us - self.reloj_us()
+        if restante > 0:
+            wait((restante + 999) // 1000, MSEC)
+
+    def ejecutar(self) -> None:
+        """Bucle infinito: ejecutar tareas vencidas y dormir hasta el próximo plazo."""
+        self.iniciar()
+        while True:
+            self.esperar(self.paso())
+
+    def reporte(self) -> list:
+        """Devuelve una línea de estadísticas (jitter/atrasos) por tarea."""
+        lineas = []
+        for tarea in self.tareas:
+            n = tarea.ejecuciones
+            promedio = tarea.jitter_suma_us // n if n else 0
+            lineas.append("%s: %d Hz n=%d jitter prom/max=%d/%d us dur max=%d us atrasos=%d saltados=%d" % (
+                tarea.nombre, 1000000 // tarea.periodo_us, n, promedio,
+                tarea.jitter_max_us, tarea.duracion_max_us, tarea.atrasos, tarea.saltados))
+        return lineas
+
+    def imprimir(self) -> None:
+        """Imprime el reporte en la consola (serial)."""
+        for linea in self.reporte():
+            print(linea)
@@ -0,0 +1,274 @@
+# ================================================================
+# Núcleo – Robot base (cerebro, controlador, motores y tareas)
+# ---------------------------------------------------------------
+# Descripción:
+#   Robot arma desde el perfil lo que comparten los programas:
+#   • Cerebro, reloj y controlador muestreado con sus eventos de
+#     botón (las subclases registran los suyos)
+#   • Un MotorCacheado por entrada de MOTORES (motor_<nombre>)
+#   • Planificador con las tareas en el orden de TAREAS; con HILOS,
+#     cada grupo de GRUPOS_HILOS en su Thread (ver iniciar_hilos())
+#   • Opcionales:
+#       - GRABAR_CONTROL: registro del controlador en la SD
+#       - TELEMETRIA: muestras de motores por la consola o a la SD
+#       - ENERGIA: reparte PRESUPUESTO_A entre los motores
+#         (MOTORES_PRIORITARIOS primero)
+#       - PERFILAR: tiempo por tarea en la pantalla del cerebro
+#       - TABLERO (sin PERFILAR): estado del robot en la pantalla
+#         (ver campos_tablero() y nucleo/tablero.py)
+#   Las subclases arman el tren motriz y los actuadores en
+#   configurar() y declaran sus tareas en tareas(). ejecutar() es el
+#   teleoperado; ejecutar_autonomo() recorre la trayectoria (si hay
+#   'seguidor') con la odometría en la pose de salida.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+from nucleo.control import (ARCHIVO_CONTROL, BOTONES_IQ, BOTONES_V5, EJES_IQ, EJES_V5,
+                            ControlMuestreado, EventosControl, GrabadorControl, cabecera_control)
+from nucleo.energia import GestorEnergia
+from nucleo.motores import RPM_CARTUCHO, contar_comandos, crear_motor
+from nucleo.planificador import Planificador
+from nucleo.tablero import Tablero
+from nucleo.telemetria import ARCHIVO_TELEMETRIA, Telemetria, salida_serial
+
+# Filas y columnas de texto de la pantalla del cerebro
+FILAS_PANTALLA_V5 = 12
+FILAS_PANTALLA_IQ = 5
+COLUMNAS_PANTALLA_V5 = 48
+COLUMNAS_PANTALLA_IQ = 21
+
+class Robot:
+    """
+    Programa de teleoperado armado a partir de un perfil (dict).
+    - motores / nombres_motores: en el orden de MOTORES del perfil.
+    - rpm_motores: {nombre: RPM libres de su cartucho}.
+    - planificador: 'control' primero y luego las tareas de TAREAS.
+    """
+
+    def __init__(self, perfil: dict, trayectoria: bytes = None):
+        self.perfil = perfil
+        self.trayectoria = trayectoria   # Tabla de trayectorias/<robot>.py o None
+        self.iq = perfil["PLATAFORMA"] == "IQ"
+        self.plataforma = 1 if self.iq else 0   # Código de plataforma en los registros binarios
+        self.brain = Brain()
+        self.timer = self.brain.timer
+        self.reloj_us = self.reloj_iq if self.iq else self.reloj_v5
+        botones = BOTONES_IQ if self.iq else BOTONES_V5
+        self.controller = ControlMuestreado(Controller(), EJES_IQ if self.iq else EJES_V5, botones)
+        self.eventos = EventosControl(self.controller, botones, self.reloj_us,
+                                      perfil["LARGO_MS"] * 1000, perfil["DOBLE_MS"] * 1000)
+        self.controller.eventos = self.eventos
+
+        motores = []
+        nombres = []
+        self.rpm_motores = {}
+        for nombre, puerto, cartucho, invertido in perfil["MOTORES"]:
+            motor = crear_motor(puerto, cartucho, invertido)
+            setattr(self, "motor_" + nombre, motor)
+            motores.append(motor)
+            nombres.append(nombre)
+            self.rpm_motores[nombre] = RPM_CARTUCHO[cartucho]
+        self.motores = tuple(motores)
+        self.nombres_motores = tuple(nombres)
+
+        self.deadzone = perfil["DEADZONE"]
+        self.hz_drive = perfil["HZ_DRIVE"]
+        self.seguidor = None
+        self.odometria = None
+        self.configurar(perfil)
+
+        self.energia = None
+        if perfil["ENERGIA"]:
+            self.energia = GestorEnergia(self.motores,
+                                         [getattr(self, "motor_" + nombre) for nombre in perfil["MOTORES_PRIORITARIOS"]],
+                                         self.brain.battery, perfil["PRESUPUESTO_A"], perfil["CORRIENTE_MOTOR_A"],
+                                         perfil["V_BATERIA_BAJA"], perfil["V_BATERIA_CRITICA"],
+                                         perfil["TEMP_INICIO"], perfil["TEMP_MAX"])
+
+        self.planificador = Planificador(self.reloj_us)
+        self.planificador.agregar("control", self.controller.muestrear, self.hz_drive)
+        tareas = self.tareas()
+        for nombre in perfil["TAREAS"]:
+            funcion, hz = tareas[nombre]
+            self.planificador.agregar(nombre, funcion, hz)
+        if self.energia is not None:
+            self.planificador.agregar("energia", self.energia.actualizar, perfil["HZ_ENERGIA"])
+
+        self.telemetria = None
+        self.consola_binaria = False   # True = la consola lleva tramas de telemetría (sin print())
+        if perfil["GRABAR_CONTROL"] and self.brain.sdcard.is_inserted():
+            self.iniciar_grabacion()
+        if perfil["TELEMETRIA"] and (perfil["TELEMETRIA_DESTINO"] == "serial"
+                                     or self.brain.sdcard.is_inserted()):
+            self.iniciar_telemetria(perfil["TELEMETRIA_DESTINO"])
+        self.perfilador = None
+        if perfil["PERFILAR"]:
+            self.iniciar_perfilador()
+        self.tablero = None
+        if perfil["TABLERO"] and self.perfilador is None:
+            self.iniciar_tablero()
+        self.planificadores = [self.planificador]   # Uno por hilo (ver iniciar_hilos())
+        self.hilos = []
+
+    def reloj_v5(self) -> int:
+        """Tiempo del sistema en microsegundos (V5: reloj de alta resolución)."""
+        return self.timer.system_high_res()
+
+    def reloj_iq(self) -> int:
+        """Tiempo del sistema en microsegundos (IQ: a partir de los milisegundos)."""
+        return int(self.timer.time(MSEC) * 1000)
+
+    def configurar(self, perfil: dict) -> None:
+        """Arma el tren motriz y el estado de los actuadores (subclases)."""
+
+    def tareas(self) -> dict:
+        """{nombre: (función, hz)} de cada subsistema que puede ir en TAREAS."""
+        return {}
+
+    def estado_telemetria(self) -> int:
+        """Byte de banderas que acompaña cada muestra de telemetría."""
+        return 0
+
+    def contar_comandos(self) -> tuple:
+        """Devuelve (enviados, suprimidos) sumando todos los motores."""
+        return contar_comandos(self.motores)
+
+    def iniciar_grabacion(self) -> None:
+        """Graba el controlador en ARCHIVO_CONTROL (se vuelca a la SD a 5 Hz)."""
+        brain = self.brain
+        brain.sdcard.savefile(ARCHIVO_CONTROL, bytearray(cabecera_control(
+            self.plataforma, len(self.controller.ejes), 1000000 // self.hz_drive)))
+        self.controller.grabador = GrabadorControl(
+            lambda bloque: brain.sdcard.appendfile(ARCHIVO_CONTROL, bloque), self.reloj_us)
+        self.planificador.agregar("grabador", self.controller.grabador.volcar, 5)
+
+    def terminar_grabacion(self) -> None:
+        """Deja de grabar el controlador y vuelca lo que quedó en el anillo."""
+        grabador = self.controller.grabador
+        if grabador is not None:
+            self.controller.grabador = None
+            grabador.cerrar()
+
+    def iniciar_telemetria(self, destino: str = "serial") -> None:
+        """
+        Muestrea a HZ_DRIVE / TELEMETRIA_DECIMAR y envía a 'destino'
+        ("serial" o "sd"). Sin flujo binario en la consola va a la SD;
+        con él, la consola queda solo para las tramas.
+        """
+        brain = self.brain
+        self.telemetria = Telemetria(self.motores, self.planificador, brain.battery,
+                                     self.estado_telemetria, self.plataforma)
+        cabecera = self.telemetria.nombres(self.nombres_motores)
+        escribir = salida_serial() if destino == "serial" else None
+        if escribir is None:
+            brain.sdcard.savefile(ARCHIVO_TELEMETRIA, bytearray(cabecera))
+            self.telemetria.escribir = lambda bloque: brain.sdcard.appendfile(ARCHIVO_TELEMETRIA, bloque)
+        else:
+            escribir(cabecera)
+            self.telemetria.escribir = escribir
+            self.consola_binaria = True
+        self.planificador.agregar("telemetria", self.telemetria.muestrear,
+                                  self.hz_drive // self.perfil["TELEMETRIA_DECIMAR"])
+        self.planificador.agregar("tele_envio", self.telemetria.volcar,
+                                  self.perfil["HZ_TELEMETRIA_ENVIO"])
+
+    def iniciar_perfilador(self) -> None:
+        """Mide cada tarea y muestra prom/p99/max en la pantalla a HZ_PERFILAR."""
+        self.planificador.agregar("perfil", self.mostrar_perfil, self.perfil["HZ_PERFILAR"])
+        self.perfilador = self.planificador.perfilar()
+
+    def mostrar_perfil(self) -> None:
+        """Tarea del perfilador: refresca la pantalla del cerebro."""
+        self.perfilador.mostrar(self.brain.screen, FILAS_PANTALLA_IQ if self.iq else FILAS_PANTALLA_V5)
+
+    def iniciar_tablero(self) -> None:
+        """Dibuja las etiquetas del tablero y agrega la tarea 'tablero' a HZ_TABLERO."""
+        if self.iq:
+            self.tablero = Tablero(self.brain.screen, self.campos_tablero(),
+                                   FILAS_PANTALLA_IQ, COLUMNAS_PANTALLA_IQ, 1)
+        else:
+            self.tablero = Tablero(self.brain.screen, self.campos_tablero(),
+                                   FILAS_PANTALLA_V5, COLUMNAS_PANTALLA_V5, 2)
+        self.tablero.dibujar_fijo()
+        self.planificador.agregar("tablero", self.tablero.actualizar, self.perfil["HZ_TABLERO"])
+
+    def campos_tablero(self) -> list:
+        """
+        (etiqueta, valor(), formato) de cada campo del tablero: batería,
+        duración de la vuelta y atrasos; las subclases agregan los suyos.
+        Los valores van redondeados para no redibujar por ruido.
+        """
+        bateria = self.brain.battery
+        planificador = self.planificador
+        return [
+            ("Bat", lambda: int(bateria.voltage(MV)) // 100 / 10, "%.1f V"),
+            ("Vuelta", lambda: planificador.duracion_vuelta_us // 100 / 10, "%.1f ms"),
+            ("Atrasos", lambda: planificador.atrasos, "%d"),
+        ]
+
+    def campos_temperatura(self) -> list:
+        """Un campo por motor con su temperatura (°C)."""
+        return [(nombre[:8], lambda motor=motor: int(motor.temperature(CELSIUS)), "%d C")
+                for nombre, motor in zip(self.nombres_motores, self.motores)]
+
+    def temperatura_maxima(self) -> int:
+        """La temperatura (°C) del motor más caliente."""
+        return max(int(motor.temperature(CELSIUS)) for motor in self.motores)
+
+    def iniciar_hilos(self) -> None:
+        """
+        Reparte las tareas según GRUPOS_HILOS: el primer grupo (el del
+        drive) queda en self.planificador para este hilo y cada otro
+        grupo corre su planificador en un Thread. Los hilos del cerebro
+        son cooperativos (solo cambian en wait()), así cada tarea ve el
+        estado compartido entero; cada campo tiene un solo escritor:
+          - foto del controlador y toggles de los eventos: 'control'
+          - pose de la odometría: 'odometria'
+          - comandos de cada motor: la tarea de su subsistema
+        """
+        otros = self.planificador.dividir(self.perfil["GRUPOS_HILOS"])
+        self.planificadores = [self.planificador] + otros
+        self.hilos = [Thread(planificador.ejecutar) for planificador in otros]
+
+    def ejecutar(self) -> None:
+        """
+        Bucle teleoperado: el planificador ejecuta cada subsistema a su
+        frecuencia (HZ_*) contra plazos absolutos para que el periodo no
+        se desvíe. Con HILOS, cada grupo de tareas en su propio hilo.
+        """
+        if self.perfil["HILOS"]:
+            self.iniciar_hilos()
+        self.planificador.ejecutar()
+
+    def planificador_autonomo(self) -> Planificador:
+        """Planificador del autónomo: 'autonomo' y las tareas de TAREAS menos 'drive'."""
+        planificador = Planificador(self.reloj_us)
+        planificador.agregar("autonomo", self.seguidor.paso, self.perfil["HZ_AUTONOMO"])
+        tareas = self.tareas()
+        for nombre in self.perfil["TAREAS"]:
+            if nombre != "drive":
+                funcion, hz = tareas[nombre]
+                planificador.agregar(nombre, funcion, hz)
+        if self.energia is not None:
+            planificador.agregar("energia", self.energia.actualizar, self.perfil["HZ_ENERGIA"])
+        return planificador
+
+    def ejecutar_autonomo(self) -> None:
+        """Autónomo: recorre la trayectoria paso a paso y termina al acabarla."""
+        if self.seguidor is None:
+            return
+        self.seguidor.reiniciar()
+        if self.odometria is not None:
+            self.odometria.reiniciar()
+        planificador = self.planificador_autonomo()
+        if self.perfilador is not None:
+            planificador.perfilar()
+        planificador.iniciar()
+        while not self.seguidor.terminado:
+            planificador.esperar(planificador.paso())
+        if planificador.perfilador is not None and not self.consola_binaria:
+            # Fin del autónomo: el reporte completo a la consola (si no
+            # lleva telemetría; el resumen sigue en la pantalla)
+            planificador.perfilador.imprimir()
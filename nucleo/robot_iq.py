@@ -0,0 +1,94 @@
+# ================================================================
+# Núcleo – Robot IQ (diferencial + cepillo)
+# ---------------------------------------------------------------
+# Descripción:
+#   • Conducción por curvatura (o arcade si CURVATURA es False):
+#       - AxisA: avance/retroceso
+#       - AxisB: curvatura izquierda/derecha (giro en arcade)
+#       - BOTON_GIRO_RAPIDO (RUp) o avance bajo GIRO_RAPIDO_UMBRAL:
+#         giro en el lugar
+#     Zona muerta radial en el stick, curva expo y subida limitada
+#     por tablas (ver nucleo/entrada.py); si un lado satura se
+#     conserva la proporción entre lados (ver nucleo/diferencial.py)
+#   • Cepillo:
+#       - ButtonFDown: gira hacia adelante
+#       - ButtonFUp:   gira hacia atrás
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+from nucleo.diferencial import TrenDiferencial
+from nucleo.entrada import FormaEje, ZonaRadial
+from nucleo.robot import Robot
+
+class RobotIQ(Robot):
+    """Robot IQ con tren diferencial de 4 motores y cepillo."""
+
+    def configurar(self, perfil: dict) -> None:
+        self.tren = TrenDiferencial([getattr(self, "motor_" + nombre) for nombre in perfil["LADO_IZQUIERDO"]],
+                                    [getattr(self, "motor_" + nombre) for nombre in perfil["LADO_DERECHO"]])
+        self.vel_cepillo = perfil["VEL_CEPILLO"]
+        self.zona_stick = ZonaRadial(self.deadzone)
+        hz = perfil["HZ_DRIVE"]
+        self.forma_avance = FormaEje(perfil["EXPO_AVANCE"], 0, perfil["ACEL_JOYSTICK"], hz)
+        self.forma_giro = FormaEje(perfil["EXPO_GIRO"], 0, perfil["ACEL_JOYSTICK"], hz)
+        self.curvatura = perfil["CURVATURA"]
+        self.giro_rapido_umbral = perfil["GIRO_RAPIDO_UMBRAL"]
+        self.boton_giro_rapido = getattr(self.controller, perfil["BOTON_GIRO_RAPIDO"])
+
+    def tareas(self) -> dict:
+        perfil = self.perfil
+        return {
+            "drive":   (self.control_drive,     perfil["HZ_DRIVE"]),
+            "cepillo": (self.controlar_cepillo, perfil["HZ_CEPILLO"]),
+        }
+
+    def estado_telemetria(self) -> int:
+        """Banderas para la telemetría: bit 1 cepillo girando (FDown/FUp)."""
+        ultimo = self.motor_cepillo.ultimo
+        return 2 if ultimo is not None and ultimo[0] == "spin" else 0
+
+    def campos_tablero(self) -> list:
+        """Los de Robot, cepillo y la temperatura del motor más caliente (la pantalla es chica)."""
+        return super().campos_tablero() + [
+            ("Cepillo", lambda: "ON" if self.estado_telemetria() & 2 else "OFF", "%s"),
+            ("T max", self.temperatura_maxima, "%d C"),
+        ]
+
+    def control_drive(self) -> None:
+        """
+        Conducción por curvatura (arcade sin CURVATURA):
+          - AxisA: avance (+) / retroceso (–)
+          - AxisB: giro derecha (+) / izquierda (–)
+        Ambos ejes están en el mismo stick: zona muerta radial y luego
+        la tabla de forma de cada uno.
+        """
+        forward = self.controller.axisA.position()
+        turn    = self.controller.axisB.position()
+
+        # Aplicar zona muerta (radial, reescalada)
+        turn, forward = self.zona_stick.aplicar(turn, forward)
+
+        forward = self.forma_avance.aplicar(forward)
+        turn = self.forma_giro.aplicar(turn)
+        if not self.curvatura:
+            self.tren.arcade(forward, turn)
+            return
+        giro_rapido = (self.boton_giro_rapido.pressing()
+                       or -self.giro_rapido_umbral < forward < self.giro_rapido_umbral)
+        self.tren.curvatura(forward, turn, giro_rapido)
+
+    def controlar_cepillo(self) -> None:
+        """
+        Control del motor de cepillo:
+          - ButtonFDown: gira en FORWARD a VEL_CEPILLO
+          - ButtonFUp:   gira en REVERSE a VEL_CEPILLO
+          - Ninguno:     se detiene
+        """
+        if self.controller.buttonFDown.pressing():
+            self.motor_cepillo.spin(FORWARD, self.vel_cepillo, PERCENT)
+        elif self.controller.buttonFUp.pressing():
+            self.motor_cepillo.spin(REVERSE, self.vel_cepillo, PERCENT)
+        else:
+            self.motor_cepillo.stop()
@@ -0,0 +1,396 @@
+# ================================================================
+# Núcleo – Robot V5 (mecanum + rampa, cepillo, garra y pinza)
+# ---------------------------------------------------------------
+# Descripción:
+#   • Conducción holonómica (mezcla mecanum):
+#       - Axis3: avance/retroceso
+#       - Axis4: strafe lateral (izquierda/derecha)
+#       - Axis1: giro (se combina con avance y strafe)
+#     Zona muerta radial en el stick izquierdo, curva expo y subida
+#     limitada por tablas (ver nucleo/entrada.py)
+#   • Lazo cerrado (si LAZO_CERRADO): cada rueda sigue su velocidad con
+#     feedforward + PID y se manda voltaje (ver nucleo/velocidad.py)
+#   • Campo centrado (BOTON_CAMPO, ver nucleo/mecanum.py):
+#       - Presión: alterna el modo; Axis3/Axis4 pasan a ser adelante /
+#         derecha del campo usando el rumbo de la odometría
+#       - Presión larga: el frente actual pasa a ser "adelante" y
+#         deja el modo encendido
+#   • Strafe forzado (si STRAFE_BOTONES > 0):
+#       - LEFT / RIGHT: strafe a STRAFE_BOTONES %
+#   • Rampa (acelera y frena con ACEL_RAMPA / JERK_RAMPA):
+#       - Axis2: modo manual (cuando el modo AUTO está apagado)
+#       - Botón B: alterna modo rampa AUTO (RPM_RAMPA_AUTO) / MANUAL
+#   • Cepillo:
+#       - Botón A: alterna encendido/apagado
+#   • Atascos (cepillo encendido y rampa en AUTO, ver nucleo/atascos.py):
+#       - Motor trabado: reversa ATASCO_REVERSA_MS y vuelve a girar
+#         (la rampa, con su perfil desde la velocidad medida)
+#       - ATASCO_MAX_SEGUIDOS seguidos: apaga ese motor y vibra el control
+#   • Garra:
+#       - L1 abre (FORWARD), R1 cierra (REVERSE) con retención
+#   • Pinza:
+#       - L2 abre (FORWARD), R2 cierra (REVERSE) con retención
+#   • Posiciones de garra y pinza (BOTONES_POSICIONES):
+#       - Up: abierta, Down: cerrada (Pequeños: LEFT transporte)
+#     Garra y pinza se mueven con perfil (ACEL_* / JERK_*) y quedan en HOLD.
+#   • Macros (BOTONES_MACROS, X: anotar): secuencias de MACROS (garra,
+#     pinza, rampa, cepillo) sin frenar el bucle; tocar un botón de
+#     BOTONES_CANCELAR_MACRO o Axis2 la cancela (ver nucleo/macros.py).
+#     Cada botón de macro o de posición tiene una sola función.
+#   • Odometría: pose (x, y, rumbo) con los encoders de las ruedas y,
+#     si hay PUERTO_INERCIAL, el rumbo del sensor inercial
+#     (ver nucleo/odometria.py)
+#   • Autónomo: SeguidorTrayectoria recorre la tabla de trayectorias/
+#     con el tren mecanum, corrigiendo con la odometría hacia la pose
+#     de cada paso; sus banderas encienden cepillo y rampa AUTO.
+#   Los toggles (A, B) y las posiciones se registran como eventos de
+#   botón (EventosControl); la garra y la pinza leen L1/R1/L2/R2 de la foto.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+from nucleo.atascos import ATASCO_RENDIDO, ATASCO_REVERSA, DetectorAtasco
+from nucleo.autonomo import BANDERA_CEPILLO, BANDERA_RAMPA, SeguidorTrayectoria
+from nucleo.control import EVENTO_LARGO, EVENTO_PRESIONADO
+from nucleo.entrada import FormaEje, ZonaRadial
+from nucleo.macros import EjecutorMacros
+from nucleo.mecanum import TrenMecanum
+from nucleo.movimiento import MODO_VELOCIDAD, PerfilMovimiento
+from nucleo.odometria import Odometria
+from nucleo.robot import Robot
+from nucleo.velocidad import LazoVelocidad
+
+class RobotV5(Robot):
+    """Robot V5 con tren mecanum y los actuadores de Grandes y Pequeños."""
+
+    def configurar(self, perfil: dict) -> None:
+        self.tren = TrenMecanum([getattr(self, "motor_" + nombre) for nombre in perfil["RUEDAS"]],
+                                perfil["SIGNO_RUEDAS"])
+        if perfil["LAZO_CERRADO"]:
+            self.tren.lazo = LazoVelocidad(self.tren.ruedas, perfil["RPM_RUEDA"], perfil["MV_MAX_RUEDA"],
+                                           perfil["KV_RUEDA"], perfil["KS_RUEDA"], perfil["KP_RUEDA"],
+                                           perfil["KI_RUEDA"], perfil["KD_RUEDA"])
+        self.inercial = None
+        if perfil["PUERTO_INERCIAL"] is not None:
+            self.inercial = Inertial(getattr(Ports, "PORT%d" % perfil["PUERTO_INERCIAL"]))
+            self.inercial.calibrate()   # ~2 s; mientras tanto la odometría usa solo encoders
+        self.odometria = Odometria(self.tren.ruedas, perfil["SIGNO_RUEDAS"], perfil["RADIO_RUEDA"],
+                                   perfil["SEMIANCHO"], perfil["SEMILARGO"], self.inercial,
+                                   perfil["PESO_INERCIAL"])
+        self.rpm_rampa_auto = perfil["RPM_RAMPA_AUTO"]
+        self.sentido_rampa = perfil["SENTIDO_RAMPA"]
+        self.vel_garra = perfil["VEL_GARRA"]
+        self.vel_pinza = perfil["VEL_PINZA"]
+        self.vel_cepillo = perfil["VEL_CEPILLO"]
+        self.strafe_botones = perfil["STRAFE_BOTONES"]
+
+        # Forma de los ejes del drive (tablas de 201 valores)
+        self.zona_izquierda = ZonaRadial(self.deadzone)
+        hz = perfil["HZ_DRIVE"]
+        self.forma_avance = FormaEje(perfil["EXPO_AVANCE"], 0, perfil["ACEL_JOYSTICK"], hz)
+        self.forma_lateral = FormaEje(perfil["EXPO_AVANCE"], 0, perfil["ACEL_JOYSTICK"], hz)
+        self.forma_giro = FormaEje(perfil["EXPO_GIRO"], self.deadzone, perfil["ACEL_JOYSTICK"], hz)
+
+        # Perfiles de movimiento de los actuadores (velocidades en RPM)
+        self.rpm_rampa = self.rpm_motores["rampa"]
+        self.perfil_rampa = PerfilMovimiento(self.motor_rampa, self.rpm_rampa, perfil["ACEL_RAMPA"],
+                                             perfil["JERK_RAMPA"], perfil["HZ_RAMPA"])
+        self.perfil_garra = PerfilMovimiento(self.motor_garra, self.vel_garra * self.rpm_motores["garra"] / 100,
+                                             perfil["ACEL_GARRA"], perfil["JERK_GARRA"], perfil["HZ_GARRA"],
+                                             perfil["POSICIONES_GARRA"], HOLD)
+        self.perfil_pinza = PerfilMovimiento(self.motor_pinza, self.vel_pinza * self.rpm_motores["pinza"] / 100,
+                                             perfil["ACEL_PINZA"], perfil["JERK_PINZA"], perfil["HZ_PINZA"],
+                                             perfil["POSICIONES_PINZA"], HOLD)
+
+        # Detectores de atascos (ventanas en vueltas de cada tarea)
+        self.detector_cepillo = self.crear_detector("cepillo", perfil["HZ_CEPILLO"])
+        self.detector_rampa = self.crear_detector("rampa", perfil["HZ_RAMPA"])
+        self.detectores = (self.detector_cepillo, self.detector_rampa)
+        self.vel_reversa_atasco = perfil["ATASCO_VEL_REVERSA"]
+        self.rampa_en_reversa = False
+
+        # Estado de los toggles
+        self.modo_rampa_auto = False   # True = AUTO (RPM fija); False = manual con Axis2
+        self.cepillo_on = False        # Estado ON/OFF del cepillo
+        self.campo_centrado = perfil["CAMPO_CENTRADO"]   # True = joystick en el marco del campo
+
+        if self.trayectoria is not None:
+            self.seguidor = SeguidorTrayectoria(self.tren, self.trayectoria, self.aplicar_banderas,
+                                                self.odometria, perfil["KP_POSICION"],
+                                                perfil["KP_RUMBO"], perfil["CORRECCION_MAX"])
+
+        # Macros: cada actuador con su acción y, si tiene, cuándo llegó
+        acciones = {
+            "garra":   (self.perfil_garra.ir_a_posicion, lambda: not self.perfil_garra.en_movimiento()),
+            "pinza":   (self.perfil_pinza.ir_a_posicion, lambda: not self.perfil_pinza.en_movimiento()),
+            "rampa":   (self.fijar_rampa_auto, None),
+            "cepillo": (self.fijar_cepillo, None),
+            "esperar": (lambda valor: None, None),
+        }
+        self.macros = EjecutorMacros(perfil["MACROS"], acciones, self.reloj_us, self.intervencion_macro)
+        self.mascara_manual = 0
+        for boton in perfil["BOTONES_CANCELAR_MACRO"]:
+            self.mascara_manual |= 1 << self.eventos.bits[boton]
+
+        # Eventos de botón
+        eventos = self.eventos
+        eventos.registrar("buttonB", EVENTO_PRESIONADO, self.toggle_rampa_mode)
+        eventos.registrar("buttonA", EVENTO_PRESIONADO, self.toggle_cepillo)
+        eventos.registrar(perfil["BOTON_CAMPO"], EVENTO_PRESIONADO, self.toggle_campo)
+        eventos.registrar(perfil["BOTON_CAMPO"], EVENTO_LARGO, self.fijar_frente)
+        # Un botón de macro no puede hacer otra cosa: la macro pelearía con ella
+        ocupados = {"buttonA", "buttonB", perfil["BOTON_CAMPO"]}
+        for boton, nombre in perfil["BOTONES_POSICIONES"]:
+            if boton in ocupados:
+                raise ValueError("%s ya tiene otra función (BOTONES_POSICIONES)" % boton)
+            ocupados.add(boton)
+            eventos.registrar(boton, EVENTO_PRESIONADO, lambda nombre=nombre: self.ir_a_posicion(nombre))
+        for boton, nombre in perfil["BOTONES_MACROS"]:
+            if boton in ocupados:
+                raise ValueError("%s ya tiene otra función (BOTONES_MACROS)" % boton)
+            ocupados.add(boton)
+            eventos.registrar(boton, EVENTO_PRESIONADO, lambda nombre=nombre: self.macros.iniciar(nombre))
+
+    def crear_detector(self, nombre: str, hz: int) -> DetectorAtasco:
+        """DetectorAtasco del motor 'nombre' con los ATASCO_* del perfil."""
+        perfil = self.perfil
+        return DetectorAtasco(nombre, getattr(self, "motor_" + nombre),
+                              perfil["ATASCO_FRACCION_RPM"] * self.rpm_motores[nombre],
+                              perfil["ATASCO_CORRIENTE_A"], perfil["ATASCO_VENTANA_MS"] * hz // 1000,
+                              perfil["ATASCO_REVERSA_MS"] * hz // 1000, perfil["ATASCO_GRACIA_MS"] * hz // 1000,
+                              perfil["ATASCO_MAX_SEGUIDOS"])
+
+    def tareas(self) -> dict:
+        perfil = self.perfil
+        return {
+            "odometria": (self.odometria.actualizar, perfil["HZ_ODOMETRIA"]),
+            "macro":   (self.macros.paso,           perfil["HZ_MACRO"]),
+            "drive":   (self.tarea_drive,           perfil["HZ_DRIVE"]),
+            "rampa":   (self.tarea_rampa,           perfil["HZ_RAMPA"]),
+            "cepillo": (self.girar_cepillo,         perfil["HZ_CEPILLO"]),
+            "garra":   (self.control_garra_gradual, perfil["HZ_GARRA"]),
+            "pinza":   (self.control_pinza_gradual, perfil["HZ_PINZA"]),
+        }
+
+    def estado_telemetria(self) -> int:
+        """
+        Banderas para la telemetría: bit 0 rampa en AUTO, bit 1 cepillo
+        encendido, bit 2 campo centrado, bit 3 recuperando un atasco,
+        bit 4 macro en curso.
+        """
+        return ((1 if self.modo_rampa_auto else 0) | (2 if self.cepillo_on else 0)
+                | (4 if self.campo_centrado else 0)
+                | (8 if self.detector_cepillo.en_reversa() or self.detector_rampa.en_reversa() else 0)
+                | (16 if self.macros.ejecutando() else 0))
+
+    def campos_tablero(self) -> list:
+        """Los de Robot, modo de la rampa, cepillo y la temperatura de cada motor."""
+        return super().campos_tablero() + [
+            ("Rampa", lambda: "AUTO" if self.modo_rampa_auto else "MANUAL", "%s"),
+            ("Cepillo", lambda: "ON" if self.cepillo_on else "OFF", "%s"),
+        ] + self.campos_temperatura()
+
+    def contar_atascos(self) -> int:
+        """Atascos detectados en cepillo y rampa desde que arrancó el programa."""
+        return self.detector_cepillo.atascos + self.detector_rampa.atascos
+
+    def aplicar_banderas(self, banderas: int) -> None:
+        """Estado de cepillo y rampa pedido por un paso del autónomo."""
+        self.cepillo_on = (banderas & BANDERA_CEPILLO) != 0
+        self.modo_rampa_auto = (banderas & BANDERA_RAMPA) != 0
+
+    # ------------------------------------------------
+    # Macros
+    # ------------------------------------------------
+    def intervencion_macro(self) -> bool:
+        """True si el piloto toca un botón de BOTONES_CANCELAR_MACRO o mueve Axis2."""
+        controller = self.controller
+        return ((controller.botones & self.mascara_manual) != 0
+                or abs(controller.axis2.position()) >= self.deadzone)
+
+    def fijar_rampa_auto(self, encendida: bool) -> None:
+        """Paso de macro: rampa en AUTO (True) o MANUAL (False)."""
+        self.modo_rampa_auto = encendida
+
+    def fijar_cepillo(self, encendido: bool) -> None:
+        """Paso de macro: cepillo encendido o apagado."""
+        self.cepillo_on = encendido
+
+    # ------------------------------------------------
+    # Conducción
+    # ------------------------------------------------
+    def control_drive(self) -> None:
+        """
+        Control principal de conducción (holonómica):
+          - Axis3: avance (+) / retroceso (–)
+          - Axis4: strafe derecha (+) / izquierda (–)
+          - Axis1: giro derecha (+) / izquierda (–)
+        Cada eje pasa por su tabla de forma (zona muerta, expo y subida
+        limitada). Los tres se combinan en una sola mezcla mecanum (en
+        campo centrado, avance y strafe se giran por el rumbo); si no
+        hay entradas activas, detiene el tren motriz.
+        """
+        controller = self.controller
+        axis_forward = controller.axis3.position()  # Adelante / Atrás
+        axis_strafe  = controller.axis4.position()  # Izquierda / Derecha (strafe)
+
+        # Zona muerta radial del stick izquierdo (reescalada)
+        axis_strafe, axis_forward = self.zona_izquierda.aplicar(axis_strafe, axis_forward)
+        axis_forward = self.forma_avance.aplicar(axis_forward)
+        axis_strafe = self.forma_lateral.aplicar(axis_strafe)
+        axis_turn = self.forma_giro.aplicar(controller.axis1.position())   # Giro
+
+        if axis_forward or axis_strafe or axis_turn:
+            if self.campo_centrado:
+                self.tren.mezclar_campo(axis_forward, axis_strafe, axis_turn,
+                                        self.odometria.rumbo_grados())
+            else:
+                self.tren.mezclar(axis_forward, axis_strafe, axis_turn)
+        else:
+            self.tren.detener()
+
+    def toggle_campo(self) -> None:
+        """Alterna la conducción centrada en el campo (BOTON_CAMPO presionado)."""
+        self.campo_centrado = not self.campo_centrado
+
+    def fijar_frente(self) -> None:
+        """El rumbo actual pasa a ser 'adelante' del campo (BOTON_CAMPO sostenido)."""
+        odometria = self.odometria
+        odometria.reiniciar(odometria.x, odometria.y, 0.0)
+        self.campo_centrado = True
+
+    def tarea_drive(self) -> None:
+        """
+        Movimiento base. Con STRAFE_BOTONES, LEFT/RIGHT fuerzan strafe
+        a esa velocidad (útil para ajustes finos) y reemplazan al joystick.
+        """
+        if self.strafe_botones:
+            if self.controller.buttonLeft.pressing():
+                self.tren.girarc_izquierda(self.strafe_botones)
+                return
+            if self.controller.buttonRight.pressing():
+                self.tren.girarc_derecha(self.strafe_botones)
+                return
+        self.control_drive()
+
+    # ------------------------------------------------
+    # Actuadores (Rampa, Garra, Pinza, Cepillo)
+    # ------------------------------------------------
+    def control_rampa(self) -> None:
+        """
+        Control MANUAL de la rampa con Axis2.
+        - Aplica DEADZONE para evitar movimientos involuntarios.
+        - Velocidad proporcional al joystick; SENTIDO_RAMPA elige hacia
+          dónde gira con Axis2 positivo.
+        """
+        value = self.controller.axis2.position()
+        if abs(value) < self.deadzone:
+            self.perfil_rampa.velocidad(0)
+        else:
+            self.perfil_rampa.velocidad(value * self.sentido_rampa * self.rpm_rampa / 100)
+        self.perfil_rampa.paso()
+
+    def aplicar_rampa_auto(self) -> None:
+        """
+        Control AUTO de la rampa: sube con perfil a RPM_RAMPA_AUTO en
+        sentido FORWARD. Si se atasca, el perfil sigue desde la velocidad
+        medida (el motor trabado no va a la del perfil) y hace la reversa
+        y la vuelta a RPM_RAMPA_AUTO con ACEL_RAMPA; si se rinde, pasa a
+        MANUAL desde la velocidad medida.
+        """
+        accion = self.detector_rampa.vigilar()
+        if accion == ATASCO_REVERSA:
+            if not self.rampa_en_reversa:
+                self.rampa_en_reversa = True
+                self.perfil_rampa.reanudar(self.motor_rampa.velocity(RPM))
+            self.perfil_rampa.velocidad(-self.vel_reversa_atasco * self.rpm_rampa / 100)
+            self.perfil_rampa.paso()
+            return
+        self.rampa_en_reversa = False
+        if accion == ATASCO_RENDIDO:
+            self.modo_rampa_auto = False
+            self.controller.rumble("---")
+            self.perfil_rampa.reanudar(self.motor_rampa.velocity(RPM))
+            self.control_rampa()
+            return
+        self.perfil_rampa.velocidad(self.rpm_rampa_auto)
+        self.perfil_rampa.paso()
+
+    def toggle_rampa_mode(self) -> None:
+        """Alterna entre modo de rampa AUTO/MANUAL (botón B presionado)."""
+        self.modo_rampa_auto = not self.modo_rampa_auto
+
+    def tarea_rampa(self) -> None:
+        """Aplica el modo rampa AUTO/MANUAL."""
+        if self.modo_rampa_auto:
+            self.aplicar_rampa_auto()
+        else:
+            self.detector_rampa.detener()
+            self.rampa_en_reversa = False
+            self.control_rampa()
+
+    def ir_a_posicion(self, nombre: str) -> None:
+        """Lleva garra y pinza a la posición 'nombre' (botón de BOTONES_POSICIONES)."""
+        self.perfil_garra.ir_a_posicion(nombre)
+        self.perfil_pinza.ir_a_posicion(nombre)
+
+    def mover_actuador(self, perfil, abrir: bool, cerrar: bool, velocidad: float) -> None:
+        """
+        Manual con perfil: 'abrir' (FORWARD) / 'cerrar' (REVERSE) a
+        'velocidad' RPM; sin nada pulsado frena el movimiento manual y
+        queda en HOLD (un movimiento a una posición sigue hasta llegar).
+        """
+        if abrir:
+            perfil.velocidad(velocidad)
+        elif cerrar:
+            perfil.velocidad(-velocidad)
+        elif perfil.modo == MODO_VELOCIDAD:
+            perfil.velocidad(0)
+        perfil.paso()
+
+    def control_garra_gradual(self) -> None:
+        """
+        Control de la garra con perfil y retención (HOLD):
+        - L1: abre (FORWARD) a VEL_GARRA
+        - R1: cierra (REVERSE) a VEL_GARRA
+        - Sin pulsación: frena y mantiene posición (HOLD)
+        """
+        perfil = self.perfil_garra
+        self.mover_actuador(perfil, self.controller.buttonL1.pressing(),
+                            self.controller.buttonR1.pressing(), perfil.vel_max)
+
+    def control_pinza_gradual(self) -> None:
+        """
+        Control de la pinza con perfil y retención (HOLD):
+        - L2: abre (FORWARD) a VEL_PINZA
+        - R2: cierra (REVERSE) a VEL_PINZA
+        - Sin pulsación: frena y mantiene posición (HOLD)
+        """
+        perfil = self.perfil_pinza
+        self.mover_actuador(perfil, self.controller.buttonL2.pressing(),
+                            self.controller.buttonR2.pressing(), perfil.vel_max)
+
+    def toggle_cepillo(self) -> None:
+        """Alterna el cepillo ON/OFF (botón A presionado)."""
+        self.cepillo_on = not self.cepillo_on
+
+    def girar_cepillo(self) -> None:
+        """
+        Aplica el estado del cepillo (solo se envía si cambió):
+        - ON: gira en REVERSE a VEL_CEPILLO (FORWARD mientras se
+          recupera de un atasco; se apaga si se rinde)
+        - OFF: se detiene
+        """
+        if self.cepillo_on:
+            accion = self.detector_cepillo.vigilar()
+            if accion == ATASCO_REVERSA:
+                self.motor_cepillo.spin(FORWARD, self.vel_reversa_atasco, PERCENT)
+                return
+            if accion != ATASCO_RENDIDO:
+                self.motor_cepillo.spin(REVERSE, self.vel_cepillo, PERCENT)
+                return
+            self.cepillo_on = False
+            self.controller.rumble("---")
+        self.detector_cepillo.detener()
+        self.motor_cepillo.stop()
@@ -0,0 +1,78 @@
+# ================================================================
+# Núcleo – Tablero en la pantalla del cerebro (solo lo que cambió)
+# ---------------------------------------------------------------
+# Descripción:
+#   Campos con etiqueta fija y un valor: las etiquetas se arman y
+#   se dibujan una sola vez (dibujar_fijo()); actualizar() corre en
+#   su propia tarea (HZ_TABLERO, aparte del control) y solo reescribe
+#   el valor de los campos que cambiaron, relleno a su ancho para tapar
+#   el texto anterior sin borrar la fila (con un "%-Ns" armado al
+#   inicio: MicroPython no tiene str.ljust). Cada llamada escribe como
+#   mucho CAMPOS_POR_VUELTA campos; los demás cambios siguen en la
+#   próxima, empezando donde quedó (el costo por vuelta está acotado).
+#   Los campos se acomodan solos: 'por_fila' columnas de igual ancho.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+
+CAMPOS_POR_VUELTA = 4    # Campos reescritos como máximo por actualizar()
+
+class Tablero:
+    """
+    Tablero de campos (etiqueta, valor(), formato) en la pantalla.
+    - valor() devuelve algo comparable (int, str...); se reescribe si
+      es distinto del último dibujado.
+    - escritos: campos reescritos desde el inicio.
+    """
+
+    def __init__(self, pantalla, campos, filas: int, columnas: int, por_fila: int):
+        self.pantalla = pantalla
+        ancho = columnas // por_fila
+        self.etiquetas = []     # (fila, columna, texto) de cada etiqueta
+        self.campos = []        # (fila, columna, ancho, valor, formato) de cada valor
+        self.rellenos = []      # "%-Ns" de cada valor: lo rellena a su ancho
+        for indice, (etiqueta, valor, formato) in enumerate(campos[:filas * por_fila]):
+            fila = indice // por_fila + 1
+            columna = indice % por_fila * ancho + 1
+            texto = etiqueta + ": "
+            self.etiquetas.append((fila, columna, texto))
+            self.campos.append((fila, columna + len(texto), ancho - len(texto) - 1, valor, formato))
+            self.rellenos.append("%%-%ds" % (ancho - len(texto) - 1))
+        self.ultimos = [None] * len(self.campos)
+        self.siguiente = 0
+        self.escritos = 0
+
+    def dibujar_fijo(self) -> None:
+        """Borra la pantalla y dibuja las etiquetas; los valores se redibujan todos."""
+        pantalla = self.pantalla
+        pantalla.clear_screen()
+        for fila, columna, texto in self.etiquetas:
+            pantalla.set_cursor(fila, columna)
+            pantalla.print(texto)
+        for indice in range(len(self.ultimos)):
+            self.ultimos[indice] = None
+
+    def actualizar(self) -> None:
+        """Tarea 'tablero': reescribe hasta CAMPOS_POR_VUELTA valores que cambiaron."""
+        campos = self.campos
+        ultimos = self.ultimos
+        rellenos = self.rellenos
+        pantalla = self.pantalla
+        n = len(campos)
+        indice = self.siguiente
+        escritos = 0
+        for _ in range(n):
+            fila, columna, ancho, valor, formato = campos[indice]
+            actual = valor()
+            if actual != ultimos[indice]:
+                ultimos[indice] = actual
+                pantalla.set_cursor(fila, columna)
+                pantalla.print(rellenos[indice] % (formato % actual)[:ancho])
+                escritos += 1
+            indice = indice + 1 if indice + 1 < n else 0
+            if escritos == CAMPOS_POR_VUELTA:
+                break
+        self.siguiente = indice
+        self.escritos += escritos
@@ -0,0 +1,114 @@
+# ================================================================
+# Núcleo – Telemetría (anillo preasignado, envío por lotes)
+# ---------------------------------------------------------------
+# Descripción:
+#   Cada muestra guarda velocidad, corriente y temperatura de todos
+#   los motores del robot, más la duración de la vuelta, en un anillo
+#   de bloques preasignados (struct.pack_into, sin crear objetos).
+#   Cada bloque lleva ya su cabecera y se envía entero por la consola
+#   serial (si el runtime expone su flujo binario; si no, a la SD) o a
+#   la SD, uno por llamada a volcar(): el costo por vuelta
+#   queda acotado. Si el anillo se llena, la muestra se descarta en
+#   vez de atrasar el control.
+#
+#   Formato (little-endian):
+#     nombres  "<4sH": b"VXTN", largo + nombres de motores con comas
+#     bloque   "<4sBBHH": b"VXT1", nº motores, plataforma,
+#              muestras por bloque, bytes por muestra
+#     muestra  "<IHHHB": t (ms), duración de la vuelta (µs),
+#              batería (mV), atrasos acumulados, estado (banderas)
+#              + por motor "<hHB": velocidad (rpm), corriente (mA),
+#              temperatura (°C)
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+import struct
+import sys
+
+ARCHIVO_TELEMETRIA = "telemetria.vxt"
+
+FORMATO_TELE_NOMBRES = "<4sH"
+FORMATO_TELE_BLOQUE  = "<4sBBHH"
+FORMATO_TELE_MUESTRA = "<IHHHB"
+FORMATO_TELE_MOTOR   = "<hHB"
+
+class Telemetria:
+    """
+    Muestreo de motores en un anillo de bloques listos para enviar.
+    - 'estado()' devuelve un byte con las banderas del robot.
+    - 'escribir(bloque)' es el destino (serial o SD).
+    - 'muestras' y 'perdidas' cuentan lo guardado y lo descartado.
+    """
+
+    def __init__(self, motores, planificador, bateria, estado, plataforma: int,
+                 muestras_por_bloque: int = 20, bloques: int = 4):
+        self.motores = tuple(motor.motor for motor in motores)   # lecturas sin pasar por la caché
+        self.planificador = planificador
+        self.bateria = bateria
+        self.estado = estado
+        self.escribir = None
+        self.cabecera = struct.calcsize(FORMATO_TELE_BLOQUE)
+        self.tam_base = struct.calcsize(FORMATO_TELE_MUESTRA)
+        self.tam_motor = struct.calcsize(FORMATO_TELE_MOTOR)
+        self.tam = self.tam_base + self.tam_motor * len(self.motores)
+        self.por_bloque = muestras_por_bloque
+        self.bloques = []
+        for _ in range(bloques):
+            bloque = bytearray(self.cabecera + self.tam * muestras_por_bloque)
+            struct.pack_into(FORMATO_TELE_BLOQUE, bloque, 0, b"VXT1", len(self.motores),
+                             plataforma, muestras_por_bloque, self.tam)
+            self.bloques.append(bloque)
+        self.actual = 0        # Bloque que se está llenando
+        self.indice = 0        # Muestra dentro del bloque actual
+        self.pendientes = 0    # Bloques llenos sin enviar
+        self.muestras = 0
+        self.perdidas = 0
+
+    def nombres(self, nombres) -> bytes:
+        """Trama con los nombres de los motores (se envía una vez al inicio)."""
+        texto = ",".join(nombres).encode()
+        return struct.pack(FORMATO_TELE_NOMBRES, b"VXTN", len(texto)) + texto
+
+    def muestrear(self) -> None:
+        """Guarda una muestra: lecturas fijas por motor, sin asignar memoria."""
+        if self.pendientes == len(self.bloques):
+            self.perdidas += 1
+            return
+        bloque = self.bloques[self.actual]
+        pos = self.cabecera + self.indice * self.tam
+        planificador = self.planificador
+        struct.pack_into(FORMATO_TELE_MUESTRA, bloque, pos,
+                         (planificador.reloj_us() // 1000) & 0xFFFFFFFF,
+                         min(planificador.duracion_vuelta_us, 0xFFFF),
+                         min(int(self.bateria.voltage(MV)), 0xFFFF),
+                         planificador.atrasos & 0xFFFF, self.estado())
+        pos += self.tam_base
+        for motor in self.motores:
+            struct.pack_into(FORMATO_TELE_MOTOR, bloque, pos,
+                             int(motor.velocity(RPM)),
+                             min(int(motor.current(AMP) * 1000), 0xFFFF),
+                             min(int(motor.temperature(CELSIUS)), 255))
+            pos += self.tam_motor
+        self.muestras += 1
+        self.indice += 1
+        if self.indice == self.por_bloque:
+            self.indice = 0
+            self.pendientes += 1
+            self.actual = (self.actual + 1) % len(self.bloques)
+
+    def volcar(self) -> None:
+        """Envía como máximo un bloque lleno por llamada."""
+        if self.pendientes:
+            primero = (self.actual - self.pendientes) % len(self.bloques)
+            self.escribir(self.bloques[primero])
+            self.pendientes -= 1
+
+def salida_serial():
+    """
+    write() del flujo binario de la consola USB (sys.stdout.buffer), o
+    None si el runtime no lo tiene (no está garantizado fuera de CPython).
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    return None if buffer is None else buffer.write
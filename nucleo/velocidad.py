@@ -0,0 +1,101 @@
+# ================================================================
+# Núcleo – Lazo cerrado de velocidad por rueda (feedforward + PID)
+# ---------------------------------------------------------------
+# Descripción:
+#   Cada rueda recibe una velocidad objetivo en RPM; en cada vuelta
+#   del drive se lee su velocidad medida y se manda voltaje (mV):
+#       u = KS·signo(obj) + KV·obj + KP·e + KI·Σe + KD·(e − e_prev)
+#   Todo el estado es entero (ganancias en punto fijo Q10) y vive en
+#   listas creadas una sola vez: el lazo no reserva memoria por vuelta.
+#   Anti-windup: el integrador solo acumula si la salida no satura y
+#   su aporte se limita a ±MV_MAX_RUEDA.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+from vex import *
+
+# Bits de la parte fraccionaria de las ganancias (punto fijo Q10)
+BITS_GANANCIA = 10
+
+class LazoVelocidad:
+    """
+    Lazo de velocidad para un grupo de ruedas (MotorCacheado).
+    - kv, ks, kp, ki, kd: ganancias del perfil en mV/RPM (ks en mV).
+    - rpm_max: RPM que corresponden a 100% en fijar().
+    - mv_max: límite del voltaje mandado a cada motor.
+    """
+
+    def __init__(self, ruedas, rpm_max: int, mv_max: int,
+                 kv: float, ks: int, kp: float, ki: float, kd: float):
+        self.ruedas = tuple(ruedas)
+        self.rpm_max = rpm_max
+        self.mv_max = mv_max
+        escala = 1 << BITS_GANANCIA
+        self.kv = int(kv * escala)
+        self.ks = int(ks)
+        self.kp = int(kp * escala)
+        self.ki = int(ki * escala)
+        self.kd = int(kd * escala)
+        # Límite de Σe para que KI·Σe no pase de mv_max
+        self.integral_max = (mv_max << BITS_GANANCIA) // self.ki if self.ki else 0
+        n = len(self.ruedas)
+        self.objetivo = [0] * n    # RPM
+        self.medida = [0] * n      # RPM de la última vuelta
+        self.integral = [0] * n    # Σ error (RPM·vuelta)
+        self.error_prev = [0] * n
+        self.salida = [0] * n      # mV mandados
+
+    def fijar(self, indice: int, porcentaje: int) -> None:
+        """Objetivo de la rueda 'indice' en % de rpm_max (positivo = FORWARD)."""
+        self.objetivo[indice] = porcentaje * self.rpm_max // 100
+
+    def actualizar(self) -> None:
+        """Lee la velocidad de cada rueda y manda el voltaje del lazo."""
+        ruedas = self.ruedas
+        objetivo = self.objetivo
+        medida = self.medida
+        integral = self.integral
+        error_prev = self.error_prev
+        salida = self.salida
+        kv = self.kv
+        ks = self.ks
+        kp = self.kp
+        ki = self.ki
+        kd = self.kd
+        mv_max = self.mv_max
+        integral_max = self.integral_max
+        for i in range(len(ruedas)):
+            obj = objetivo[i]
+            rpm = int(ruedas[i].velocity(RPM))
+            medida[i] = rpm
+            error = obj - rpm
+            u = (kv * obj + kp * error + ki * integral[i]
+                 + kd * (error - error_prev[i])) >> BITS_GANANCIA
+            if obj > 0:
+                u += ks
+            elif obj < 0:
+                u -= ks
+            if u > mv_max:
+                u = mv_max
+            elif u < -mv_max:
+                u = -mv_max
+            else:
+                # Integrar solo sin saturar (anti-windup)
+                acumulado = integral[i] + error
+                if acumulado > integral_max:
+                    acumulado = integral_max
+                elif acumulado < -integral_max:
+                    acumulado = -integral_max
+                integral[i] = acumulado
+            error_prev[i] = error
+            salida[i] = u
+            ruedas[i].spin(FORWARD, u, MV)
+
+    def reiniciar(self) -> None:
+        """Borra objetivo, integrador y derivada (al detener el tren)."""
+        for i in range(len(self.ruedas)):
+            self.objetivo[i] = 0
+            self.integral[i] = 0
+            self.error_prev[i] = 0
+            self.salida[i] = 0
@@ -0,0 +1,11 @@
+# ================================================================
+# Perfiles – Configuración declarativa de cada robot
+# ---------------------------------------------------------------
+# Descripción:
+#   Cada módulo define PERFIL, un dict con puertos, cartuchos,
+#   inversión de motores, zonas muertas, velocidades y frecuencias.
+#   Solo datos: la lógica está en nucleo/. Los perfiles no importan
+#   nada, así también se pueden leer en la PC sin el módulo vex.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
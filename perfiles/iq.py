@@ -0,0 +1,73 @@
+# ================================================================
+# Perfil – VEX IQ (tren diferencial de 4 motores + cepillo)
+# ---------------------------------------------------------------
+# Descripción:
+#   Motores IQ (sin cartucho). Cada lado del tren diferencial lleva
+#   dos motores; el cepillo se maneja con FDown/FUp.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+PERFIL = {
+    "NOMBRE": "IQ",
+    "PLATAFORMA": "IQ",
+
+    # Motores: (nombre, puerto, cartucho, invertido)
+    "MOTORES": (
+        ("back_left",   12, None, False),   # Trasera izquierda
+        ("back_right",  6,  None, True),    # Trasera derecha
+        ("front_left",  7,  None, False),   # Delantera izquierda
+        ("front_right", 1,  None, True),    # Delantera derecha
+        ("cepillo",     8,  None, False),
+    ),
+    "LADO_IZQUIERDO": ("back_left", "front_left"),
+    "LADO_DERECHO": ("back_right", "front_right"),
+
+    "DEADZONE": 10,      # Ignorar ruido pequeño en joystick
+    "EXPO_AVANCE": 0.4,  # Curva de avance (0 = lineal, 1 = cúbica)
+    "EXPO_GIRO": 0.5,    # Curva de giro
+    "ACEL_JOYSTICK": 500,  # %/s de subida máxima del joystick (0 = sin límite)
+    "VEL_CEPILLO": 100,  # % del cepillo (FDown/FUp)
+
+    # Conducción por curvatura (False = arcade)
+    "CURVATURA": True,
+    "GIRO_RAPIDO_UMBRAL": 10,        # Con |avance| menor a este % se gira en el lugar
+    "BOTON_GIRO_RAPIDO": "buttonRUp",  # Sostenido: giro en el lugar
+
+    # Eventos de botón
+    "LARGO_MS": 500,        # Presión larga: botón sostenido este tiempo
+    "DOBLE_MS": 300,        # Doble toque: dos presiones dentro de este tiempo
+
+    # Gestor de energía (presupuesto de corriente de los motores)
+    "ENERGIA": False,
+    "MOTORES_PRIORITARIOS": ("back_left", "back_right", "front_left", "front_right"),
+    "PRESUPUESTO_A": 4.0,
+    "CORRIENTE_MOTOR_A": 1.2,
+    "V_BATERIA_BAJA": 7.4,
+    "V_BATERIA_CRITICA": 7.0,
+    "TEMP_INICIO": 45,
+    "TEMP_MAX": 55,
+
+    # Frecuencia de cada subsistema (Hz) y orden en el planificador
+    "HZ_DRIVE": 100,
+    "HZ_ENERGIA": 10,
+    "HZ_CEPILLO": 50,
+    "TAREAS": ("drive", "cepillo"),
+    "HILOS": False,
+    "GRUPOS_HILOS": (
+        ("control", "drive"),
+        ("cepillo",),
+        ("telemetria", "tele_envio", "grabador", "perfil", "tablero"),
+    ),
+
+    # Registro del controlador, telemetría y perfilador
+    "GRABAR_CONTROL": False,
+    "TELEMETRIA": False,
+    "TELEMETRIA_DESTINO": "serial",
+    "TELEMETRIA_DECIMAR": 5,
+    "HZ_TELEMETRIA_ENVIO": 10,
+    "PERFILAR": False,
+    "HZ_PERFILAR": 1,
+    "TABLERO": True,
+    "HZ_TABLERO": 4,
+}
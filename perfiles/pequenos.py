@@ -0,0 +1,163 @@
+# ================================================================
+# Perfil – Pequeños (VEX V5, llantas mecanum)
+# ---------------------------------------------------------------
+# Descripción:
+#   Tren mecanum de 4 motores (18:1) con las ruedas traseras
+#   cableadas al revés, y actuadores rampa (6:1, invertida), cepillo
+#   (18:1), garra y pinza (36:1).
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+PERFIL = {
+    "NOMBRE": "Pequeños",
+    "PLATAFORMA": "V5",
+
+    # Motores: (nombre, puerto, cartucho, invertido)
+    "MOTORES": (
+        ("back_left",   19, "18_1", True),    # Izquierdo trasero
+        ("back_right",  20, "18_1", False),   # Derecho trasero
+        ("front_left",  17, "18_1", False),   # Izquierdo delantero
+        ("front_right", 16, "18_1", True),    # Derecho delantero
+        ("rampa",       11, "6_1",  True),
+        ("cepillo",     10, "18_1", False),
+        ("garra",       12, "36_1", False),
+        ("pinza",       14, "36_1", False),
+    ),
+
+    # Mecanum: ruedas FL, FR, BL, BR; las traseras van en REVERSE
+    "RUEDAS": ("front_left", "front_right", "back_left", "back_right"),
+    "SIGNO_RUEDAS": (1, 1, -1, -1),
+
+    "DEADZONE": 5,          # Umbral para ignorar ruido de joystick
+    "EXPO_AVANCE": 0.4,     # Curva de avance y strafe (0 = lineal, 1 = cúbica)
+    "EXPO_GIRO": 0.5,       # Curva de giro
+    "ACEL_JOYSTICK": 500,   # %/s de subida máxima de cada eje del drive (0 = sin límite)
+    "STRAFE_BOTONES": 0,    # Sin strafe forzado con LEFT/RIGHT
+    "CAMPO_CENTRADO": False,  # Arrancar con el joystick en el marco del campo
+    "BOTON_CAMPO": "buttonY", # Presión: alterna campo centrado; sostenido: fija el frente
+    "RPM_RAMPA_AUTO": 370,  # Velocidad fija de la rampa en modo AUTO
+    "SENTIDO_RAMPA": -1,    # Axis2 positivo gira la rampa en REVERSE
+    "VEL_GARRA": 60,        # % al abrir/cerrar la garra (L1/R1)
+    "VEL_PINZA": 100,       # % al abrir/cerrar la pinza (L2/R2)
+    "VEL_CEPILLO": 100,     # % del cepillo encendido
+
+    # Atascos de cepillo y rampa: trabado = menos de ATASCO_FRACCION_RPM de
+    # sus RPM libres tomando al menos ATASCO_CORRIENTE_A
+    "ATASCO_FRACCION_RPM": 0.1,
+    "ATASCO_CORRIENTE_A": 0.8,
+    "ATASCO_VENTANA_MS": 300,    # Ventana que tiene que estar (casi toda) trabada
+    "ATASCO_REVERSA_MS": 400,    # Reversa para soltar la pieza
+    "ATASCO_GRACIA_MS": 300,     # Sin vigilar al arrancar y tras la reversa
+    "ATASCO_VEL_REVERSA": 50,    # % de la reversa
+    "ATASCO_MAX_SEGUIDOS": 3,    # Atascos seguidos antes de apagar el motor
+
+    # Perfiles de movimiento (RPM/s y RPM/s²; jerk 0 = trapecio)
+    "ACEL_RAMPA": 1500,     # 0 -> RPM_RAMPA_AUTO en ~0.3 s
+    "JERK_RAMPA": 15000,
+    "ACEL_GARRA": 400,
+    "JERK_GARRA": 4000,
+    "ACEL_PINZA": 600,
+    "JERK_PINZA": 6000,
+    # Posiciones con nombre en grados del eje del motor (0 = al encender)
+    "POSICIONES_GARRA": {"abierta": 0, "cerrada": -120, "transporte": -60},
+    "POSICIONES_PINZA": {"abierta": 0, "cerrada": -150, "transporte": -75},
+    "BOTONES_POSICIONES": (("buttonUp", "abierta"), ("buttonDown", "cerrada"),
+                           ("buttonLeft", "transporte")),   # LEFT libre: STRAFE_BOTONES = 0
+
+    # Macros: pasos (actuador, valor, ms); garra/pinza pasan al llegar a la
+    # posición o a los ms, rampa/cepillo (True/False) y "esperar" duran los ms
+    "MACROS": {
+        "anotar": (("pinza", "cerrada", 800),
+                   ("garra", "transporte", 800),
+                   ("rampa", True, 600),
+                   ("cepillo", True, 0)),
+    },
+    "BOTONES_MACROS": (("buttonX", "anotar"),),   # Presión; sin otra función
+    "BOTONES_CANCELAR_MACRO": ("buttonL1", "buttonR1", "buttonL2", "buttonR2",
+                               "buttonUp", "buttonDown", "buttonLeft", "buttonA", "buttonB"),
+
+    # Lazo cerrado de velocidad de las ruedas (feedforward + PID, en mV)
+    "LAZO_CERRADO": False,  # True: cada rueda sigue su RPM objetivo mandando voltaje
+    "RPM_RUEDA": 200,       # RPM de una rueda al 100% (cartucho 18:1)
+    "MV_MAX_RUEDA": 12000,  # Voltaje máximo por motor (mV)
+    "KV_RUEDA": 57.6,       # Feedforward: mV por RPM
+    "KS_RUEDA": 480,        # Feedforward: mV para vencer la fricción
+    "KP_RUEDA": 30.0,       # mV por RPM de error
+    "KI_RUEDA": 2.0,        # mV por RPM·vuelta acumulado
+    "KD_RUEDA": 0.0,        # mV por RPM de cambio de error
+
+    # Autónomo: la trayectoria se calcula en la PC con
+    # herramientas/trayectorias.py y queda en trayectorias/<robot>.py
+    "RADIO_RUEDA": 0.0508,  # m (rueda mecanum de 4")
+    "SEMIANCHO": 0.15,      # m, del centro a la rueda (lateral)
+    "SEMILARGO": 0.15,      # m, del centro a la rueda (adelante)
+    "HZ_AUTONOMO": 50,      # Pasos de la tabla por segundo
+    "KP_POSICION": 100,     # % de rueda por metro de error de la pose (odometría)
+    "KP_RUMBO": 2,          # % de giro por grado de error de rumbo
+    "CORRECCION_MAX": 25,   # % máximo de cada corrección sobre el paso de la tabla
+
+    # Odometría (encoders de las ruedas + sensor inercial opcional)
+    "PUERTO_INERCIAL": None,  # Puerto del Inertial (None = solo encoders)
+    "PESO_INERCIAL": 0.1,     # Fracción del error de rumbo corregida hacia el sensor por vuelta
+    "AUTONOMO": {
+        "VEL_MAX": 0.7,           # m/s de recorrido de rueda
+        "ACEL_MAX": 1.0,          # m/s² al arrancar y frenar
+        "ACEL_CENTRIPETA": 1.5,   # m/s² en las curvas
+        # (x m, y m, rumbo en grados horario, banderas) desde la salida;
+        # banderas: 1 cepillo encendido, 2 rampa AUTO (rigen hasta el punto siguiente)
+        "PUNTOS": (
+            (0.0, 0.0, 0, 1),
+            (0.0, 0.6, 0, 1),
+            (0.5, 1.1, 90, 3),
+            (1.1, 1.1, 90, 2),
+            (1.1, 0.3, 180, 0),
+        ),
+    },
+
+    # Eventos de botón
+    "LARGO_MS": 500,        # Presión larga: botón sostenido este tiempo
+    "DOBLE_MS": 300,        # Doble toque: dos presiones dentro de este tiempo
+
+    # Gestor de energía: reparte un presupuesto de corriente limitando
+    # el par de cada motor; el drive va primero
+    "ENERGIA": True,
+    "MOTORES_PRIORITARIOS": ("front_left", "front_right", "back_left", "back_right"),
+    "PRESUPUESTO_A": 15.0,       # A entre todos los motores
+    "CORRIENTE_MOTOR_A": 2.5,    # A de un motor V5 al 100% de par
+    "V_BATERIA_BAJA": 11.8,      # V: por debajo el presupuesto empieza a bajar...
+    "V_BATERIA_CRITICA": 11.2,   # ...hasta la mitad en este voltaje
+    "TEMP_INICIO": 45,           # °C: desde aquí se recorta el par del motor...
+    "TEMP_MAX": 55,              # ...hasta LIMITE_MINIMO (el motor se recorta solo a 55 °C)
+
+    # Frecuencia de cada subsistema (Hz) y orden en el planificador
+    "HZ_DRIVE": 100,
+    "HZ_ENERGIA": 10,
+    "HZ_ODOMETRIA": 100,
+    "HZ_RAMPA": 50,
+    "HZ_CEPILLO": 50,
+    "HZ_GARRA": 25,
+    "HZ_PINZA": 25,
+    "HZ_MACRO": 50,
+    "TAREAS": ("odometria", "drive", "macro", "cepillo", "pinza", "garra", "rampa"),
+    # Con HILOS cada grupo corre en su propio Thread (el primero en el
+    # hilo principal; las tareas fuera de los grupos van con él)
+    "HILOS": False,
+    "GRUPOS_HILOS": (
+        ("control", "odometria", "drive"),
+        ("rampa", "cepillo"),
+        ("macro", "garra", "pinza"),
+        ("telemetria", "tele_envio", "grabador", "perfil", "tablero"),
+    ),
+
+    # Registro del controlador, telemetría y perfilador
+    "GRABAR_CONTROL": False,
+    "TELEMETRIA": False,
+    "TELEMETRIA_DESTINO": "serial",
+    "TELEMETRIA_DECIMAR": 5,
+    "HZ_TELEMETRIA_ENVIO": 10,
+    "PERFILAR": False,               # True: mide cada tarea y lo muestra en la pantalla del cerebro
+    "HZ_PERFILAR": 1,                # Refrescos de la pantalla del perfilador por segundo
+    "TABLERO": True,                 # Estado del robot en la pantalla (si no hay PERFILAR)
+    "HZ_TABLERO": 4,                 # Actualizaciones del tablero por segundo
+}
@@ -0,0 +1,137 @@
+# ================================================================
+# Simulador – Comprobaciones de regresión
+# ---------------------------------------------------------------
+# Descripción:
+#   Chequeos rápidos con el vex simulado; cada uno devuelve la lista
+#   de fallas (vacía = bien) y main() sale con 1 si alguno falla:
+#     • hilos: con HILOS (cada grupo de GRUPOS_HILOS en su Thread) el
+#       resumen y las ejecuciones de cada tarea son los mismos que con
+#       el planificador de un solo bucle, y los otros grupos corrieron
+#       de verdad en sus hilos
+#     • tablero: con el registro de llamadas de la pantalla simulada,
+#       las etiquetas se dibujan una sola vez, cada actualizar() escribe
+#       como mucho CAMPOS_POR_VUELTA valores y solo los que cambiaron
+#
+# Uso:
+#   python simulador/comprobaciones.py
+#   python simulador/comprobaciones.py iq --segundos 30
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import argparse
+import sys
+
+import simulacion
+import vex
+from nucleo.tablero import CAMPOS_POR_VUELTA
+
+ROBOTS = ("grandes", "pequenos", "iq")
+
+def ejecuciones(robot) -> dict:
+    """{tarea: ejecuciones} de todos los planificadores del robot."""
+    return {tarea.nombre: tarea.ejecuciones for planificador in robot.planificadores
+            for tarea in planificador.tareas}
+
+def comprobar_hilos(nombre: str, segundos: float) -> list:
+    """Misma partida con y sin HILOS: mismas métricas y mismas ejecuciones por tarea."""
+    fallas = []
+    solo = simulacion.cargar_robot(nombre, {"HILOS": False})
+    resumen_solo = simulacion.correr(solo, segundos, simulacion.entrada_demo)
+    ejecuciones_solo = ejecuciones(solo)
+    hilos = simulacion.cargar_robot(nombre, {"HILOS": True})
+    resumen_hilos = simulacion.correr(hilos, segundos, simulacion.entrada_demo)
+    if len(hilos.hilos) != len(hilos.planificadores) - 1 or not hilos.hilos:
+        fallas.append("%d hilos para %d grupos" % (len(hilos.hilos), len(hilos.planificadores)))
+    for planificador in hilos.planificadores[1:]:
+        for tarea in planificador.tareas:
+            if tarea.ejecuciones == 0:
+                fallas.append("la tarea '%s' no corrió en su hilo" % tarea.nombre)
+    for clave, valor in resumen_solo.items():
+        if resumen_hilos.get(clave) != valor:
+            fallas.append("%s: %r sin hilos, %r con hilos" % (clave, valor, resumen_hilos.get(clave)))
+    if ejecuciones(hilos) != ejecuciones_solo:
+        fallas.append("ejecuciones por tarea: %r sin hilos, %r con hilos" % (ejecuciones_solo, ejecuciones(hilos)))
+    return fallas
+
+def impresiones(pantalla, desde: int) -> list:
+    """(fila, columna, texto) de los print() de la pantalla desde la llamada 'desde'."""
+    return [llamada[1:] for llamada in pantalla.llamadas[desde:] if llamada[0] == "print"]
+
+def comprobar_tablero(nombre: str, segundos: float) -> list:
+    """El tablero redibuja solo los campos que cambiaron, a lo sumo CAMPOS_POR_VUELTA por vuelta."""
+    fallas = []
+    robot = simulacion.cargar_robot(nombre, {"TABLERO": True, "PERFILAR": False})
+    tablero = robot.tablero
+    pantalla = robot.brain.screen
+    etiquetas = {(fila, columna): texto for fila, columna, texto in tablero.etiquetas}
+    valores = {(fila, columna): ancho for fila, columna, ancho, _, _ in tablero.campos}
+    inicio = pantalla.llamadas.index(("clear_screen",), 1)
+    dibujadas = {(fila, columna): texto for fila, columna, texto in impresiones(pantalla, inicio)}
+    if dibujadas != etiquetas:
+        fallas.append("etiquetas iniciales: %r" % dibujadas)
+    desde = len(pantalla.llamadas)
+
+    # Partida: nunca se borra ni se redibuja una etiqueta; cada valor a su ancho
+    simulacion.correr(robot, segundos, simulacion.entrada_demo)
+    if ("clear_screen",) in pantalla.llamadas[desde:]:
+        fallas.append("se borró la pantalla durante la partida")
+    for fila, columna, texto in impresiones(pantalla, desde):
+        if (fila, columna) not in valores:
+            fallas.append("print() fuera de un valor en (%d, %d): %r" % (fila, columna, texto))
+        elif len(texto) != valores[(fila, columna)]:
+            fallas.append("valor de ancho %d en (%d, %d): %r" % (len(texto), fila, columna, texto))
+
+    def vuelta() -> list:
+        desde = len(pantalla.llamadas)
+        tablero.actualizar()
+        return impresiones(pantalla, desde)
+
+    # Sin cambios: se pone al día en pocas vueltas y después no escribe nada
+    for _ in range(len(tablero.campos) // CAMPOS_POR_VUELTA + 1):
+        vuelta()
+    if vuelta():
+        fallas.append("redibuja campos sin cambios")
+
+    # Un solo campo cambia (batería): se escribe solo ese
+    vex.sim.bateria.voltaje -= 1.0
+    escritas = vuelta()
+    fila, columna, _ = tablero.etiquetas[0]
+    if [(f, c) for f, c, _ in escritas] != [(fila, columna + len(tablero.etiquetas[0][2]))]:
+        fallas.append("cambió la batería y se escribió %r" % escritas)
+
+    # Todo cambia (dibujar_fijo): CAMPOS_POR_VUELTA por vuelta hasta cubrir todos
+    tablero.dibujar_fijo()
+    escritos = []
+    for _ in range(len(tablero.campos) // CAMPOS_POR_VUELTA + 1):
+        escritas = vuelta()
+        if len(escritas) > CAMPOS_POR_VUELTA:
+            fallas.append("%d valores en una vuelta" % len(escritas))
+        escritos.extend((f, c) for f, c, _ in escritas)
+    if sorted(escritos) != sorted(valores):
+        fallas.append("tras dibujar_fijo() se escribieron %d de %d valores" % (len(escritos), len(valores)))
+    return fallas
+
+COMPROBACIONES = (
+    ("hilos", comprobar_hilos),
+    ("tablero", comprobar_tablero),
+)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Comprobaciones de regresión en el simulador.")
+    parser.add_argument("robots", nargs="*", default=ROBOTS, help="robots a comprobar (todos)")
+    parser.add_argument("--segundos", type=float, default=10.0, help="duración de cada partida")
+    args = parser.parse_args()
+
+    total = 0
+    for nombre in args.robots:
+        for comprobacion, funcion in COMPROBACIONES:
+            fallas = funcion(nombre, args.segundos)
+            print("%-10s %-8s %s" % (nombre, comprobacion, "FALLA" if fallas else "ok"))
+            for falla in fallas:
+                print("    " + falla)
+            total += len(fallas)
+    sys.exit(1 if total else 0)
+
+if __name__ == "__main__":
+    main()
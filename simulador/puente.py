@@ -0,0 +1,428 @@
+# ================================================================
+# Simulador – Puente serial con un emulador de dispositivos (HIL)
+# ---------------------------------------------------------------
+# Descripción:
+#   Corre el programa aplanado de un robot (el mismo .v5python) en
+#   la PC, pero sus Motor y Controller son representantes: cada
+#   comando de motor se agrega a la trama de la vuelta y, al empezar
+#   la vuelta siguiente, la trama entera viaja por un pty (o un
+#   puerto serial) a un proceso emulador. El emulador tiene la física
+#   del `vex` simulado, aplica los comandos, avanza el tiempo de esa
+#   vuelta, espera la latencia de los puertos inteligentes y responde
+#   con el estado de cada motor y la foto del controlador (que mueve
+#   con una traza de trazas.py). El tiempo sigue siendo virtual (lo
+#   marca el programa); la latencia de ida y vuelta se mide en
+#   tiempo real, para estudiar cómo pesa el volumen de comandos por
+#   vuelta (--sin-cache manda todo lo que el programa llama).
+#
+#   Tramas (little-endian):
+#     PC -> emulador  "<4sHIH": b"VXH1", secuencia, µs a avanzar,
+#                     nº comandos + por comando "<BBBi": puerto,
+#                     operación, argumento, valor (×100)
+#                     b"VXH0" + el resto en cero: fin
+#     emulador -> PC  "<4sHIH": b"VXE1", secuencia, t (ms), nº motores
+#                     + controlador "<8bI": 8 ejes, botones
+#                     + por motor "<BhiHB": puerto, rpm ×10,
+#                     centésimas de grado, mA, °C
+#
+#   Latencia del emulador por trama: LATENCIA_US + US_COMANDO por
+#   comando y, con --baudios, el tiempo de los bytes en el cable.
+#
+# Uso:
+#   python simulador/puente.py grandes --segundos 20
+#   python simulador/puente.py grandes --sin-cache --us-comando 100
+#   python simulador/puente.py grandes --puerto /dev/ttyUSB0          # PC
+#   python simulador/puente.py grandes --emulador --puerto /dev/ttyUSB1
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import argparse
+import os
+import struct
+import subprocess
+import sys
+import time
+import tty
+
+import simulacion
+import trazas
+import vex
+
+FORMATO_TRAMA = "<4sHIH"
+FORMATO_COMANDO = "<BBBi"
+FORMATO_CONTROL = "<8bI"
+FORMATO_ESTADO = "<BhiHB"
+TAM_TRAMA = struct.calcsize(FORMATO_TRAMA)
+TAM_COMANDO = struct.calcsize(FORMATO_COMANDO)
+TAM_CONTROL = struct.calcsize(FORMATO_CONTROL)
+TAM_ESTADO = struct.calcsize(FORMATO_ESTADO)
+
+LATENCIA_US = 500        # Por trama (ida y vuelta por el puerto)
+US_COMANDO = 50          # Por comando que el emulador reparte a un motor
+
+# Operaciones de motor
+OP_SPIN, OP_STOP, OP_VELOCIDAD, OP_PAR, OP_FRENO, OP_POSICION = range(1, 7)
+
+# Argumento: bit 0 sentido (1 = REVERSE), bits 1.. unidades o freno
+UNIDADES = (None, vex.PERCENT, vex.RPM, vex.DPS, vex.VOLT, vex.MV)
+FRENOS = (None, vex.COAST, vex.BRAKE, vex.HOLD)
+
+# ------------------------------------------------
+# Enlace (pty o serial)
+# ------------------------------------------------
+class Enlace:
+    """Bytes exactos sobre un descriptor (pty) o un serial.Serial."""
+
+    def __init__(self, leer, escribir):
+        self.leer = leer
+        self.escribir = escribir
+
+    @classmethod
+    def de_descriptor(cls, fd: int) -> "Enlace":
+        def escribir(datos) -> None:
+            datos = memoryview(datos)
+            while datos:
+                datos = datos[os.write(fd, datos):]
+        return cls(lambda n: os.read(fd, n), escribir)
+
+    @classmethod
+    def de_serial(cls, puerto: str, baudios: int) -> "Enlace":
+        import serial
+        conexion = serial.Serial(puerto, baudios, timeout=None)
+        return cls(conexion.read, conexion.write)
+
+    def recibir(self, n: int) -> bytes:
+        datos = b""
+        while len(datos) < n:
+            parte = self.leer(n - len(datos))
+            if not parte:
+                raise EOFError("el enlace se cerró")
+            datos += parte
+        return datos
+
+    def trama(self, magias) -> tuple:
+        """Lee una cabecera de trama (magia, secuencia, µs o ms, cantidad); el cuerpo queda sin leer."""
+        cabecera = struct.unpack(FORMATO_TRAMA, self.recibir(TAM_TRAMA))
+        if cabecera[0] not in magias:
+            raise ValueError("trama desincronizada (magia %r)" % cabecera[0])
+        return cabecera
+
+# ------------------------------------------------
+# Lado PC: representantes de Motor y Controller
+# ------------------------------------------------
+class Remoto:
+    """Estado compartido por los representantes: trama pendiente y última respuesta."""
+
+    def __init__(self):
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        self.comandos = bytearray()
+        self.n_comandos = 0
+        self.motores = {}            # puerto -> [rpm, grados, A, °C]
+        self.ejes = [0] * 8
+        self.botones = 0
+
+    def comando(self, puerto: int, operacion: int, argumento: int, valor: float) -> None:
+        self.comandos += struct.pack(FORMATO_COMANDO, puerto, operacion, argumento, int(round(valor * 100)))
+        self.n_comandos += 1
+
+remoto = Remoto()
+
+class MotorRemoto:
+    """Motor(puerto, engranaje, invertido) cuyos comandos viajan en la trama de la vuelta."""
+
+    def __init__(self, puerto, *args):
+        modelo = "IQ" if args and not any(isinstance(arg, vex._Valor) for arg in args) else "RATIO_18_1"
+        for arg in args:
+            if isinstance(arg, vex._Valor):
+                modelo = arg.nombre
+        self.puerto = puerto
+        self.rpm_max = vex._MODELOS[modelo][0]
+        self.estado = remoto.motores.setdefault(puerto, [0.0, 0.0, 0.0, 25.0])
+
+    def spin(self, direccion, velocidad=None, unidades=vex.RPM) -> None:
+        sentido = 1 if direccion is vex.REVERSE else 0
+        if velocidad is None:
+            remoto.comando(self.puerto, OP_SPIN, sentido, 0)
+        else:
+            remoto.comando(self.puerto, OP_SPIN, sentido | UNIDADES.index(unidades) << 1, velocidad)
+
+    def stop(self, modo=None) -> None:
+        remoto.comando(self.puerto, OP_STOP, FRENOS.index(modo) << 1, 0)
+
+    def set_velocity(self, velocidad, unidades=vex.RPM) -> None:
+        remoto.comando(self.puerto, OP_VELOCIDAD, UNIDADES.index(unidades) << 1, velocidad)
+
+    def set_max_torque(self, valor, unidades=vex.PERCENT) -> None:
+        remoto.comando(self.puerto, OP_PAR, 0, valor)
+
+    def set_stopping(self, modo) -> None:
+        remoto.comando(self.puerto, OP_FRENO, FRENOS.index(modo) << 1, 0)
+
+    def set_position(self, valor, unidades=vex.DEGREES) -> None:
+        remoto.comando(self.puerto, OP_POSICION, 0, valor * 360 if unidades is vex.TURNS else valor)
+
+    def velocity(self, unidades=vex.PERCENT) -> float:
+        rpm = self.estado[0]
+        if unidades is vex.PERCENT:
+            return rpm / self.rpm_max * 100.0
+        return rpm * 6.0 if unidades is vex.DPS else rpm
+
+    def position(self, unidades=vex.DEGREES) -> float:
+        grados = self.estado[1]
+        return grados / 360.0 if unidades is vex.TURNS else grados
+
+    def current(self, *_) -> float:
+        return self.estado[2]
+
+    def temperature(self, unidades=vex.CELSIUS) -> float:
+        return self.estado[3] * 9 / 5 + 32 if unidades is vex.FAHRENHEIT else self.estado[3]
+
+class _EjeRemoto:
+    def __init__(self, indice: int):
+        self.indice = indice
+
+    def position(self) -> int:
+        return remoto.ejes[self.indice]
+
+    def value(self) -> int:
+        return remoto.ejes[self.indice]
+
+class _BotonRemoto:
+    def __init__(self, bit: int):
+        self.mascara = 1 << bit
+
+    def pressing(self) -> bool:
+        return (remoto.botones & self.mascara) != 0
+
+_ControllerLocal = vex.Controller
+
+class ControllerRemoto:
+    """Controller con ejes y botones de la última respuesta; lo demás (screen, rumble) es local."""
+
+    def __init__(self, *args):
+        self.local = _ControllerLocal(*args)
+        for indice, nombre in enumerate(_ControllerLocal.EJES):
+            setattr(self, nombre, _EjeRemoto(indice))
+        for bit, nombre in enumerate(_ControllerLocal.BOTONES):
+            setattr(self, nombre, _BotonRemoto(bit))
+
+    def __getattr__(self, nombre):
+        return getattr(self.local, nombre)
+
+def cargar_remoto(robot: str):
+    """Programa aplanado de 'robot' con Motor y Controller remotos. Devuelve su robot."""
+    import construir
+    texto = construir.aplanar(os.path.join(construir.ROBOTS[robot], "driver_mode.py"))
+    vex.sim.reiniciar()
+    remoto.reiniciar()
+    originales = vex.Motor, vex.Controller
+    vex.Motor, vex.Controller = MotorRemoto, ControllerRemoto
+    try:
+        espacio = {"__name__": "driver_mode_remoto"}
+        exec(compile(texto, "<%s remoto>" % robot, "exec"), espacio)
+    finally:
+        vex.Motor, vex.Controller = originales
+    return espacio["robot"]
+
+def intercambiar(enlace: Enlace, secuencia: int, avance_us: int) -> int:
+    """Manda la trama de la vuelta y lee la respuesta. Devuelve el nº de comandos mandados."""
+    n = remoto.n_comandos
+    enlace.escribir(struct.pack(FORMATO_TRAMA, b"VXH1", secuencia & 0xFFFF, avance_us, n)
+                    + bytes(remoto.comandos))
+    del remoto.comandos[:]
+    remoto.n_comandos = 0
+    _, eco, _, n_motores = enlace.trama((b"VXE1",))
+    if eco != secuencia & 0xFFFF:
+        raise ValueError("respuesta %d a la trama %d" % (eco, secuencia & 0xFFFF))
+    cuerpo = enlace.recibir(TAM_CONTROL + n_motores * TAM_ESTADO)
+    control = struct.unpack_from(FORMATO_CONTROL, cuerpo)
+    remoto.ejes[:] = control[:8]
+    remoto.botones = control[8]
+    for puerto, rpm, centesimas, ma, celsius in struct.iter_unpack(FORMATO_ESTADO, cuerpo[TAM_CONTROL:]):
+        estado = remoto.motores.setdefault(puerto, [0.0, 0.0, 0.0, 25.0])
+        estado[0] = rpm / 10
+        estado[1] = centesimas / 100
+        estado[2] = ma / 1000
+        estado[3] = celsius
+    return n
+
+def correr(robot: str, enlace: Enlace, segundos: float, sin_cache: bool = False) -> dict:
+    """
+    Corre el programa remoto 'segundos' de tiempo virtual, una trama por
+    vuelta del planificador. Devuelve las mediciones por trama.
+    """
+    programa = cargar_remoto(robot)
+    planificador = programa.planificador
+    reloj = time.perf_counter
+    medidas = {"comandos": [], "ida_b": [], "rtt_us": []}
+    fin = vex.sim.tiempo_us + int(segundos * 1000000)
+    anterior = vex.sim.tiempo_us
+    secuencia = 0
+    planificador.iniciar()
+    while vex.sim.tiempo_us < fin:
+        inicio = reloj()
+        n = intercambiar(enlace, secuencia, vex.sim.tiempo_us - anterior)
+        medidas["rtt_us"].append((reloj() - inicio) * 1e6)
+        medidas["comandos"].append(n)
+        medidas["ida_b"].append(TAM_TRAMA + n * TAM_COMANDO)
+        anterior = vex.sim.tiempo_us
+        secuencia += 1
+        if sin_cache:
+            for motor in programa.motores:
+                motor.invalidar()
+        planificador.esperar(planificador.paso())
+    enlace.escribir(struct.pack(FORMATO_TRAMA, b"VXH0", 0, 0, 0))
+    medidas["vuelta_b"] = TAM_TRAMA + TAM_CONTROL + len(remoto.motores) * TAM_ESTADO
+    return medidas
+
+def reporte(medidas: dict) -> list:
+    """Líneas con el volumen por trama y la latencia, también por nº de comandos."""
+    rtt = sorted(medidas["rtt_us"])
+    comandos = medidas["comandos"]
+    n = len(rtt)
+    lineas = ["%d tramas; comandos/trama media %.2f, máx %d; bytes ida media %.0f, vuelta %d" % (
+        n, sum(comandos) / n, max(comandos), sum(medidas["ida_b"]) / n, medidas["vuelta_b"])]
+    lineas.append("ida y vuelta (µs): media %.0f, p50 %.0f, p99 %.0f, máx %.0f" % (
+        sum(rtt) / n, rtt[n // 2], rtt[min(n - 1, int(n * 0.99))], rtt[-1]))
+    lineas.append("%10s %8s %12s" % ("comandos", "tramas", "rtt_medio_us"))
+    por_cantidad = {}
+    for cantidad, valor in zip(comandos, medidas["rtt_us"]):
+        por_cantidad.setdefault(cantidad, []).append(valor)
+    for cantidad in sorted(por_cantidad):
+        valores = por_cantidad[cantidad]
+        lineas.append("%10d %8d %12.0f" % (cantidad, len(valores), sum(valores) / len(valores)))
+    return lineas
+
+# ------------------------------------------------
+# Lado emulador
+# ------------------------------------------------
+def emular(robot: str, enlace: Enlace, traza: str = "demo", latencia_us: int = LATENCIA_US,
+           us_comando: int = US_COMANDO, baudios: int = 0) -> int:
+    """
+    Atiende tramas hasta el fin: motores y chasis del perfil en el
+    `vex` simulado, controlador movido por 'traza'. Devuelve las tramas atendidas.
+    """
+    perfil = simulacion.cargar_perfil(robot)
+    vex.sim.reiniciar()
+    por_nombre = {}
+    por_puerto = {}
+    for nombre, puerto, cartucho, invertido in perfil["MOTORES"]:
+        indice = getattr(vex.Ports, "PORT%d" % puerto)
+        if cartucho is None:
+            motor = vex.Motor(indice, invertido)
+        else:
+            motor = vex.Motor(indice, getattr(vex.GearSetting, "RATIO_" + cartucho), invertido)
+        por_nombre[nombre] = motor
+        por_puerto[indice] = motor
+    if perfil["PLATAFORMA"] == "IQ":
+        vex.sim.bateria = vex.Bateria.iq()
+    simulacion.chasis_de_perfil(perfil, por_nombre)
+    controller = vex.Controller()
+    entrada = trazas.cargar_traza(traza)
+    ejes = [getattr(controller, nombre) for nombre in vex.Controller.EJES]
+    botones = [getattr(controller, nombre) for nombre in vex.Controller.BOTONES]
+    tramas = 0
+    while True:
+        try:
+            magia, secuencia, avance_us, n = enlace.trama((b"VXH1", b"VXH0"))
+        except (EOFError, OSError):
+            return tramas          # La PC cerró el enlace sin trama de fin
+        if magia == b"VXH0":
+            return tramas
+        llegada = time.perf_counter()
+        cuerpo = enlace.recibir(n * TAM_COMANDO)
+        for puerto, operacion, argumento, valor in struct.iter_unpack(FORMATO_COMANDO, cuerpo):
+            motor = por_puerto.get(puerto)
+            if motor is not None:
+                _aplicar(motor, operacion, argumento, valor / 100)
+        vex.sim.avanzar(avance_us)
+        entrada(vex.sim.tiempo_us, controller)
+        mascara = 0
+        for bit, boton in enumerate(botones):
+            if boton.pressing():
+                mascara |= 1 << bit
+        respuesta = bytearray(struct.pack(FORMATO_TRAMA, b"VXE1", secuencia, vex.sim.tiempo_us // 1000,
+                                          len(por_puerto)))
+        respuesta += struct.pack(FORMATO_CONTROL, *([eje.position() for eje in ejes] + [mascara]))
+        for puerto, motor in por_puerto.items():
+            respuesta += struct.pack(FORMATO_ESTADO, puerto,
+                                     max(-32768, min(32767, int(round(motor.velocity(vex.RPM) * 10)))),
+                                     int(round(motor.position(vex.DEGREES) * 100)),
+                                     min(int(motor.current() * 1000), 0xFFFF),
+                                     min(int(motor.temperature()), 255))
+        # Latencia de los puertos y, si hay baudios, del cable (10 bits por byte)
+        espera = (latencia_us + n * us_comando) / 1e6
+        if baudios:
+            espera += (TAM_TRAMA + len(cuerpo) + len(respuesta)) * 10 / baudios
+        while time.perf_counter() - llegada < espera:
+            pass
+        enlace.escribir(respuesta)
+        tramas += 1
+
+def _aplicar(motor, operacion: int, argumento: int, valor: float) -> None:
+    """Aplica un comando de la trama al vex.Motor simulado."""
+    direccion = vex.REVERSE if argumento & 1 else vex.FORWARD
+    if operacion == OP_SPIN:
+        unidades = UNIDADES[argumento >> 1]
+        if unidades is None:
+            motor.spin(direccion)
+        else:
+            motor.spin(direccion, valor, unidades)
+    elif operacion == OP_STOP:
+        motor.stop(FRENOS[argumento >> 1])
+    elif operacion == OP_VELOCIDAD:
+        motor.set_velocity(valor, UNIDADES[argumento >> 1])
+    elif operacion == OP_PAR:
+        motor.set_max_torque(valor, vex.PERCENT)
+    elif operacion == OP_FRENO:
+        motor.set_stopping(FRENOS[argumento >> 1])
+    elif operacion == OP_POSICION:
+        motor.set_position(valor, vex.DEGREES)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Programa en la PC contra un emulador de dispositivos por serial/pty.")
+    parser.add_argument("robot", help="grandes, pequenos o iq")
+    parser.add_argument("--segundos", type=float, default=20.0, help="tiempo virtual de la corrida")
+    parser.add_argument("--traza", default="demo", help="traza del controlador en el emulador")
+    parser.add_argument("--sin-cache", action="store_true", help="mandar cada llamada (sin suprimir repetidos)")
+    parser.add_argument("--latencia-us", type=int, default=LATENCIA_US, help="latencia fija por trama del emulador")
+    parser.add_argument("--us-comando", type=int, default=US_COMANDO, help="latencia por comando del emulador")
+    parser.add_argument("--baudios", type=int, default=0, help="velocidad del cable emulado (0 = sin límite)")
+    parser.add_argument("--puerto", help="puerto serial (pyserial) en vez de un pty con el emulador local")
+    parser.add_argument("--emulador", action="store_true", help="ser el emulador (con --puerto o --pty)")
+    parser.add_argument("--pty", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.emulador:
+        if args.puerto:
+            enlace = Enlace.de_serial(args.puerto, args.baudios or 115200)
+        else:
+            fd = os.open(args.pty, os.O_RDWR | os.O_NOCTTY)
+            enlace = Enlace.de_descriptor(fd)
+        emular(args.robot, enlace, args.traza, args.latencia_us, args.us_comando, args.baudios)
+        return
+
+    proceso = None
+    if args.puerto:
+        enlace = Enlace.de_serial(args.puerto, args.baudios or 115200)
+    else:
+        maestro, esclavo = os.openpty()
+        tty.setraw(esclavo)
+        proceso = subprocess.Popen([sys.executable, os.path.abspath(__file__), args.robot, "--emulador",
+                                    "--pty", os.ttyname(esclavo), "--traza", args.traza,
+                                    "--latencia-us", str(args.latencia_us), "--us-comando", str(args.us_comando),
+                                    "--baudios", str(args.baudios)])
+        enlace = Enlace.de_descriptor(maestro)
+    medidas = correr(args.robot, enlace, args.segundos, args.sin_cache)
+    if proceso is not None:
+        proceso.wait()
+        os.close(esclavo)
+        os.close(maestro)
+    for linea in reporte(medidas):
+        print(linea)
+
+if __name__ == "__main__":
+    main()
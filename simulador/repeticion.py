@@ -0,0 +1,169 @@
+# ================================================================
+# Simulador – Registro y repetición del controlador
+# ---------------------------------------------------------------
+# Descripción:
+#   Lee los registros binarios que graba ControlMuestreado
+#   (control.vxc) y los vuelve a inyectar, muestra por muestra, en
+#   la foto del controlador del robot simulado. Así las mismas
+#   entradas pasan por control_drive() y los actuadores, y la huella
+#   de los comandos de motor sirve como prueba de regresión.
+#
+#   Formato (little-endian):
+#       cabecera  "<4sBBHI": b"VXC1", plataforma (0 V5, 1 IQ),
+#                 nº ejes, bytes por muestra, periodo de muestreo (µs)
+#       muestras  "<IbbbbH": t (ms), 4 ejes, máscara de botones
+#
+# Uso:
+#   python simulador/repeticion.py grandes control.vxc
+#   python simulador/repeticion.py grandes --grabar demo.vxc --segundos 30
+#   python simulador/repeticion.py grandes control.vxc --csv traza.csv
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import argparse
+import csv
+import hashlib
+import struct
+
+import simulacion
+from nucleo.control import (ARCHIVO_CONTROL, BOTONES_IQ, BOTONES_V5, EJES_IQ, EJES_V5,
+                            FORMATO_CABECERA, FORMATO_MUESTRA, MAGIA_CONTROL)
+
+# Nombres de ejes y botones por código de plataforma (0 V5, 1 IQ)
+CONTROLES = {
+    0: (EJES_V5, BOTONES_V5),
+    1: (EJES_IQ, BOTONES_IQ),
+}
+NOMBRES_PLATAFORMA = {0: "V5", 1: "IQ"}
+
+class Registro:
+    """Registro del controlador ya decodificado."""
+
+    def __init__(self, plataforma: int, periodo_us: int, muestras: list):
+        self.plataforma = plataforma
+        self.periodo_us = periodo_us
+        self.muestras = muestras          # [(t_ms, e0, e1, e2, e3, botones), ...]
+        self.ejes, self.botones = CONTROLES[plataforma]
+
+    def __len__(self) -> int:
+        return len(self.muestras)
+
+def decodificar(datos: bytes) -> Registro:
+    """Decodifica el contenido de un archivo .vxc."""
+    magia, plataforma, n_ejes, tam, periodo_us = struct.unpack_from(FORMATO_CABECERA, datos)
+    if magia != MAGIA_CONTROL:
+        raise ValueError("no es un registro de controlador (magia %r)" % magia)
+    if plataforma not in CONTROLES:
+        raise ValueError("plataforma desconocida en el registro: %d" % plataforma)
+    if tam != struct.calcsize(FORMATO_MUESTRA) or n_ejes != 4:
+        raise ValueError("formato de muestra no soportado: %d ejes, %d bytes" % (n_ejes, tam))
+    cuerpo = memoryview(datos)[struct.calcsize(FORMATO_CABECERA):]
+    cuerpo = cuerpo[:len(cuerpo) - len(cuerpo) % tam]
+    return Registro(plataforma, periodo_us, list(struct.iter_unpack(FORMATO_MUESTRA, cuerpo)))
+
+def leer(ruta: str) -> Registro:
+    with open(ruta, "rb") as archivo:
+        return decodificar(archivo.read())
+
+class Reproductor:
+    """
+    Fuente para ControlMuestreado: cada llamada copia la siguiente
+    muestra del registro en la foto. Al acabarse, centra todo y marca
+    'terminado'.
+    """
+
+    def __init__(self, registro: Registro):
+        self.muestras = registro.muestras
+        self.indice = 0
+        self.terminado = not self.muestras
+
+    def __call__(self, foto) -> None:
+        if self.indice >= len(self.muestras):
+            self.terminado = True
+            ejes = foto.ejes
+            for i in range(len(ejes)):
+                ejes[i] = 0
+            foto.botones = 0
+            return
+        _, e0, e1, e2, e3, botones = self.muestras[self.indice]
+        self.indice += 1
+        ejes = foto.ejes
+        ejes[0], ejes[1], ejes[2], ejes[3] = e0, e1, e2, e3
+        foto.botones = botones
+
+def huella_motores(robot, huella) -> None:
+    """Agrega a 'huella' el último comando de cada motor del robot."""
+    huella.update(repr([motor.ultimo for motor in robot.motores]).encode())
+
+def reproducir(robot: str, registro: Registro) -> dict:
+    """
+    Arma el robot, le conecta el registro como fuente del controlador
+    (ValueError si el registro es de otra plataforma) y corre el planificador hasta consumir todas las muestras. Devuelve
+    el resumen de la simulación y una huella SHA-1 de los comandos de
+    motor vuelta por vuelta.
+    """
+    nombre = robot
+    robot = simulacion.cargar_robot(robot)
+    if registro.plataforma != robot.plataforma:
+        raise ValueError("el registro es de un controlador %s y el robot '%s' es %s"
+                         % (NOMBRES_PLATAFORMA[registro.plataforma],
+                            nombre, NOMBRES_PLATAFORMA[robot.plataforma]))
+    reproductor = Reproductor(registro)
+    robot.controller.fuente = reproductor
+    planificador = robot.planificador
+    huella = hashlib.sha1()
+    planificador.iniciar()
+    while not reproductor.terminado:
+        planificador.esperar(planificador.paso())
+        huella_motores(robot, huella)
+    resultado = simulacion.resumen(robot)
+    resultado["muestras"] = len(registro)
+    resultado["huella"] = huella.hexdigest()
+    return resultado
+
+def grabar(robot: str, segundos: float, traza) -> bytes:
+    """Corre el robot con una traza y devuelve el .vxc que grabó en la SD simulada."""
+    robot = simulacion.cargar_robot(robot)
+    robot.iniciar_grabacion()
+    simulacion.correr(robot, segundos, traza)
+    robot.terminar_grabacion()
+    return bytes(robot.brain.sdcard.loadfile(ARCHIVO_CONTROL))
+
+def a_csv(registro: Registro, ruta: str) -> None:
+    """Exporta el registro como traza CSV (t_ms + una columna por control)."""
+    with open(ruta, "w", newline="") as archivo:
+        escritor = csv.writer(archivo)
+        escritor.writerow(("t_ms",) + registro.ejes + registro.botones)
+        for t_ms, e0, e1, e2, e3, botones in registro.muestras:
+            bits = tuple((botones >> bit) & 1 for bit in range(len(registro.botones)))
+            escritor.writerow((t_ms, e0, e1, e2, e3) + bits)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Repite un registro del controlador en el simulador.")
+    parser.add_argument("robot", help="grandes, pequenos, iq o ruta a un perfil .py")
+    parser.add_argument("registro", nargs="?", help="archivo .vxc a repetir")
+    parser.add_argument("--grabar", metavar="VXC", help="grabar un registro nuevo con --traza")
+    parser.add_argument("--traza", default="demo", help="traza para --grabar (ver trazas.py)")
+    parser.add_argument("--segundos", type=float, default=105.0, help="duración de --grabar")
+    parser.add_argument("--csv", help="exportar el registro como traza CSV")
+    args = parser.parse_args()
+
+    if args.grabar:
+        import trazas
+        datos = grabar(args.robot, args.segundos, trazas.cargar_traza(args.traza))
+        with open(args.grabar, "wb") as archivo:
+            archivo.write(datos)
+        print("%s: %d bytes" % (args.grabar, len(datos)))
+        args.registro = args.registro or args.grabar
+    if not args.registro:
+        parser.error("falta el registro a repetir")
+
+    registro = leer(args.registro)
+    if args.csv:
+        a_csv(registro, args.csv)
+    for clave, valor in reproducir(args.robot, registro).items():
+        print("%-20s %s" % (clave, round(valor, 3) if isinstance(valor, float) else valor))
+
+if __name__ == "__main__":
+    main()
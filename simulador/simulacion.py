@@ -0,0 +1,255 @@
+# ================================================================
+# Simulador – Arnés para correr los programas sin cerebro
+# ---------------------------------------------------------------
+# Descripción:
+#   Arma el robot de un perfil (perfiles/) con el núcleo (nucleo/) y
+#   el módulo `vex` simulado, configura el chasis (mecanum o
+#   diferencial) y ejecuta su planificador en tiempo virtual. También
+#   puede correr el programa aplanado que se sube al cerebro y el
+#   autónomo (la tabla se genera del AUTONOMO del perfil, con ajustes).
+#   El programa aplanado se arma y compila una vez por robot, no por
+#   partida.
+#   Velocidad medida: ~180× tiempo real en V5 y ~390× en IQ (paquete y
+#   aplanado por igual). No llega a las ~1000× buscadas: la mayor parte
+#   se va en la física de cada motor y el planificador, vuelta a vuelta.
+#
+# Uso:
+#   python simulador/simulacion.py grandes --segundos 120 --partidas 100
+#   python simulador/simulacion.py grandes --construido
+#   python simulador/simulacion.py grandes --autonomo
+#   python simulador/simulacion.py grandes --hilos     # cada grupo de tareas en su Thread
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import argparse
+import importlib.util
+import math
+import os
+import sys
+import time
+
+AQUI = os.path.dirname(os.path.abspath(__file__))
+RAIZ = os.path.dirname(AQUI)
+for ruta in (AQUI, RAIZ):
+    if ruta not in sys.path:
+        sys.path.insert(0, ruta)
+
+import vex  # noqa: E402  (el `vex` simulado de esta carpeta)
+import nucleo  # noqa: E402
+
+sys.path.insert(0, os.path.join(RAIZ, "herramientas"))
+import trayectorias  # noqa: E402  (generador de tablas del autónomo)
+
+# ------------------------------------------------
+# Perfil de cada robot
+# ------------------------------------------------
+ROBOTS = {
+    "grandes":  "perfiles.grandes",
+    "pequenos": "perfiles.pequenos",
+    "iq":       "perfiles.iq",
+}
+
+# Montaje de las ruedas de cada robot (por NOMBRE del perfil): sentido
+# del eje del motor, sin la inversión del programa, que hace avanzar
+# cada rueda. Es el robot físico, aparte del perfil; sale del cableado
+# de los mover_adelante() originales (en Pequeños las traseras van al
+# revés que en Grandes).
+MONTAJE = {
+    "Grandes":  {"front_left": 1, "front_right": -1, "back_left": -1, "back_right": 1},
+    "Pequeños": {"front_left": 1, "front_right": -1, "back_left": 1, "back_right": -1},
+    "IQ":       {"front_left": 1, "front_right": -1, "back_left": 1, "back_right": -1},
+}
+
+_cargas = 0
+
+def cargar_perfil(robot: str) -> dict:
+    """Copia del PERFIL de un nombre de ROBOTS o de la ruta a un perfil .py."""
+    global _cargas
+    if robot in ROBOTS:
+        return dict(importlib.import_module(ROBOTS[robot]).PERFIL)
+    _cargas += 1
+    spec = importlib.util.spec_from_file_location("perfil_sim_%d" % _cargas, robot)
+    modulo = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(modulo)
+    return dict(modulo.PERFIL)
+
+def _preparar(robot):
+    """Batería IQ si todos los motores son IQ, y chasis del robot."""
+    if all(motor.modelo == "IQ" for motor in vex.sim.motores):
+        vex.sim.bateria = vex.Bateria.iq()
+    configurar_chasis(robot)
+    return robot
+
+def cargar_robot(robot: str, ajustes: dict = None):
+    """
+    Reinicia la simulación y arma el robot del perfil, con 'ajustes'
+    reemplazando claves del perfil (DEADZONE, RPM_RAMPA_AUTO...).
+    Devuelve el robot con su chasis configurado.
+    """
+    perfil = cargar_perfil(robot)
+    for clave, valor in (ajustes or {}).items():
+        if clave not in perfil:
+            raise KeyError("el perfil de %s no define %s" % (robot, clave))
+        perfil[clave] = valor
+    vex.sim.reiniciar()
+    trayectoria = trayectorias.generar(perfil) if "AUTONOMO" in perfil else None
+    return _preparar(nucleo.crear_robot(perfil, trayectoria))
+
+_construidos = {}   # Programa aplanado y compilado por robot (aplanar() cuesta más que una partida)
+
+def compilar_construido(robot: str):
+    """Código compilado del programa aplanado por herramientas/construir.py (una vez por robot)."""
+    if robot not in _construidos:
+        import construir
+        texto = construir.aplanar(os.path.join(construir.ROBOTS[robot], "driver_mode.py"))
+        _construidos[robot] = compile(texto, "<%s construido>" % robot, "exec")
+    return _construidos[robot]
+
+def cargar_construido(robot: str):
+    """
+    Reinicia la simulación y ejecuta el programa aplanado por
+    herramientas/construir.py (lo mismo que corre el cerebro).
+    Devuelve su robot.
+    """
+    codigo = compilar_construido(robot)
+    vex.sim.reiniciar()
+    espacio = {"__name__": "driver_mode_construido"}
+    exec(codigo, espacio)
+    return _preparar(espacio["robot"])
+
+def motor_simulado(motor):
+    """Devuelve el vex.Motor que hay debajo de un MotorCacheado (o el mismo)."""
+    while not isinstance(motor, vex.Motor):
+        motor = motor.__dict__["motor"]
+    return motor
+
+def configurar_chasis(robot) -> vex.Chasis:
+    """
+    Registra las ruedas del tren del robot: mecanum si tiene signos por
+    rueda (TrenMecanum), si no, diferencial con los lados izquierdo y derecho.
+    """
+    motores = {nombre: motor_simulado(getattr(robot, "motor_" + nombre)) for nombre in robot.nombres_motores}
+    return chasis_de_perfil(robot.perfil, motores)
+
+def chasis_de_perfil(perfil: dict, motores: dict) -> vex.Chasis:
+    """
+    Chasis a partir del perfil y {nombre: vex.Motor}: mecanum con
+    RUEDAS, o diferencial con LADO_IZQUIERDO / LADO_DERECHO. El
+    montaje de cada rueda sale de MONTAJE (el robot real), no del
+    perfil: una inversión o un SIGNO_RUEDAS mal puesto en el perfil
+    mueve el robot simulado mal, como al real.
+    """
+    if perfil["NOMBRE"] not in MONTAJE:
+        raise KeyError("falta el montaje de las ruedas de '%s' en MONTAJE" % perfil["NOMBRE"])
+    montaje = MONTAJE[perfil["NOMBRE"]]
+    if "RUEDAS" in perfil:
+        ruedas = [motores[nombre] for nombre in perfil["RUEDAS"]]
+        return vex.configurar_chasis("mecanum", ruedas, [montaje[nombre] for nombre in perfil["RUEDAS"]],
+                                     radio=perfil["RADIO_RUEDA"], semiancho=perfil["SEMIANCHO"],
+                                     semilargo=perfil["SEMILARGO"])
+    nombres = perfil["LADO_IZQUIERDO"] + perfil["LADO_DERECHO"]
+    return vex.configurar_chasis("diferencial", [motores[nombre] for nombre in nombres],
+                                 [montaje[nombre] for nombre in nombres],
+                                 radio=0.032, semiancho=0.09, masa=1.5)
+
+# ------------------------------------------------
+# Ejecución
+# ------------------------------------------------
+def correr(robot, segundos: float, entrada=None) -> dict:
+    """
+    Ejecuta el planificador del robot 'segundos' de tiempo virtual.
+    'entrada(t_us, controller)' se llama antes de cada vuelta para
+    mover joysticks y botones del controlador simulado. Con HILOS los
+    otros grupos corren en sus Thread mientras este hilo espera.
+    """
+    if robot.perfil["HILOS"] and not robot.hilos:
+        robot.iniciar_hilos()
+    planificador = robot.planificador
+    controller = vex.sim.controladores[0]
+    fin = vex.sim.tiempo_us + int(segundos * 1000000)
+    planificador.iniciar()
+    while vex.sim.tiempo_us < fin:
+        if entrada is not None:
+            entrada(vex.sim.tiempo_us, controller)
+        planificador.esperar(planificador.paso())
+    return resumen(robot)
+
+def correr_autonomo(robot) -> dict:
+    """Ejecuta el autónomo del robot hasta terminar la trayectoria."""
+    robot.ejecutar_autonomo()
+    return resumen(robot)
+
+def resumen(robot) -> dict:
+    """Métricas de la simulación al terminar una corrida."""
+    chasis = vex.sim.chasis
+    x, y, rumbo = chasis.pose() if chasis is not None else (0.0, 0.0, 0.0)
+    enviados, suprimidos = robot.contar_comandos()
+    metricas = {
+        "tiempo_s": vex.sim.tiempo_us / 1e6,
+        "x_m": x,
+        "y_m": y,
+        "rumbo_deg": rumbo,
+        "distancia_m": chasis.distancia if chasis is not None else 0.0,
+        "comandos_enviados": enviados,
+        "comandos_suprimidos": suprimidos,
+        "bateria_v": vex.sim.bateria.voltaje,
+        "bateria_pct": vex.sim.bateria.capacidad(),
+        "temp_max_c": max(m.temperatura for m in vex.sim.motores),
+        "corriente_pico_a": max(m.corriente_pico for m in vex.sim.motores),
+    }
+    if hasattr(robot, "contar_atascos"):
+        metricas["atascos"] = robot.contar_atascos()
+    odometria = getattr(robot, "odometria", None)
+    if odometria is not None:
+        # Error de la pose estimada respecto a la real del chasis
+        x_odo, y_odo, rumbo_odo = odometria.pose()
+        metricas["error_odometria_m"] = math.hypot(x_odo - x, y_odo - y)
+        metricas["error_rumbo_deg"] = abs((rumbo_odo - rumbo + 180.0) % 360.0 - 180.0)
+    return metricas
+
+def entrada_demo(t_us: int, controller) -> None:
+    """Entrada sintética: recorre avance, strafe y giro y pulsa los botones."""
+    t = t_us / 1e6
+    fase = int(t) % 8
+    avance = int(80 * math.sin(0.7 * t))
+    lateral = int(60 * math.sin(0.4 * t)) if fase >= 4 else 0
+    giro = 40 if fase == 7 else 0
+    controller.fijar(axis3=avance, axis4=lateral, axis1=giro, axis2=30 if fase == 2 else 0,
+                     axisA=avance, axisB=giro,
+                     buttonA=(t % 10) < 0.1, buttonB=(t % 15) < 0.1,
+                     buttonL1=fase == 1, buttonR2=fase == 3, buttonFDown=fase == 5)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Corre un robot en el simulador.")
+    parser.add_argument("robot", help="grandes, pequenos, iq o ruta a un perfil .py")
+    parser.add_argument("--segundos", type=float, default=105.0, help="duración de cada partida")
+    parser.add_argument("--partidas", type=int, default=1, help="número de partidas")
+    parser.add_argument("--construido", action="store_true",
+                        help="correr el programa aplanado (el del .v5python) en vez del paquete")
+    parser.add_argument("--autonomo", action="store_true", help="correr el autónomo en vez del teleoperado")
+    parser.add_argument("--hilos", action="store_true", help="cada grupo de GRUPOS_HILOS en su Thread")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    for _ in range(args.partidas):
+        if args.construido:
+            robot = cargar_construido(args.robot)
+            robot.perfil["HILOS"] = args.hilos
+        else:
+            robot = cargar_robot(args.robot, {"HILOS": True} if args.hilos else None)
+        if args.autonomo:
+            resultado = correr_autonomo(robot)
+        else:
+            resultado = correr(robot, args.segundos, entrada_demo)
+    real = time.perf_counter() - inicio
+    for clave, valor in resultado.items():
+        print("%-20s %s" % (clave, round(valor, 3) if isinstance(valor, float) else valor))
+    simulado = resultado["tiempo_s"] * args.partidas if args.autonomo else args.segundos * args.partidas
+    print("%-20s %.1fx (%.1f s simulados en %.2f s)" % ("tiempo_real", simulado / real, simulado, real))
+    for planificador in robot.planificadores:
+        for linea in planificador.reporte():
+            print(linea)
+
+if __name__ == "__main__":
+    main()
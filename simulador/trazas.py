@@ -0,0 +1,121 @@
+# ================================================================
+# Simulador – Trazas de joystick para las corridas
+# ---------------------------------------------------------------
+# Descripción:
+#   Una traza es un callable traza(t_us, controller) que fija ejes y
+#   botones del controlador simulado antes de cada vuelta.
+#
+#   • Sintéticas:
+#       - demo:          recorrido de avance, strafe, giro y botones.
+#       - escalones:     cada eje y botón, uno a la vez, en escalón.
+#       - aleatoria[:N]: caminata aleatoria reproducible (semilla N).
+#   • Grabadas:
+#       - archivo .csv con columna t_ms y una columna por control
+#         (axis3, buttonA, ...); cada fila vale hasta la siguiente.
+#       - registro .vxc del controlador (ver repeticion.py).
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import bisect
+import csv
+import random
+
+import repeticion
+from simulacion import entrada_demo
+
+# Ejes y botones que se mueven en las trazas sintéticas (V5 + IQ)
+EJES = ("axis1", "axis2", "axis3", "axis4", "axisA", "axisB")
+BOTONES = ("buttonL1", "buttonL2", "buttonR1", "buttonR2", "buttonLeft", "buttonRight",
+           "buttonA", "buttonB", "buttonFUp", "buttonFDown")
+
+def escalones(duracion_ms: int = 1500):
+    """Cada eje a +100 y -100, y cada botón presionado, uno por uno."""
+    pasos = [(eje, 100) for eje in EJES] + [(eje, -100) for eje in EJES] + [(b, True) for b in BOTONES]
+
+    def traza(t_us: int, controller) -> None:
+        indice = (t_us // 1000 // duracion_ms) % (len(pasos) + 1)
+        controller.soltar_todo()
+        if indice < len(pasos):
+            nombre, valor = pasos[indice]
+            getattr(controller, nombre).fijar(valor)
+    return traza
+
+def aleatoria(semilla: int = 0, cambio_ms: int = 200):
+    """Ejes que caminan al azar y botones que se pulsan de vez en cuando."""
+    rng = random.Random(semilla)
+    estado = {"siguiente_us": 0, "ejes": dict.fromkeys(EJES, 0)}
+
+    def traza(t_us: int, controller) -> None:
+        if t_us < estado["siguiente_us"]:
+            return
+        estado["siguiente_us"] = t_us + cambio_ms * 1000
+        ejes = estado["ejes"]
+        for nombre in EJES:
+            valor = max(-100, min(100, ejes[nombre] + rng.randint(-40, 40)))
+            if rng.random() < 0.2:
+                valor = 0
+            ejes[nombre] = valor
+            getattr(controller, nombre).fijar(valor)
+        for nombre in BOTONES:
+            getattr(controller, nombre).fijar(rng.random() < 0.08)
+    return traza
+
+class TrazaCSV:
+    """Traza grabada en CSV: t_ms + una columna por eje/botón."""
+
+    def __init__(self, ruta: str):
+        with open(ruta, newline="") as archivo:
+            filas = list(csv.DictReader(archivo))
+        self.tiempos_us = [int(float(fila.pop("t_ms")) * 1000) for fila in filas]
+        self.filas = [{nombre: self._valor(nombre, valor) for nombre, valor in fila.items()}
+                      for fila in filas]
+        self.actual = -1
+
+    @staticmethod
+    def _valor(nombre: str, texto: str):
+        if nombre.startswith("button"):
+            return texto.strip().lower() in ("1", "true", "si", "sí")
+        return int(float(texto))
+
+    def __call__(self, t_us: int, controller) -> None:
+        indice = bisect.bisect_right(self.tiempos_us, t_us) - 1
+        if indice == self.actual or indice < 0:
+            return
+        self.actual = indice
+        for nombre, valor in self.filas[indice].items():
+            getattr(controller, nombre).fijar(valor)
+
+class TrazaVXC:
+    """Traza desde un registro .vxc: la muestra i vale desde i·periodo."""
+
+    def __init__(self, ruta: str):
+        registro = repeticion.leer(ruta)
+        self.periodo_us = registro.periodo_us
+        self.muestras = registro.muestras
+        self.ejes = registro.ejes
+        self.botones = registro.botones
+
+    def __call__(self, t_us: int, controller) -> None:
+        indice = min(t_us // self.periodo_us, len(self.muestras) - 1)
+        muestra = self.muestras[indice]
+        for nombre, valor in zip(self.ejes, muestra[1:5]):
+            getattr(controller, nombre).fijar(valor)
+        botones = muestra[5]
+        for bit, nombre in enumerate(self.botones):
+            getattr(controller, nombre).fijar((botones >> bit) & 1)
+
+def cargar_traza(especificacion: str):
+    """'demo', 'escalones', 'aleatoria[:semilla]' o ruta a un .csv/.vxc."""
+    nombre, _, argumento = especificacion.partition(":")
+    if nombre == "demo":
+        return entrada_demo
+    if nombre == "escalones":
+        return escalones(int(argumento) if argumento else 1500)
+    if nombre == "aleatoria":
+        return aleatoria(int(argumento) if argumento else 0)
+    if especificacion.endswith(".csv"):
+        return TrazaCSV(especificacion)
+    if especificacion.endswith(".vxc"):
+        return TrazaVXC(especificacion)
+    raise ValueError("traza desconocida: %r" % especificacion)
@@ -0,0 +1,971 @@
+# ================================================================
+# Simulador – módulo `vex` para Linux (sin cerebro)
+# ---------------------------------------------------------------
+# Descripción:
+#   Reemplazo directo de `from vex import *` para correr los
+#   driver_mode.py en una PC, sin hardware y más rápido que el
+#   tiempo real.
+#
+#   • Reloj virtual:
+#       - wait() avanza el tiempo simulado sin dormir.
+#       - brain.timer lee ese mismo reloj.
+#   • Motores:
+#       - Modelo de motor DC por cartucho (RATIO_6_1 / 18_1 / 36_1)
+#         y motor IQ, con límite de corriente, controlador interno
+#         de velocidad, frenos COAST/BRAKE/HOLD y temperatura.
+#   • Chasis:
+#       - La pose (x, y, rumbo) se integra con la cinemática
+#         mecanum o diferencial de las ruedas configuradas.
+#       - escala_giro < 1 simula ruedas que patinan al girar.
+#   • Inertial:
+#       - Lee el rumbo del chasis, con deriva opcional del giroscopio.
+#   • Controlador:
+#       - Ejes y botones se fijan desde la simulación con fijar().
+#   • Competition:
+#       - Guarda los callbacks; la simulación elige cuál correr.
+#   • Thread:
+#       - Hilos reales de Python, pero cooperativos como en el cerebro:
+#         corre uno a la vez y wait() cede el turno al que despierte
+#         antes en el reloj virtual (a igualdad, al registrado primero),
+#         así una corrida con hilos es reproducible.
+#
+# Uso:
+#   Agrega esta carpeta al sys.path antes de importar el programa
+#   (simulacion.py ya lo hace) y controla la simulación con `sim`.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
+
+import math as _math
+import threading as _threading
+
+# ------------------------------------------------
+# Unidades y enumeraciones
+# ------------------------------------------------
+class _Valor:
+    """Constante con nombre (FORWARD, PERCENT, HOLD...)."""
+
+    def __init__(self, tipo: str, nombre: str):
+        self.tipo = tipo
+        self.nombre = nombre
+
+    def __repr__(self):
+        return "%s.%s" % (self.tipo, self.nombre)
+
+class DirectionType:
+    FORWARD = _Valor("DirectionType", "FORWARD")
+    REVERSE = _Valor("DirectionType", "REVERSE")
+
+class VelocityUnits:
+    PERCENT = _Valor("VelocityUnits", "PERCENT")
+    RPM     = _Valor("VelocityUnits", "RPM")
+    DPS     = _Valor("VelocityUnits", "DPS")
+
+class VoltageUnits:
+    VOLT = _Valor("VoltageUnits", "VOLT")
+    MV   = _Valor("VoltageUnits", "MV")
+
+class CurrentUnits:
+    AMP = _Valor("CurrentUnits", "AMP")
+
+class PowerUnits:
+    WATT = _Valor("PowerUnits", "WATT")
+
+class TorqueUnits:
+    NM    = _Valor("TorqueUnits", "NM")
+    INLB  = _Valor("TorqueUnits", "INLB")
+
+class TemperatureUnits:
+    CELSIUS    = _Valor("TemperatureUnits", "CELSIUS")
+    FAHRENHEIT = _Valor("TemperatureUnits", "FAHRENHEIT")
+
+class RotationUnits:
+    DEG = _Valor("RotationUnits", "DEG")
+    REV = _Valor("RotationUnits", "REV")
+    RAW = _Valor("RotationUnits", "RAW")
+
+class BrakeType:
+    COAST = _Valor("BrakeType", "COAST")
+    BRAKE = _Valor("BrakeType", "BRAKE")
+    HOLD  = _Valor("BrakeType", "HOLD")
+
+class TimeUnits:
+    SECONDS = _Valor("TimeUnits", "SECONDS")
+    MSEC    = _Valor("TimeUnits", "MSEC")
+
+class ControllerType:
+    PRIMARY = _Valor("ControllerType", "PRIMARY")
+    PARTNER = _Valor("ControllerType", "PARTNER")
+
+FORWARD = DirectionType.FORWARD
+REVERSE = DirectionType.REVERSE
+PERCENT = VelocityUnits.PERCENT
+RPM     = VelocityUnits.RPM
+DPS     = VelocityUnits.DPS
+VOLT    = VoltageUnits.VOLT
+MV      = VoltageUnits.MV
+AMP     = CurrentUnits.AMP
+WATT    = PowerUnits.WATT
+NM      = TorqueUnits.NM
+INLB    = TorqueUnits.INLB
+CELSIUS = TemperatureUnits.CELSIUS
+FAHRENHEIT = TemperatureUnits.FAHRENHEIT
+DEGREES = RotationUnits.DEG
+TURNS   = RotationUnits.REV
+COAST   = BrakeType.COAST
+BRAKE   = BrakeType.BRAKE
+HOLD    = BrakeType.HOLD
+SECONDS = TimeUnits.SECONDS
+MSEC    = TimeUnits.MSEC
+PRIMARY = ControllerType.PRIMARY
+PARTNER = ControllerType.PARTNER
+
+class Ports:
+    """Puertos inteligentes PORT1..PORT21 (se guardan como índice 0..20)."""
+
+for _i in range(1, 22):
+    setattr(Ports, "PORT%d" % _i, _i - 1)
+
+class GearSetting:
+    RATIO_36_1 = _Valor("GearSetting", "RATIO_36_1")
+    RATIO_18_1 = _Valor("GearSetting", "RATIO_18_1")
+    RATIO_6_1  = _Valor("GearSetting", "RATIO_6_1")
+
+# ------------------------------------------------
+# Parámetros de los motores
+#   (rpm libres a voltaje nominal, par de bloqueo N·m,
+#    corriente de bloqueo A, corriente libre A, voltaje nominal V)
+# ------------------------------------------------
+_RAD_POR_RPM = 2 * _math.pi / 60
+
+_MODELOS = {
+    "RATIO_36_1": (100.0, 2.1,   2.5, 0.1, 12.0),
+    "RATIO_18_1": (200.0, 1.05,  2.5, 0.1, 12.0),
+    "RATIO_6_1":  (600.0, 0.35,  2.5, 0.1, 12.0),
+    "IQ":         (120.0, 0.414, 1.2, 0.1, 7.2),
+}
+
+# Inercia en la salida de un motor sin carga (kg·m²)
+_INERCIA_BASE = {"RATIO_36_1": 4e-3, "RATIO_18_1": 1e-3, "RATIO_6_1": 1.1e-4, "IQ": 1e-3}
+
+# ------------------------------------------------
+# Batería
+# ------------------------------------------------
+class Bateria:
+    """Batería con voltaje en vacío decreciente y resistencia interna."""
+
+    def __init__(self, voltaje_lleno: float = 12.8, voltaje_vacio: float = 11.2,
+                 capacidad_mah: float = 1100.0, resistencia: float = 0.12):
+        self.voltaje_lleno = voltaje_lleno
+        self.voltaje_vacio = voltaje_vacio
+        self.capacidad_c = capacidad_mah * 3.6
+        self.resistencia = resistencia
+        self.carga_usada_c = 0.0
+        self.corriente = 0.0
+        self.voltaje = voltaje_lleno
+
+    def _integrar(self, dt: float, corriente: float) -> None:
+        self.corriente = corriente
+        self.carga_usada_c += corriente * dt
+        fraccion = 1.0 - self.carga_usada_c / self.capacidad_c
+        if fraccion < 0.0:
+            fraccion = 0.0
+        vacio = self.voltaje_vacio + (self.voltaje_lleno - self.voltaje_vacio) * fraccion
+        self.voltaje = vacio - self.resistencia * corriente
+
+    @classmethod
+    def iq(cls) -> "Bateria":
+        """Batería NiMH de VEX IQ."""
+        return cls(voltaje_lleno=8.2, voltaje_vacio=7.0, capacidad_mah=2000.0, resistencia=0.2)
+
+    def capacidad(self, *_) -> float:
+        """Porcentaje de carga restante."""
+        return max(0.0, 100.0 * (1.0 - self.carga_usada_c / self.capacidad_c))
+
+# ------------------------------------------------
+# Estado global de la simulación
+# ------------------------------------------------
+class Simulacion:
+    """
+    Reloj virtual y registro de dispositivos. Hay una sola instancia,
+    `sim`, que los programas no ven; la usan las herramientas de host.
+    """
+
+    def __init__(self):
+        self.paso_max_us = 10000   # Paso máximo de integración física
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        """Vuelve a t=0 y olvida todos los dispositivos y el chasis."""
+        self.tiempo_us = 0
+        self.motores = []
+        self.controladores = []
+        self.cerebros = []
+        self.chasis = None
+        self.competencia = None
+        self.bateria = Bateria()
+        for hilo in getattr(self, "hilos", ()):
+            # Los hilos de la corrida anterior terminan al recibir el turno
+            hilo.terminar = True
+            hilo.turno.set()
+        self.hilos = []            # Participantes del reparto (vacío = sin Threads)
+        self.actual = None         # Participante que tiene el turno
+        self.error_hilo = None     # Excepción de un Thread, se relanza en el hilo principal
+
+    def avanzar(self, us: int) -> None:
+        """Avanza el reloj virtual 'us' microsegundos integrando la física."""
+        while us > 0:
+            dt_us = us if us < self.paso_max_us else self.paso_max_us
+            dt = dt_us * 1e-6
+            voltaje = self.bateria.voltaje
+            corriente = 0.0
+            for motor in self.motores:
+                corriente += motor._integrar(dt, voltaje)
+            self.bateria._integrar(dt, corriente)
+            if self.chasis is not None:
+                self.chasis._integrar(dt)
+            self.tiempo_us += dt_us
+            us -= dt_us
+
+    def esperar(self, us: int) -> None:
+        """wait() de un programa: sin Threads avanza el reloj; con Threads cede el turno."""
+        if not self.hilos:
+            self.avanzar(us)
+            return
+        yo = self.actual
+        yo.despertar_us = self.tiempo_us + us
+        self._ceder(yo)
+        if self.error_hilo is not None and _threading.current_thread() is _threading.main_thread():
+            error = self.error_hilo
+            self.error_hilo = None
+            raise error
+
+    def _ceder(self, yo) -> None:
+        """Da el turno al participante que despierta antes, avanzando el reloj hasta entonces."""
+        siguiente = None
+        for hilo in self.hilos:
+            if siguiente is None or hilo.despertar_us < siguiente.despertar_us:
+                siguiente = hilo
+        if siguiente is None:
+            return
+        if siguiente.despertar_us > self.tiempo_us:
+            self.avanzar(siguiente.despertar_us - self.tiempo_us)
+        if siguiente is yo:
+            return
+        self.actual = siguiente
+        if yo is not None:
+            yo.turno.clear()
+        siguiente.turno.set()
+        if yo is not None:
+            yo.turno.wait()
+            if yo.terminar:
+                raise _FinHilo()
+
+sim = Simulacion()
+
+def wait(tiempo, unidades=MSEC) -> None:
+    """Avanza el reloj virtual (no duerme); con Threads cede el turno."""
+    if unidades is SECONDS:
+        sim.esperar(int(tiempo * 1000000))
+    else:
+        sim.esperar(int(tiempo * 1000))
+
+def sleep(tiempo, unidades=MSEC) -> None:
+    wait(tiempo, unidades)
+
+# ------------------------------------------------
+# Cerebro
+# ------------------------------------------------
+class _Timer:
+    def __init__(self):
+        self.origen_us = 0
+
+    def time(self, unidades=MSEC):
+        us = sim.tiempo_us - self.origen_us
+        return us / 1000000 if unidades is SECONDS else us / 1000
+
+    def value(self) -> float:
+        return self.time(SECONDS)
+
+    def clear(self) -> None:
+        self.origen_us = sim.tiempo_us
+
+    def reset(self) -> None:
+        self.clear()
+
+    def system(self) -> int:
+        return sim.tiempo_us // 1000
+
+    def system_high_res(self) -> int:
+        return sim.tiempo_us
+
+class Timer(_Timer):
+    """Temporizador independiente (igual que vex.Timer)."""
+
+    def __init__(self):
+        super().__init__()
+        self.origen_us = sim.tiempo_us
+
+class _Pantalla:
+    """Pantalla que guarda lo impreso (sin dibujar nada)."""
+
+    def __init__(self, filas: int, columnas: int):
+        self.filas = filas
+        self.columnas = columnas
+        # (Simulación) Registro de llamadas: ("print", fila, columna, texto) o ("clear_screen",)
+        self.llamadas = []
+        self.clear_screen()
+
+    def clear_screen(self, *_) -> None:
+        self.llamadas.append(("clear_screen",))
+        self.lineas = [""] * self.filas
+        self.fila = 0
+        self.columna = 0
+
+    def set_cursor(self, fila: int, columna: int) -> None:
+        self.fila = fila - 1
+        self.columna = columna - 1
+
+    def print(self, *valores, sep: str = "", precision: int = 2) -> None:
+        texto = sep.join(("%.*f" % (precision, v)) if isinstance(v, float) else str(v) for v in valores)
+        self.llamadas.append(("print", self.fila + 1, self.columna + 1, texto))
+        if 0 <= self.fila < self.filas:
+            linea = self.lineas[self.fila].ljust(self.columna)
+            self.lineas[self.fila] = linea[:self.columna] + texto + linea[self.columna + len(texto):]
+        self.columna += len(texto)
+
+    def next_row(self) -> None:
+        self.fila += 1
+        self.columna = 0
+
+    def clear_row(self, fila: int = None, *_) -> None:
+        fila = self.fila if fila is None else fila - 1
+        if 0 <= fila < self.filas:
+            self.lineas[fila] = ""
+
+    def row(self) -> int:
+        return self.fila + 1
+
+    def column(self) -> int:
+        return self.columna + 1
+
+    def set_font(self, *_) -> None:
+        pass
+
+    def set_pen_color(self, *_) -> None:
+        pass
+
+    def set_fill_color(self, *_) -> None:
+        pass
+
+    def draw_rectangle(self, *_) -> None:
+        pass
+
+    def render(self, *_) -> bool:
+        return True
+
+class _BateriaCerebro:
+    def voltage(self, unidades=VOLT) -> float:
+        v = sim.bateria.voltaje
+        return v * 1000 if unidades is MV else v
+
+    def current(self, *_) -> float:
+        return sim.bateria.corriente
+
+    def capacity(self, *_) -> float:
+        return sim.bateria.capacidad()
+
+class _TarjetaSD:
+    """Tarjeta SD en memoria: archivos como bytearray."""
+
+    def __init__(self):
+        self.archivos = {}
+
+    def is_inserted(self) -> bool:
+        return True
+
+    def savefile(self, nombre: str, datos=bytearray()) -> int:
+        self.archivos[nombre] = bytearray(datos)
+        return len(datos)
+
+    def appendfile(self, nombre: str, datos=bytearray()) -> int:
+        self.archivos.setdefault(nombre, bytearray()).extend(datos)
+        return len(datos)
+
+    def loadfile(self, nombre: str, *_) -> bytearray:
+        return bytearray(self.archivos.get(nombre, b""))
+
+    def exists(self, nombre: str) -> bool:
+        return nombre in self.archivos
+
+    def size(self, nombre: str) -> int:
+        return len(self.archivos.get(nombre, b""))
+
+class Brain:
+    """Cerebro V5/IQ simulado: pantalla, temporizador, batería y SD."""
+
+    def __init__(self):
+        self.screen = _Pantalla(12, 48)
+        self.timer = _Timer()
+        self.battery = _BateriaCerebro()
+        self.sdcard = _TarjetaSD()
+        sim.cerebros.append(self)
+
+    def program_stop(self) -> None:
+        raise SystemExit
+
+# ------------------------------------------------
+# Controlador
+# ------------------------------------------------
+class _Eje:
+    def __init__(self):
+        self.valor = 0
+
+    def position(self) -> int:
+        return self.valor
+
+    def value(self) -> int:
+        return self.valor
+
+    def fijar(self, valor: int) -> None:
+        """(Simulación) Fija la posición del eje en -100..100."""
+        self.valor = max(-100, min(100, int(valor)))
+
+class _Boton:
+    def __init__(self):
+        self.presionado = False
+
+    def pressing(self) -> bool:
+        return self.presionado
+
+    def fijar(self, presionado: bool) -> None:
+        """(Simulación) Presiona o suelta el botón."""
+        self.presionado = bool(presionado)
+
+class _PantallaControl(_Pantalla):
+    def __init__(self):
+        super().__init__(3, 19)
+
+class Controller:
+    """Control V5 (axis1-4, L1..A) e IQ (axisA-D, LUp..R3) en uno."""
+
+    EJES = ("axis1", "axis2", "axis3", "axis4", "axisA", "axisB", "axisC", "axisD")
+    BOTONES = ("buttonL1", "buttonL2", "buttonR1", "buttonR2",
+               "buttonUp", "buttonDown", "buttonLeft", "buttonRight",
+               "buttonX", "buttonB", "buttonY", "buttonA",
+               "buttonLUp", "buttonLDown", "buttonRUp", "buttonRDown",
+               "buttonEUp", "buttonEDown", "buttonFUp", "buttonFDown",
+               "buttonL3", "buttonR3")
+
+    def __init__(self, *_):
+        for nombre in self.EJES:
+            setattr(self, nombre, _Eje())
+        for nombre in self.BOTONES:
+            setattr(self, nombre, _Boton())
+        self.screen = _PantallaControl()
+        sim.controladores.append(self)
+
+    def fijar(self, **valores) -> None:
+        """(Simulación) fijar(axis3=50, buttonA=True, ...)."""
+        for nombre, valor in valores.items():
+            getattr(self, nombre).fijar(valor)
+
+    def soltar_todo(self) -> None:
+        """(Simulación) Centra los ejes y suelta todos los botones."""
+        for nombre in self.EJES:
+            getattr(self, nombre).valor = 0
+        for nombre in self.BOTONES:
+            getattr(self, nombre).presionado = False
+
+    def rumble(self, *_) -> None:
+        pass
+
+# ------------------------------------------------
+# Sensor inercial
+# ------------------------------------------------
+class Inertial:
+    """
+    Sensor inercial simulado: rotation()/heading() leen el rumbo real
+    del chasis (horario) más la deriva. La calibración es instantánea.
+    """
+
+    def __init__(self, puerto=None, *_):
+        self.puerto = puerto
+        self.deriva = 0.0    # (Simulación) grados por segundo de deriva del giroscopio
+        self.origen = 0.0    # Grados restados por set_rotation()/set_heading()
+
+    def _crudo(self) -> float:
+        rumbo = _math.degrees(sim.chasis.rumbo) if sim.chasis is not None else 0.0
+        return rumbo + self.deriva * sim.tiempo_us / 1e6
+
+    def calibrate(self) -> None:
+        pass
+
+    def is_calibrating(self) -> bool:
+        return False
+
+    def installed(self) -> bool:
+        return True
+
+    def rotation(self, unidades=DEGREES) -> float:
+        return self._crudo() - self.origen
+
+    def heading(self, unidades=DEGREES) -> float:
+        return self.rotation() % 360.0
+
+    def set_rotation(self, valor, unidades=DEGREES) -> None:
+        self.origen = self._crudo() - valor
+
+    def set_heading(self, valor, unidades=DEGREES) -> None:
+        self.set_rotation(valor)
+
+    def reset_rotation(self) -> None:
+        self.set_rotation(0.0)
+
+    def reset_heading(self) -> None:
+        self.set_rotation(0.0)
+
+# ------------------------------------------------
+# Hilos
+# ------------------------------------------------
+class _FinHilo(BaseException):
+    """Termina el hilo de Python de un Thread detenido o de una simulación reiniciada."""
+
+class _Participante:
+    """Un hilo del reparto cooperativo: cuándo despierta y su señal de turno."""
+
+    def __init__(self, nombre: str):
+        self.nombre = nombre
+        self.despertar_us = sim.tiempo_us
+        self.turno = _threading.Event()
+        self.terminar = False
+
+class Thread:
+    """
+    Thread del cerebro: corre 'callback(*args)' en un hilo de Python que
+    solo avanza cuando le toca el turno (ver Simulacion._ceder). Empieza
+    a correr la próxima vez que el hilo actual llame a wait().
+    """
+
+    def __init__(self, callback, args=()):
+        if sim.actual is None:
+            # El hilo que crea el primer Thread entra al reparto
+            sim.actual = _Participante("principal")
+            sim.hilos.append(sim.actual)
+        self.participante = _Participante(getattr(callback, "__name__", "hilo"))
+        sim.hilos.append(self.participante)
+        self._hilo = _threading.Thread(target=self._correr, args=(callback, tuple(args)), daemon=True)
+        self._hilo.start()
+
+    def _correr(self, callback, args) -> None:
+        participante = self.participante
+        participante.turno.wait()
+        if participante.terminar:
+            return
+        try:
+            callback(*args)
+        except _FinHilo:
+            return
+        except BaseException as error:
+            sim.error_hilo = error
+        if not participante.terminar:
+            # Terminó: sale del reparto y pasa el turno
+            sim.hilos.remove(participante)
+            sim._ceder(None)
+
+    def stop(self) -> None:
+        participante = self.participante
+        if participante in sim.hilos:
+            sim.hilos.remove(participante)
+        participante.terminar = True
+        participante.turno.set()
+
+    @staticmethod
+    def sleep_for(tiempo, unidades=MSEC) -> None:
+        wait(tiempo, unidades)
+
+class Competition:
+    """
+    Control de competencia. En el cerebro lanza driver/autonomous
+    según el campo; aquí solo los guarda y se consulta 'modo'
+    ("driver", "autonomous" o "disabled", fijado por la simulación).
+    """
+
+    def __init__(self, driver, autonomous):
+        self.driver = driver
+        self.autonomous = autonomous
+        self.modo = "driver"
+        sim.competencia = self
+
+    def is_enabled(self) -> bool:
+        return self.modo != "disabled"
+
+    def is_driver_control(self) -> bool:
+        return self.modo == "driver"
+
+    def is_autonomous(self) -> bool:
+        return self.modo == "autonomous"
+
+    def is_competition_switch(self) -> bool:
+        return False
+
+    def is_field_control(self) -> bool:
+        return False
+
+# ------------------------------------------------
+# Motor
+# ------------------------------------------------
+_MODO_LIBRE, _MODO_VELOCIDAD, _MODO_VOLTAJE, _MODO_POSICION = range(4)
+
+class Motor:
+    """
+    Motor inteligente simulado. Acepta Motor(puerto, engranaje, invertido)
+    (V5) y Motor(puerto, invertido) (IQ). El estado (omega, angulo,
+    objetivo, voltaje) se lleva en el marco del eje; como el firmware,
+    un motor invertido da vuelta comandos y lecturas ('sentido'), así
+    el programa ve FORWARD positivo y el chasis ve el giro real del eje.
+
+    Modelo: J·dω/dt = Kt·I − b·ω − τ_carga,  I = (V − Ke·ω)/R  limitada a
+    la corriente de bloqueo; el controlador interno de velocidad manda
+    V = Ke·ω_obj + Kv·(ω_obj − ω).
+    """
+
+    def __init__(self, puerto, *args):
+        engranaje = GearSetting.RATIO_18_1
+        invertido = False
+        for arg in args:
+            if isinstance(arg, bool):
+                invertido = arg
+            elif isinstance(arg, _Valor):
+                engranaje = arg
+        self.puerto = puerto
+        self.invertido = invertido
+        self.sentido = -1 if invertido else 1   # Eje por unidad de comando
+        es_iq = bool(args) and not any(isinstance(arg, _Valor) for arg in args)
+        self.modelo = "IQ" if es_iq else engranaje.nombre
+        rpm_libre, par_bloqueo, i_bloqueo, i_libre, v_nominal = _MODELOS[self.modelo]
+        self.rpm_max = rpm_libre
+        self.v_nominal = v_nominal
+        self.i_bloqueo = i_bloqueo
+        self.i_max = i_bloqueo           # Baja con set_max_torque()
+        self.r = v_nominal / i_bloqueo
+        self.ke = (v_nominal - i_libre * self.r) / (rpm_libre * _RAD_POR_RPM)
+        self.kt = par_bloqueo / i_bloqueo
+        self.b = self.kt * i_libre / (rpm_libre * _RAD_POR_RPM)
+        self.inercia = _INERCIA_BASE[self.modelo]
+        self.kv = 4.0 * self.ke          # Ganancia del controlador interno de velocidad
+        self.kp_pos = 8.0                # Ganancia del lazo de posición (HOLD/spin_to_position)
+        self._carga = 0.0                # Par resistente externo (N·m), p. ej. un atasco
+        self.reposo = False              # True: quieto, no se integra hasta el próximo comando
+        self.corriente_pico = 0.0
+        # Estado
+        self.omega = 0.0                 # rad/s en la salida
+        self.angulo = 0.0                # rad
+        self.corriente = 0.0
+        self.voltaje = 0.0
+        self.temperatura = 25.0
+        self.modo = _MODO_LIBRE
+        self.freno = COAST               # Freno por defecto de stop()
+        self.freno_activo = COAST        # Freno aplicado en el último stop()
+        self.limite_pos = 0.0            # Velocidad máxima en modo posición (rad/s)
+        self.objetivo = 0.0              # rad/s, V o rad según el modo
+        self.vel_fijada = (50.0, PERCENT)
+        self.comandos = 0                # Comandos recibidos (spin/stop/...)
+        sim.motores.append(self)
+
+    @property
+    def carga(self) -> float:
+        return self._carga
+
+    @carga.setter
+    def carga(self, par: float) -> None:
+        """(Simulación) Par resistente externo en N·m (atasco, fricción)."""
+        self._carga = par
+        self.reposo = False
+
+    # ---- conversión ----
+    def _a_rad_s(self, velocidad, unidades) -> float:
+        if unidades is PERCENT:
+            return velocidad / 100.0 * self.rpm_max * _RAD_POR_RPM
+        if unidades is DPS:
+            return _math.radians(velocidad)
+        return velocidad * _RAD_POR_RPM
+
+    def _desde_rad_s(self, omega, unidades) -> float:
+        if unidades is PERCENT:
+            return omega / _RAD_POR_RPM / self.rpm_max * 100.0
+        if unidades is DPS:
+            return _math.degrees(omega)
+        return omega / _RAD_POR_RPM
+
+    # ---- comandos ----
+    def spin(self, direccion, velocidad=None, unidades=RPM) -> None:
+        self.reposo = False
+        self.comandos += 1
+        signo = self.sentido if direccion is FORWARD else -self.sentido
+        if unidades is VOLT or unidades is MV:
+            v = velocidad / 1000.0 if unidades is MV else velocidad
+            self.modo = _MODO_VOLTAJE
+            self.objetivo = signo * v
+            return
+        if velocidad is None:
+            velocidad, unidades = self.vel_fijada
+        self.modo = _MODO_VELOCIDAD
+        self.objetivo = signo * self._a_rad_s(velocidad, unidades)
+
+    def spin_to_position(self, rotacion, unidades=DEGREES, velocidad=None, unidades_vel=RPM, wait=True) -> bool:
+        self.comandos += 1
+        self.reposo = False
+        self.modo = _MODO_POSICION
+        self.objetivo = self.sentido * (rotacion * 2 * _math.pi if unidades is TURNS else _math.radians(rotacion))
+        if velocidad is not None:
+            self.vel_fijada = (velocidad, unidades_vel)
+        self.limite_pos = abs(self._a_rad_s(*self.vel_fijada))
+        if wait:
+            while abs(self.angulo - self.objetivo) > 0.01:
+                sim.avanzar(sim.paso_max_us)
+        return True
+
+    def spin_for(self, direccion, rotacion, unidades=DEGREES, velocidad=None, unidades_vel=RPM, wait=True) -> bool:
+        delta = rotacion * 360 if unidades is TURNS else rotacion
+        if direccion is REVERSE:
+            delta = -delta
+        return self.spin_to_position(self.position(DEGREES) + delta, DEGREES, velocidad, unidades_vel, wait)
+
+    def stop(self, modo=None) -> None:
+        self.reposo = False
+        self.comandos += 1
+        modo = self.freno if modo is None else modo
+        if modo is HOLD:
+            self.modo = _MODO_POSICION
+            self.objetivo = self.angulo
+            self.limite_pos = self.rpm_max * _RAD_POR_RPM
+        else:
+            self.modo = _MODO_LIBRE
+        self.freno_activo = modo
+
+    def set_velocity(self, velocidad, unidades=RPM) -> None:
+        self.reposo = False
+        self.comandos += 1
+        self.vel_fijada = (velocidad, unidades)
+
+    def set_stopping(self, modo) -> None:
+        self.freno = modo
+
+    def set_max_torque(self, valor, unidades=PERCENT) -> None:
+        """Limita la corriente (par = Kt·I) a 'valor' % o N·m."""
+        if unidades is PERCENT:
+            self.i_max = self.i_bloqueo * max(0.0, min(100.0, valor)) / 100
+        else:
+            self.i_max = min(self.i_bloqueo, valor / self.kt)
+
+    def set_timeout(self, *_) -> None:
+        pass
+
+    def set_position(self, valor, unidades=DEGREES) -> None:
+        self.reposo = False
+        self.angulo = self.sentido * (valor * 2 * _math.pi if unidades is TURNS else _math.radians(valor))
+
+    def reset_position(self) -> None:
+        self.reposo = False
+        self.angulo = 0.0
+
+    # ---- lecturas ----
+    def velocity(self, unidades=PERCENT) -> float:
+        return self._desde_rad_s(self.sentido * self.omega, unidades)
+
+    def position(self, unidades=DEGREES) -> float:
+        angulo = self.sentido * self.angulo
+        return angulo / (2 * _math.pi) if unidades is TURNS else _math.degrees(angulo)
+
+    def current(self, *_) -> float:
+        return abs(self.corriente)
+
+    def voltage(self, unidades=VOLT) -> float:
+        voltaje = self.sentido * self.voltaje
+        return voltaje * 1000 if unidades is MV else voltaje
+
+    def power(self, *_) -> float:
+        return abs(self.voltaje * self.corriente)
+
+    def torque(self, *_) -> float:
+        return abs(self.kt * self.corriente)
+
+    def efficiency(self, *_) -> float:
+        entrada = abs(self.voltaje * self.corriente)
+        return 100.0 * abs(self.kt * self.corriente * self.omega) / entrada if entrada > 1e-6 else 0.0
+
+    def temperature(self, unidades=CELSIUS) -> float:
+        return self.temperatura * 9 / 5 + 32 if unidades is FAHRENHEIT else self.temperatura
+
+    def is_spinning(self) -> bool:
+        return abs(self.omega) > 0.05
+
+    def is_done(self) -> bool:
+        return self.modo != _MODO_POSICION or abs(self.angulo - self.objetivo) < 0.01
+
+    def installed(self) -> bool:
+        return True
+
+    # ---- física ----
+    def _integrar(self, dt: float, v_bateria: float) -> float:
+        """Avanza 'dt' segundos; devuelve la corriente tomada de la batería."""
+        if self.reposo:
+            return 0.0
+        w = self.omega
+        modo = self.modo
+        if modo == _MODO_LIBRE and self.freno_activo is not BRAKE:
+            # COAST: bobinas abiertas, solo fricción y carga frenan el eje
+            self.corriente = 0.0
+            self.voltaje = self.ke * w
+            if w != 0.0:
+                w1 = w * _math.exp(-self.b / self.inercia * dt)
+                w1 = self._aplicar_carga(w, w1, dt)
+                self.angulo += 0.5 * (w + w1) * dt
+                self.omega = w1 if abs(w1) > 1e-3 else 0.0
+            self._enfriar(dt, 0.0)
+            self.reposo = self.omega == 0.0 and self.carga == 0.0 and self.temperatura < 25.05
+            return 0.0
+
+        # Ley de voltaje afín en ω:  V = v0 − g·ω
+        if modo == _MODO_VELOCIDAD:
+            v0 = (self.ke + self.kv) * self.objetivo
+            g = self.kv
+        elif modo == _MODO_VOLTAJE:
+            v0 = self.objetivo
+            g = 0.0
+        elif modo == _MODO_POSICION:
+            deseada = self.kp_pos * (self.objetivo - self.angulo)
+            if deseada > self.limite_pos:
+                deseada = self.limite_pos
+            elif deseada < -self.limite_pos:
+                deseada = -self.limite_pos
+            v0 = (self.ke + self.kv) * deseada
+            g = self.kv
+        else:
+            v0 = 0.0    # BRAKE: bobinas en corto
+            g = 0.0
+
+        ke, kt, r, j = self.ke, self.kt, self.r, self.inercia
+        v = v0 - g * w
+        saturado = False
+        if v > v_bateria or v < -v_bateria:
+            v = _math.copysign(v_bateria, v)
+            saturado = True
+        corriente = (v - ke * w) / r
+        if corriente > self.i_max or corriente < -self.i_max:
+            corriente = _math.copysign(self.i_max, corriente)
+            w1 = w + (kt * corriente - self.b * w) / j * dt
+            saturado = True
+        elif saturado:
+            a = (kt * ke / r + self.b) / j
+            w_eq = kt * v / r / (j * a)
+            w1 = w_eq + (w - w_eq) * _math.exp(-a * dt)
+        else:
+            a = (kt * (g + ke) / r + self.b) / j
+            w_eq = kt * v0 / r / (j * a)
+            w1 = w_eq + (w - w_eq) * _math.exp(-a * dt)
+        if saturado:
+            # No pasarse del equilibrio del lazo sin saturar
+            w_lazo = kt * v0 / r / (kt * (g + ke) / r + self.b)
+            if (w - w_lazo) * (w1 - w_lazo) < 0.0:
+                w1 = w_lazo
+        w1 = self._aplicar_carga(w, w1, dt)
+        self.angulo += 0.5 * (w + w1) * dt
+        self.omega = w1
+        self.corriente = corriente
+        self.voltaje = v
+        if abs(corriente) > self.corriente_pico:
+            self.corriente_pico = abs(corriente)
+        self._enfriar(dt, corriente * corriente * r)
+        if v0 == 0.0 and abs(w1) < 1e-4 and self.carga == 0.0 and self.temperatura < 25.05:
+            # Quieto y sin nada que lo mueva: deja de integrarse hasta el próximo comando
+            self.omega = 0.0
+            self.corriente = 0.0
+            self.voltaje = 0.0
+            self.reposo = True
+        consumo = v * corriente / v_bateria if v_bateria > 0.0 else 0.0
+        return consumo if consumo > 0.0 else 0.0
+
+    def _aplicar_carga(self, w: float, w1: float, dt: float) -> float:
+        """Frena el eje con el par de carga externo sin invertir el giro."""
+        if self.carga == 0.0:
+            return w1
+        frenado = self.carga / self.inercia * dt
+        if w1 > frenado:
+            return w1 - frenado
+        if w1 < -frenado:
+            return w1 + frenado
+        return 0.0
+
+    def _enfriar(self, dt: float, potencia: float) -> None:
+        # Modelo térmico de primer orden: C·dT/dt = P − (T − T_amb)/R_th
+        r_th, c_th = 3.0, 40.0
+        t_eq = 25.0 + potencia * r_th
+        self.temperatura = t_eq + (self.temperatura - t_eq) * _math.exp(-dt / (r_th * c_th))
+
+# ------------------------------------------------
+# Chasis (cinemática directa para la pose)
+# ------------------------------------------------
+class Chasis:
+    """
+    Integra la pose del robot (x, y en metros, rumbo en grados horario,
+    0 = hacia +y) a partir de la velocidad de las ruedas.
+    - 'signos': sentido del eje del motor que hace avanzar cada rueda
+      (el montaje; la inversión del motor ya va en su 'omega').
+    """
+
+    def __init__(self, tipo: str, ruedas, signos, radio: float, semiancho: float, semilargo: float):
+        self.tipo = tipo
+        self.ruedas = tuple(ruedas)
+        self.signos = tuple(signos)
+        self.radio = radio
+        self.semiancho = semiancho
+        self.semilargo = semilargo
+        self.x = 0.0
+        self.y = 0.0
+        self.rumbo = 0.0             # radianes, horario
+        self.avance = 0.0            # m/s marco robot
+        self.lateral = 0.0
+        self.giro = 0.0              # rad/s horario
+        self.distancia = 0.0
+        self.escala_giro = 1.0       # (Simulación) fracción del giro de las ruedas que gira el robot
+
+    def _integrar(self, dt: float) -> None:
+        r = self.radio
+        v = [s * m.omega * r for s, m in zip(self.signos, self.ruedas)]
+        if self.tipo == "mecanum":
+            fl, fr, bl, br = v
+            self.avance = (fl + fr + bl + br) / 4
+            self.lateral = (fl - fr - bl + br) / 4
+            self.giro = (fl - fr + bl - br) / (4 * (self.semiancho + self.semilargo)) * self.escala_giro
+        else:
+            n = len(v) // 2
+            izquierda = sum(v[:n]) / n
+            derecha = sum(v[n:]) / n
+            self.avance = (izquierda + derecha) / 2
+            self.lateral = 0.0
+            self.giro = (izquierda - derecha) / (2 * self.semiancho)
+        rumbo = self.rumbo + 0.5 * self.giro * dt
+        seno, coseno = _math.sin(rumbo), _math.cos(rumbo)
+        self.x += (self.avance * seno + self.lateral * coseno) * dt
+        self.y += (self.avance * coseno - self.lateral * seno) * dt
+        self.rumbo += self.giro * dt
+        self.distancia += _math.hypot(self.avance, self.lateral) * dt
+
+    def pose(self) -> tuple:
+        """(x m, y m, rumbo en grados 0..360)."""
+        return self.x, self.y, _math.degrees(self.rumbo) % 360.0
+
+def configurar_chasis(tipo: str, ruedas, signos, radio: float = 0.0508,
+                      semiancho: float = 0.15, semilargo: float = 0.15, masa: float = 6.0) -> Chasis:
+    """
+    Registra el chasis de la simulación. 'ruedas' son los Motor simulados
+    en orden FL, FR, BL, BR (mecanum) o izquierdas + derechas
+    (diferencial). La masa del robot se reparte como inercia de carga.
+    """
+    ruedas = tuple(ruedas)
+    for motor in ruedas:
+        motor.inercia = _INERCIA_BASE[motor.modelo] + masa / len(ruedas) * radio * radio
+    sim.chasis = Chasis(tipo, ruedas, signos, radio, semiancho, semilargo)
+    return sim.chasis
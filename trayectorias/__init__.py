@@ -0,0 +1,10 @@
+# ================================================================
+# Trayectorias – Tablas del autónomo de cada robot
+# ---------------------------------------------------------------
+# Descripción:
+#   Cada módulo define TRAYECTORIA, la tabla de pasos que genera
+#   herramientas/trayectorias.py desde AUTONOMO del perfil (ver
+#   nucleo/autonomo.py). Se generan: no editarlos a mano.
+#
+# Autor: @deepdevjose - github.com/deepdevjose
+# ================================================================
@@ -0,0 +1,5 @@
+# Generado por herramientas/trayectorias.py desde perfiles/pequenos.py (AUTONOMO).
+# No editar aquí: los cambios se pierden al volver a generar.
+# 261 pasos a 50 Hz (5.22 s), 2610 bytes.
+
+TRAYECTORIA = b'\x00\x00\x00\x01\x00\x00\x00\x00\x00\x00\x02\x00\x00\x01\x00\x00\x01\x00\x00\x00\x04\x00\x00\x01\x00\x00\x01\x00\x00\x00\x06\x00\x00\x01\x00\x00\x02\x00\x00\x00\x08\x00\x00\x01\x00\x00\x03\x00\x00\x00\t\x00\x00\x01\x00\x00\x05\x00\x00\x00\x0b\x00\x00\x01\x00\x00\x07\x00\x00\x00\r\xff\x00\x01\x00\x00\n\x00\x00\x00\x0f\xff\x00\x01\x00\x00\r\x00\x00\x00\x11\xff\x00\x01\xff\xff\x10\x00\x00\x00\x13\xff\x00\x01\xff\xff\x14\x00\x00\x00\x15\xfe\x00\x01\xff\xff\x18\x00\x00\x00\x16\xfe\x00\x01\xfe\xff\x1d\x00\x00\x00\x18\xfe\x00\x01\xfe\xff"\x00\x00\x00\x1a\xfd\x00\x01\xfd\xff\'\x00\x00\x00\x1c\xfd\x00\x01\xfd\xff-\x00\x00\x00\x1e\xfd\x00\x01\xfc\xff3\x00\x00\x00 \xfc\x00\x01\xfb\xff:\x00\x00\x00"\xfc\x00\x01\xfa\xffA\x00\x00\x00#\xfb\x00\x01\xfa\xffH\x00\x00\x00%\xfb\x00\x01\xf8\xffP\x00\x00\x00\'\xfb\x00\x01\xf7\xffX\x00\x00\x00)\xfa\x00\x01\xf6\xff`\x00\x00\x00+\xfa\x00\x01\xf5\xffi\x00\x00\x00-\xfa\x00\x01\xf4\xffr\x00\x00\x00/\xf9\x00\x01\xf2\xff|\x00\x00\x000\xf9\x00\x01\xf1\xff\x86\x00\x00\x002\xf9\x00\x01\xef\xff\x91\x00\x00\x004\xf9\x00\x01\xee\xff\x9c\x00\x00\x006\xf9\x00\x01\xec\xff\xa7\x00\x00\x008\xf9\x00\x01\xeb\xff\xb3\x00\x00\x00:\xf9\x00\x01\xe9\xff\xbf\x00\x00\x00<\xf9\x00\x01\xe8\xff\xcb\x00\x00\x00>\xf9\x00\x01\xe6\xff\xd8\x00\x00\x00@\xf9\x00\x01\xe5\xff\xe5\x00\x00\x00A\xf9\x00\x01\xe3\xff\xf3\x00\x00\x00A\xfa\x00\x01\xe2\xff\x01\x01\x00\x00B\xfa\x00\x01\xe1\xff\x0f\x01\x00\x00B\xfb\x00\x01\xdf\xff\x1d\x01\x00\x00B\xfb\x00\x01\xde\xff+\x01\x00\x00B\xfc\x00\x01\xdd\xff9\x01\x00\x00B\xfd\x00\x01\xdd\xffG\x01\x00\x00B\xfd\x00\x01\xdc\xffU\x01\x00\x00B\xfe\x00\x01\xdb\xffc\x01\x00\x00B\xff\x00\x01\xdb\xffq\x01\x00\x00B\x00\x00\x01\xdb\xff\x7f\x01\x00\x00B\x01\x00\x01\xdb\xff\x8d\x01\x00\x00B\x02\x00\x01\xdb\xff\x9b\x01\x00\x00B\x03\x00\x01\xdc\xff\xa9\x01\x00\x00B\x04\x00\x01\xdd\xff\xb7\x01\x00\x00B\x05\x00\x01\xde\xff\xc5\x01\x00\x00A\x07\x00\x01\xdf\xff\xd3\x01\x00\x00A\x08\x00\x01\xe0\xff\xe1\x01\x00\x00A\n\x00\x01\xe2\xff\xef\x01\x00\x00A\x0b\x00\x01\xe5\xff\xfc\x01\x00\x00@\r\x00\x01\xe7\xff\n\x02\x00\x00@\x0f\x00\x01\xea\xff\x18\x02\x00\x00?\x11\x00\x01\xee\xff%\x02\x00\x00?\x14\x00\x01\xf2\xff3\x02\x00\x00>\x16\x00\x01\xf6\xff@\x02\x00\x00;\x18\x00\x01\xfb\xffM\x02\x00\x00:\x1a\x01\x01\x01\x00Y\x02\x00\x00;\x1c\x07\x01\x06\x00f\x02\x02\x00:\x1d\r\x01\r\x00r\x02\x06\x008\x1d\x11\x01\x13\x00~\x02\x0c\x007\x1d\x15\x01\x1a\x00\x8a\x02\x14\x006\x1c\x19\x01 \x00\x95\x02\x1d\x005\x1c\x1c\x01\'\x00\xa0\x02(\x004\x1b\x1e\x01-\x00\xab\x024\x003\x1a \x014\x00\xb5\x02@\x003\x19"\x01;\x00\xbf\x02N\x002\x18#\x01B\x00\xc9\x02\\\x002\x17$\x01H\x00\xd3\x02j\x001\x16&\x01O\x00\xdc\x02y\x001\x15&\x01V\x00\xe5\x02\x89\x001\x14\'\x01]\x00\xee\x02\x98\x001\x13(\x01c\x00\xf7\x02\xa8\x001\x11)\x01j\x00\x00\x03\xb9\x001\x10)\x01q\x00\t\x03\xc9\x001\x0f*\x01x\x00\x11\x03\xda\x001\x0e*\x01\x7f\x00\x1a\x03\xeb\x001\r*\x01\x86\x00"\x03\xfc\x001\x0c+\x01\x8c\x00*\x03\x0e\x011\x0b+\x01\x93\x002\x03\x1f\x011\n+\x01\x9a\x00:\x031\x011\x08,\x01\xa1\x00B\x03B\x011\x07,\x01\xa8\x00I\x03T\x011\x06,\x01\xb0\x00Q\x03f\x011\x05,\x01\xb7\x00Y\x03x\x011\x04,\x01\xbe\x00`\x03\x8a\x011\x03,\x01\xc5\x00h\x03\x9c\x011\x01,\x01\xcc\x00o\x03\xae\x011\x00,\x01\xd4\x00w\x03\xc0\x011\xff,\x01\xdb\x00~\x03\xd2\x011\xfe,\x01\xe2\x00\x85\x03\xe4\x011\xfd,\x01\xea\x00\x8c\x03\xf5\x011\xfb,\x01\xf1\x00\x93\x03\x07\x021\xfa,\x01\xf9\x00\x9b\x03\x19\x021\xf9,\x01\x01\x01\xa2\x03+\x021\xf8,\x01\x08\x01\xa9\x03=\x021\xf7+\x01\x10\x01\xb0\x03O\x021\xf6+\x01\x18\x01\xb7\x03`\x021\xf4+\x01 \x01\xbe\x03r\x021\xf3+\x01(\x01\xc5\x03\x83\x021\xf2*\x010\x01\xcb\x03\x94\x021\xf1*\x019\x01\xd2\x03\xa5\x021\xf0)\x01A\x01\xd9\x03\xb6\x021\xef)\x01J\x01\xe0\x03\xc7\x021\xee(\x01R\x01\xe7\x03\xd7\x021\xed\'\x01[\x01\xee\x03\xe7\x021\xeb\'\x01d\x01\xf4\x03\xf7\x022\xea&\x01m\x01\xfb\x03\x07\x032\xe9%\x01w\x01\x02\x04\x16\x032\xe8#\x01\x80\x01\t\x04$\x032\xe7"\x01\x8a\x01\x0f\x043\x033\xe6 \x01\x94\x01\x16\x04@\x034\xe5\x1f\x01\x9e\x01\x1d\x04M\x035\xe5\x1c\x01\xa9\x01#\x04Y\x036\xe4\x1a\x01\xb4\x01*\x04d\x037\xe3\x16\x01\xbf\x011\x04n\x038\xe3\x13\x01\xcb\x017\x04v\x039\xe3\x0e\x01\xd7\x01>\x04}\x03:\xe3\t\x01\xe3\x01D\x04\x81\x03<\xe4\x02\x01\xef\x01J\x04\x84\x03<\xe5\x00\x03\xfc\x01P\x04\x84\x03=\xe7\x00\x03\t\x02U\x04\x84\x03=\xe8\x00\x03\x16\x02Z\x04\x84\x03>\xe9\x00\x03#\x02`\x04\x84\x03>\xea\x00\x030\x02d\x04\x84\x03>\xea\x00\x03=\x02i\x04\x84\x03>\xeb\x00\x03K\x02n\x04\x84\x03?\xec\x00\x03X\x02r\x04\x84\x03?\xed\x00\x03e\x02v\x04\x84\x03?\xee\x00\x03s\x02z\x04\x84\x03@\xef\x00\x03\x80\x02~\x04\x84\x03@\xf0\x00\x03\x8e\x02\x81\x04\x84\x03@\xf1\x00\x03\x9b\x02\x84\x04\x84\x03@\xf1\x00\x03\xa9\x02\x88\x04\x84\x03@\xf2\x00\x03\xb7\x02\x8b\x04\x84\x03A\xf3\x00\x03\xc5\x02\x8d\x04\x84\x03A\xf4\x00\x03\xd2\x02\x90\x04\x84\x03A\xf5\x00\x03\xe0\x02\x92\x04\x84\x03A\xf6\x00\x03\xee\x02\x95\x04\x84\x03A\xf7\x00\x03\xfc\x02\x97\x04\x84\x03A\xf8\x00\x03\n\x03\x98\x04\x84\x03A\xf9\x00\x03\x18\x03\x9a\x04\x84\x03B\xfa\x00\x03%\x03\x9b\x04\x84\x03B\xfb\x00\x033\x03\x9d\x04\x84\x03B\xfd\x00\x03A\x03\x9d\x04\x84\x03B\xfe\x00\x03O\x03\x9e\x04\x84\x03B\xff\x00\x03]\x03\x9e\x04\x84\x03B\x01\x00\x03k\x03\x9e\x04\x84\x03B\x02\x00\x03y\x03\x9e\x04\x84\x03B\x04\x00\x03\x87\x03\x9d\x04\x84\x03B\x05\x00\x03\x95\x03\x9c\x04\x84\x03A\x08\x00\x03\xa3\x03\x9b\x04\x84\x03A\t\x00\x03\xb1\x03\x99\x04\x84\x03A\x0c\x00\x03\xbf\x03\x97\x04\x84\x03?\r\x00\x03\xcd\x03\x94\x04\x84\x03<\x10\x00\x03\xda\x03\x91\x04\x84\x03:\x12\x00\x03\xe6\x03\x8e\x04\x84\x037\x14\x00\x03\xf2\x03\x8a\x04\x84\x035\x15\x00\x03\xfe\x03\x85\x04\x84\x032\x17\x00\x03\t\x04\x80\x04\x84\x03/\x19\x00\x03\x13\x04{\x04\x84\x03,\x1a\x00\x03\x1d\x04v\x04\x84\x03)\x1b\x00\x03&\x04p\x04\x84\x03&\x1d\x00\x03.\x04j\x04\x84\x03#\x1e\x00\x036\x04d\x04\x84\x03\x1f\x1e\x00\x03=\x04^\x04\x84\x03\x1c\x1f\x00\x03C\x04W\x04\x84\x03\x19\x1f\x00\x03I\x04P\x04\x84\x03\x16\x1f\x02\x02N\x04J\x04\x84\x03\x15"\x05\x02R\x04C\x04\x85\x03\x13$\x08\x02V\x04;\x04\x88\x03\x12&\n\x02Z\x043\x04\x8b\x03\x11(\r\x02^\x04+\x04\x90\x03\x10*\x10\x02a\x04"\x04\x96\x03\x10+\x12\x02d\x04\x19\x04\x9d\x03\x0f-\x14\x02g\x04\x10\x04\xa5\x03\x0f.\x16\x02i\x04\x06\x04\xad\x03\x0f/\x18\x02l\x04\xfc\x03\xb7\x03\x0e0\x1a\x02n\x04\xf1\x03\xc1\x03\x0f2\x1c\x02p\x04\xe6\x03\xcc\x03\x0f3\x1e\x02q\x04\xdb\x03\xd8\x03\x0f4\x1f\x02s\x04\xd0\x03\xe4\x03\x105!\x02t\x04\xc5\x03\xf1\x03\x116"\x02u\x04\xb9\x03\xff\x03\x115#\x02v\x04\xad\x03\r\x04\x125#\x02w\x04\xa1\x03\x1b\x04\x124#\x02w\x04\x95\x03)\x04\x134$\x02x\x04\x89\x038\x04\x143$\x02x\x04~\x03F\x04\x143$\x02x\x04r\x03U\x04\x152%\x02x\x04f\x03d\x04\x162%\x02x\x04[\x03s\x04\x171%\x02x\x04O\x03\x82\x04\x181%\x02x\x04D\x03\x91\x04\x190%\x02x\x048\x03\xa0\x04\x1a0%\x02x\x04-\x03\xaf\x04\x1b/&\x02w\x04!\x03\xbe\x04\x1c.&\x02w\x04\x16\x03\xce\x04\x1c.&\x02v\x04\n\x03\xdd\x04\x1d-&\x02v\x04\xff\x02\xec\x04\x1e,&\x02u\x04\xf3\x02\xfc\x04\x1f,&\x02t\x04\xe8\x02\x0b\x05 +&\x02t\x04\xdc\x02\x1a\x05!*&\x02s\x04\xd1\x02*\x05")&\x02r\x04\xc5\x029\x05#)&\x02q\x04\xba\x02I\x05$(&\x02p\x04\xaf\x02X\x05%\'&\x02p\x04\xa3\x02g\x05&&&\x02o\x04\x98\x02w\x05\'%&\x02n\x04\x8c\x02\x86\x05($&\x02m\x04\x81\x02\x96\x05)#&\x02l\x04v\x02\xa5\x05*"&\x02j\x04j\x02\xb4\x05+!&\x02i\x04_\x02\xc3\x05+ %\x02h\x04S\x02\xd3\x05,\x1f%\x02g\x04H\x02\xe2\x05-\x1e%\x02f\x04<\x02\xf1\x05.\x1d%\x02e\x041\x02\x00\x06/\x1c%\x02d\x04%\x02\x0f\x060\x1b%\x02b\x04\x1a\x02\x1e\x060\x1a$\x02a\x04\x0e\x02-\x061\x19$\x02`\x04\x02\x02;\x060\x17#\x02_\x04\xf7\x01J\x06/\x15!\x02]\x04\xec\x01X\x06/\x13 \x02\\\x04\xe1\x01e\x06.\x12\x1f\x02[\x04\xd7\x01r\x06-\x10\x1d\x02Z\x04\xcc\x01~\x06,\x0f\x1c\x02Y\x04\xc2\x01\x8a\x06+\x0e\x1b\x02X\x04\xb9\x01\x95\x06*\x0c\x1a\x02W\x04\xaf\x01\x9f\x06)\x0b\x18\x02V\x04\xa6\x01\xaa\x06\'\n\x17\x02U\x04\x9e\x01\xb3\x06&\t\x16\x02T\x04\x95\x01\xbc\x06%\x08\x14\x02S\x04\x8d\x01\xc5\x06$\x07\x13\x02R\x04\x85\x01\xcd\x06"\x07\x12\x02Q\x04~\x01\xd4\x06!\x06\x10\x02Q\x04v\x01\xdb\x06 \x05\x0f\x02P\x04o\x01\xe1\x06\x1e\x04\x0e\x02P\x04i\x01\xe7\x06\x1d\x04\x0c\x02O\x04b\x01\xec\x06\x1b\x03\x0b\x02N\x04\\\x01\xf1\x06\x1a\x03\n\x02N\x04W\x01\xf5\x06\x18\x02\t\x02N\x04Q\x01\xf9\x06\x17\x02\x07\x02M\x04L\x01\xfc\x06\x15\x02\x06\x02M\x04H\x01\xff\x06\x14\x01\x05\x02M\x04C\x01\x01\x07\x12\x01\x04\x02M\x04?\x01\x03\x07\x10\x01\x03\x02L\x04;\x01\x05\x07\x0f\x01\x02\x02L\x048\x01\x06\x07\r\x00\x02\x02L\x045\x01\x07\x07\x0b\x00\x01\x02L\x043\x01\x07\x07\t\x00\x01\x02L\x041\x01\x08\x07\x07\x00\x00\x02L\x04/\x01\x08\x07\x05\x00\x00\x02L\x04.\x01\x08\x07\x03\x00\x00\x02L\x04-\x01\x08\x07\x02\x00\x00\x02L\x04-\x01\x08\x07\x00\x00\x00\x00L\x04,\x01\x08\x07'